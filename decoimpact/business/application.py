@@ -12,19 +12,36 @@ Classes:
 
 """
 
+import multiprocessing
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
+import xarray as _xr
+
+import decoimpact.business.utils.dataset_utils as _du
 from decoimpact.business.entities.i_model import ModelStatus as _ModelStatus
+from decoimpact.business.entities.rule_based_model_plan import RuleBasedModelPlan
+from decoimpact.business.entities.rule_result_cache import RuleResultCache
 from decoimpact.business.utils.version_utils import read_version_number
 from decoimpact.business.workflow.i_model_builder import IModelBuilder
 from decoimpact.business.workflow.model_runner import ModelRunner as _ModelRunner
 
 # only import interfaces to stay loosely coupled
 from decoimpact.crosscutting.i_logger import ILogger
+from decoimpact.data.api.i_combined_output_writer import ICombinedOutputWriter
 from decoimpact.data.api.i_data_access_layer import IDataAccessLayer
 from decoimpact.data.api.i_model_data import IModelData
 from decoimpact.data.api.output_file_settings import OutputFileSettings
 
+# creates the logger, data-access layer and model builder for a partition
+# that is processed in a separate process (using the partition name and the
+# directory for its log file)
+PartitionComponentsFactory = Callable[
+    [str, Path], Tuple[ILogger, IDataAccessLayer, IModelBuilder]
+]
+
 
 class Application:
     """Application for running command-line"""
@@ -40,6 +57,7 @@ class Application:
         logger: ILogger,
         da_layer: IDataAccessLayer,
         model_builder: IModelBuilder,
+        create_partition_components: Optional[PartitionComponentsFactory] = None,
     ):
         """Creates an application based on provided logger, data-access layer
         and model builder
@@ -49,16 +67,24 @@ class Application:
             da_layer (IDataAccessLayer): data-access layer for reading/writing
             model_builder (IModelBuilder): builder for creating a model based on
             IModelData
+            create_partition_components (Optional[PartitionComponentsFactory]):
+            (picklable) function creating the logger, data-access layer and
+            model builder for a partition processed in a separate process.
+            Partitions are only processed in parallel if this is provided.
         """
         self._logger = logger
         self._da_layer = da_layer
         self._model_builder = model_builder
+        self._create_partition_components = create_partition_components
 
-    def run(self, input_path: Path):
+    # pylint: disable=too-many-locals
+    def run(self, input_path: Path, run_settings: Optional[Dict[str, Any]] = None):
         """Runs application
 
         Args:
             input_path (Path): path to input file
+            run_settings (Optional[Dict[str, Any]]): run settings (from the
+                command line) that override the ones of the input file
         """
 
         try:
@@ -82,33 +108,242 @@ class Application:
             elif self.APPLICATION_VERSION_PARTS[1] < model_data.version[1]:
                 self._logger.log_warning(message)
 
+            if run_settings:
+                model_data.run_settings.update(run_settings)
+
+            self._prepare_result_storage(model_data)
+
             # build model
-            for dataset in model_data.datasets:
+            for dataset_index, dataset in enumerate(model_data.datasets):
                 input_files = self._da_layer.retrieve_file_names(dataset.path)
                 output_path_base = Path(model_data.output_path)
-                for key, file_name in input_files.items():
-                    dataset.path = file_name
-                    output_path = self._generate_output_path(output_path_base, key)
+                partitions = [
+                    (key, file_name, self._generate_output_path(output_path_base, key))
+                    for key, file_name in input_files.items()
+                ]
+
+                combined_writer = None
+                if model_data.run_settings.combine_partitions and len(partitions) > 1:
+                    combined_writer = self._create_combined_writer(
+                        model_data, output_path_base, input_files
+                    )
+
+                if (
+                    len(partitions) > 1
+                    and model_data.run_settings.workers > 1
+                    and self._create_partition_components is not None
+                ):
+                    self._run_partitions_in_parallel(
+                        model_data, dataset_index, partitions, combined_writer
+                    )
+                    continue
 
+                for key, file_name, output_path in partitions:
+                    dataset.path = file_name
                     model_data.partition = key
-                    model = self._model_builder.build_model(model_data)
+                    self._run_partition(model_data, output_path, combined_writer)
+
+        except Exception as exc:  # pylint: disable=broad-except
+            self._logger.log_error(f"Exiting application after error: {exc}")
+
+    def _run_partition(
+        self,
+        model_data: IModelData,
+        output_path: Path,
+        combined_writer: Optional[ICombinedOutputWriter] = None,
+        plan: Optional[RuleBasedModelPlan] = None,
+    ) -> _ModelStatus:
+        """Builds and runs the model for a partition and writes its output
+        (to the combined output file if a combined writer is given), using
+        the plan if given"""
+        model = self._model_builder.build_model(model_data, plan)
+
+        # run model
+        _ModelRunner.run_model(model, self._logger)
+
+        # write output file
+        if model.status == _ModelStatus.FINALIZED:
+            if combined_writer is not None:
+                combined_writer.write_partition(
+                    model_data.partition, model.output_dataset
+                )
+            else:
+                self._da_layer.write_output_file(
+                    model.output_dataset,
+                    output_path,
+                    self._create_output_file_settings(model_data),
+                )
+
+        return model.status
+
+    def _prepare_result_storage(self, model_data: IModelData):
+        run_settings = model_data.run_settings
+        if run_settings.resume and run_settings.checkpoint_directory is None:
+            self._logger.log_warning(
+                "Can not resume without a checkpoint directory, executing all rules."
+            )
+
+        cache_directory = run_settings.cache_directory
+        if run_settings.clear_cache and cache_directory is not None:
+            self._logger.log_info(f"Clearing the cache in {cache_directory}")
+            RuleResultCache(Path(cache_directory), 0).clear()
+
+    def _create_combined_writer(
+        self,
+        model_data: IModelData,
+        output_path_base: Path,
+        input_files: Dict[str, Path],
+    ) -> ICombinedOutputWriter:
+        # the combined output file has no partition key in its name
+        output_path = str(output_path_base).replace("_*", "").replace("*", "")
+        return self._da_layer.create_combined_output_writer(
+            Path(output_path),
+            input_files,
+            self._create_output_file_settings(model_data),
+        )
+
+    def _create_output_file_settings(
+        self, model_data: IModelData
+    ) -> OutputFileSettings:
+        settings = OutputFileSettings(self.APPLICATION_NAME, self.APPLICATION_VERSION)
+        settings.variables_to_save = model_data.output_variables
+        return settings
+
+    def _run_partitions_in_parallel(
+        self,
+        model_data: IModelData,
+        dataset_index: int,
+        partitions: List[Tuple[str, str, Path]],
+        combined_writer: Optional[ICombinedOutputWriter] = None,
+    ):
+        """Processes the partitions (input files) of a dataset in separate
+        processes, each with its own logger (and log file) and output file,
+        and reports a summary per partition. When the output is combined,
+        the results of the partitions are sent back and written (one after
+        another) by this process."""
+        workers = model_data.run_settings.workers
+        self._logger.log_info(
+            f"Processing {len(partitions)} partitions using {workers} processes"
+        )
 
-                    # run model
-                    _ModelRunner.run_model(model, self._logger)
+        # the rules are created once and sent to the processes of the partitions
+        plan = self._model_builder.create_plan(model_data)
 
-                    # write output file
-                    if model.status == _ModelStatus.FINALIZED:
-                        settings = OutputFileSettings(
-                            self.APPLICATION_NAME, self.APPLICATION_VERSION
-                        )
-                        settings.variables_to_save = model_data.output_variables
+        # spawn (instead of fork) gives the same behavior on all platforms and
+        # does not copy the state (threads, open files) of this process
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            futures = [
+                executor.submit(
+                    Application._run_partition_in_process,
+                    self._create_partition_components,
+                    model_data,
+                    plan,
+                    dataset_index,
+                    key,
+                    file_name,
+                    output_path,
+                    combined_writer is not None,
+                )
+                for key, file_name, output_path in partitions
+            ]
 
-                        self._da_layer.write_output_file(
-                            model.output_dataset, output_path, settings
-                        )
+            failed_partitions = 0
+            for (key, _, output_path), future in zip(partitions, futures):
+                if not self._handle_partition_result(
+                    key, future, combined_writer or output_path
+                ):
+                    failed_partitions += 1
 
+        self._logger.log_info(
+            f"Processed {len(partitions)} partitions, "
+            f"{len(partitions) - failed_partitions} succeeded and "
+            f"{failed_partitions} failed"
+        )
+
+    def _handle_partition_result(
+        self,
+        key: str,
+        future: Future,
+        output: Union[ICombinedOutputWriter, Path],
+    ) -> bool:
+        """Writes the results of a partition processed in a separate process
+        to the combined output (if used) and reports the result
+
+        Returns:
+            bool: if the partition was processed successfully
+        """
+        try:
+            status, duration, output_dataset = future.result()
+            if isinstance(output, ICombinedOutputWriter) and output_dataset is not None:
+                output.write_partition(key, output_dataset)
         except Exception as exc:  # pylint: disable=broad-except
-            self._logger.log_error(f"Exiting application after error: {exc}")
+            self._logger.log_error(f'Partition "{key}" failed: {exc}')
+            return False
+
+        if status != _ModelStatus.FINALIZED:
+            self._logger.log_error(
+                f'Partition "{key}" failed after {duration:.1f} s '
+                f"(status {str(status)})"
+            )
+            return False
+
+        output_text = output if isinstance(output, Path) else "combined"
+        self._logger.log_info(
+            f'Partition "{key}" finished in {duration:.1f} s (output: {output_text})'
+        )
+        return True
+
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-positional-arguments
+    # pylint: disable=too-many-locals
+    @staticmethod
+    def _run_partition_in_process(
+        create_partition_components: PartitionComponentsFactory,
+        model_data: IModelData,
+        plan: RuleBasedModelPlan,
+        dataset_index: int,
+        key: str,
+        file_name: str,
+        output_path: Path,
+        return_output: bool = False,
+    ) -> Tuple[_ModelStatus, float, Optional[_xr.Dataset]]:
+        """Processes a partition in a (separate) process, using the plan
+        (rules) created by the main process. The log file of the partition
+        is written next to its output file and closed when the partition is
+        finished, because the process can be reused for other partitions.
+
+        Returns:
+            Tuple[ModelStatus, float, Optional[Dataset]]: status of the model,
+                duration (s) and the output dataset (only if return_output is
+                set, instead of writing the output file)
+        """
+        start_time = time.perf_counter()
+        logger, da_layer, model_builder = create_partition_components(
+            key, output_path.parent
+        )
+        output_collector = None
+        if return_output:
+            output_collector = _OutputCollector(model_data.output_variables, logger)
+
+        try:
+            model_data.datasets[dataset_index].path = file_name
+            model_data.partition = key
+
+            application = Application(logger, da_layer, model_builder)
+            # pylint: disable-next=protected-access
+            status = application._run_partition(
+                model_data, output_path, output_collector, plan
+            )
+        except Exception as exc:
+            logger.log_error(f"Exiting partition after error: {exc}")
+            raise
+        finally:
+            logger.close()
+
+        output_dataset = output_collector.dataset if output_collector else None
+        return status, time.perf_counter() - start_time, output_dataset
 
     def _generate_output_path(self, output_path_base, key):
         if "*" in output_path_base.stem:
@@ -122,3 +357,22 @@ class Application:
                 f"{output_path_base.stem}{partition_part}{output_path_base.suffix}",
             )
         return output_path
+
+
+class _OutputCollector(ICombinedOutputWriter):
+    """Keeps the output dataset of a partition (processed in a separate
+    process) so that it can be sent back and written by the main process"""
+
+    def __init__(self, variables_to_save: Optional[List[str]], logger: ILogger):
+        self._variables_to_save = variables_to_save
+        self._logger = logger
+        self.dataset: Optional[_xr.Dataset] = None
+
+    def write_partition(self, key: str, dataset: _xr.Dataset) -> None:
+        self._logger.log_info(f'Sending the results of partition "{key}" back')
+
+        if self._variables_to_save:
+            dataset = _du.reduce_dataset_for_writing(
+                dataset, self._variables_to_save, self._logger
+            )
+        self.dataset = dataset.load()
@@ -12,6 +12,9 @@ Classes:
 
 """
 
+import os
+from importlib.util import find_spec
+from pathlib import Path
 from typing import Dict, List, Optional
 
 import xarray as _xr
@@ -19,9 +22,13 @@ import xarray as _xr
 import decoimpact.business.utils.dataset_utils as _du
 import decoimpact.business.utils.list_utils as _lu
 from decoimpact.business.entities.i_model import IModel, ModelStatus
+from decoimpact.business.entities.rule_based_model_plan import RuleBasedModelPlan
+from decoimpact.business.entities.rule_checkpoint import RuleCheckpoint
 from decoimpact.business.entities.rule_processor import RuleProcessor
+from decoimpact.business.entities.rule_result_cache import RuleResultCache
 from decoimpact.business.entities.rules.i_rule import IRule
 from decoimpact.crosscutting.i_logger import ILogger
+from decoimpact.data.api.run_settings import RunSettings
 
 
 class RuleBasedModel(IModel):
@@ -37,6 +44,9 @@ class RuleBasedModel(IModel):
         mapping: Optional[dict[str, str]] = None,
         name: str = "Rule-Based model",
         partition: str = "",
+        run_settings: Optional[RunSettings] = None,
+        output_variables: Optional[List[str]] = None,
+        plan: Optional[RuleBasedModelPlan] = None,
     ) -> None:
 
         self._name = name
@@ -47,6 +57,9 @@ class RuleBasedModel(IModel):
         self._rule_processor: Optional[RuleProcessor]
         self._mappings = mapping
         self._partition = partition
+        self._run_settings = run_settings or RunSettings()
+        self._output_variables = output_variables
+        self._plan = plan or RuleBasedModelPlan(rules)
 
     @property
     def name(self) -> str:
@@ -101,12 +114,18 @@ class RuleBasedModel(IModel):
             logger.log_error("Model does not contain any rules.")
             valid = False
 
-        for rule in self._rules:
-            valid = rule.validate(logger) and valid
+        valid = self._plan.validate_rules(logger) and valid
 
         if self._mappings is not None:
             valid = self._validate_mappings(self._mappings, logger) and valid
 
+        if self._run_settings.time_window is not None and find_spec("dask") is None:
+            logger.log_error(
+                "Processing in time windows (time_window) requires dask, install "
+                "it with the dask extra (pip install decoimpact[dask])."
+            )
+            valid = False
+
         return valid
 
     def initialize(self, logger: ILogger) -> None:
@@ -119,7 +138,24 @@ class RuleBasedModel(IModel):
             self._input_datasets, self._make_output_variables_list(), self._mappings
         )
 
-        self._rule_processor = RuleProcessor(self._rules, self._output_dataset)
+        time_window = self._run_settings.time_window
+        if time_window is not None:
+            logger.log_info(f"Processing time in windows of {time_window} time steps")
+            self._output_dataset = _du.chunk_time_dimensions(
+                self._output_dataset, time_window
+            )
+
+        self._rule_processor = RuleProcessor(
+            self._rules,
+            self._output_dataset,
+            self._run_settings.execution_mode,
+            self._run_settings.max_workers,
+            self._output_variables,
+            self._plan.get_scheduler(self._get_dataset_variables()),
+            self._create_result_cache(),
+            self._get_input_identity(),
+            self._create_checkpoint(),
+        )
 
         if not self._rule_processor.initialize(logger):
             logger.log_error("Initialization failed.")
@@ -139,6 +175,62 @@ class RuleBasedModel(IModel):
         logger.log_debug("Finalize the rule processor.")
         self._rule_processor = None
 
+    def _create_result_cache(self) -> Optional[RuleResultCache]:
+        cache_directory = self._run_settings.cache_directory
+        if cache_directory is None or not self._run_settings.use_cache:
+            return None
+
+        return RuleResultCache(
+            Path(cache_directory), self._run_settings.cache_size * 1024**2
+        )
+
+    def _create_checkpoint(self) -> Optional[RuleCheckpoint]:
+        checkpoint_directory = self._run_settings.checkpoint_directory
+        if checkpoint_directory is None:
+            return None
+
+        # every partition has its own results
+        directory = Path(checkpoint_directory)
+        if self._partition:
+            directory = directory / self._partition
+
+        return RuleCheckpoint(directory, self._run_settings.resume)
+
+    def _get_input_identity(self) -> str:
+        """Gets a text identifying the input data of the model: the files
+        (path, size and modification time), the selected part of the data
+        and the mapping of the variables. Returns an empty string if the
+        input is not (completely) read from files."""
+
+        parts = []
+        for dataset in self._input_datasets:
+            source = dataset.encoding.get("source")
+            if source is None:
+                return ""
+
+            try:
+                stat = os.stat(source)
+            except OSError:
+                return ""
+
+            index_ranges = {
+                name: (str(index[0]), str(index[-1]))
+                for name, index in dataset.indexes.items()
+                if len(index) > 0
+            }
+            parts.append(
+                f"{os.path.abspath(source)}|{stat.st_size}|{stat.st_mtime_ns}|"
+                f"{sorted(dataset.sizes.items())}|{sorted(index_ranges.items())}"
+            )
+
+        parts.append(repr(sorted((self._mappings or {}).items())))
+        return "\n".join(parts)
+
+    def _get_dataset_variables(self) -> List[str]:
+        return _lu.flatten_list(
+            [_du.list_vars(self._output_dataset), _du.list_coords(self._output_dataset)]
+        )
+
     def _make_output_variables_list(self) -> list:
         """Make the list of variables to be contained in the output dataset.
         A list of variables needed is obtained from the dummy variable and
@@ -0,0 +1,81 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Module for RuleBasedModelPlan class
+
+Classes:
+    RuleBasedModelPlan
+
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+from decoimpact.business.entities.rule_scheduler import RuleScheduler
+from decoimpact.business.entities.rules.i_rule import IRule
+from decoimpact.crosscutting.i_logger import ILogger
+
+
+class RuleBasedModelPlan:
+    """Partition independent part of a rule-based model: the rules (with
+    their compiled formulas and lookup tables), their validation and their
+    scheduling. A plan is created once and can be bound to the input
+    dataset of every partition."""
+
+    def __init__(self, rules: List[IRule]) -> None:
+        """Creates a plan for the provided rules
+
+        Args:
+            rules (List[IRule]): rules of the model
+        """
+        self._rules = rules
+        self._rules_valid = False
+        self._schedulers: Dict[Tuple[str, ...], RuleScheduler] = {}
+
+    @property
+    def rules(self) -> List[IRule]:
+        """Rules of the model"""
+        return self._rules
+
+    def validate_rules(self, logger: ILogger) -> bool:
+        """Validates the rules of the plan. The rules only need to be
+        validated once, invalid rules are validated (and reported) again
+        on every call.
+
+        Args:
+            logger (ILogger): logger for reporting messages
+
+        Returns:
+            bool: if all rules are valid
+        """
+        if self._rules_valid:
+            return True
+
+        valid = True
+        for rule in self._rules:
+            valid = rule.validate(logger) and valid
+
+        self._rules_valid = valid
+        return valid
+
+    def get_scheduler(self, available_variables: Iterable[str]) -> RuleScheduler:
+        """Gets the scheduler of the rules for the available variables. The
+        scheduler is shared by all datasets that provide the same variables.
+
+        Args:
+            available_variables (Iterable[str]): names of the variables that
+                are available before any rule is processed
+
+        Returns:
+            RuleScheduler: scheduler for the rules
+        """
+        key = tuple(sorted(set(available_variables)))
+        scheduler = self._schedulers.get(key)
+        if scheduler is None:
+            scheduler = RuleScheduler(self._rules, key)
+            self._schedulers[key] = scheduler
+
+        return scheduler
@@ -0,0 +1,111 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Module for RuleCheckpoint class
+
+Classes:
+    RuleCheckpoint
+
+"""
+
+import os
+import re
+import uuid
+from pathlib import Path
+from typing import Optional
+
+import xarray as _xr
+
+from decoimpact.crosscutting.i_logger import ILogger
+
+_KEY_ATTRIBUTE = "decoimpact_rule_key"
+_RESULT_VARIABLE = "rule_result"
+
+
+class RuleCheckpoint:
+    """Stores the result of every completed rule of a run (one file per
+    rule), so that a run that was stopped can be resumed without executing
+    the rules that were already completed. A stored result is only used
+    when it was created with the same key (rule definition, rules it
+    depends on and input data)."""
+
+    def __init__(self, directory: Path, resume: bool):
+        """Creates a checkpoint storing its results in the provided directory
+
+        Args:
+            directory (Path): directory for storing the results
+            resume (bool): use the results stored by an earlier run
+        """
+        self._directory = Path(directory)
+        self._resume = resume
+
+    @property
+    def directory(self) -> Path:
+        """Directory in which the results are stored"""
+        return self._directory
+
+    @property
+    def resume(self) -> bool:
+        """Use the results stored by an earlier run"""
+        return self._resume
+
+    def load(self, rule_name: str, key: str) -> Optional[_xr.DataArray]:
+        """Loads the result of the rule stored by an earlier run
+
+        Args:
+            rule_name (str): name of the rule
+            key (str): key identifying the result of the rule
+
+        Returns:
+            Optional[_xr.DataArray]: stored result (None if not resuming,
+                                     not stored or stored with another key)
+        """
+        path = self._get_path(rule_name)
+        if not self._resume or not path.is_file():
+            return None
+
+        try:
+            dataset = _xr.load_dataset(path)
+        except (OSError, ValueError):
+            return None
+
+        if dataset.attrs.get(_KEY_ATTRIBUTE) != key:
+            return None
+
+        return dataset[_RESULT_VARIABLE]
+
+    def store(
+        self, rule_name: str, key: str, result: _xr.DataArray, logger: ILogger
+    ) -> None:
+        """Stores the result of the rule. Results that can not be stored
+        are skipped (reported as warning).
+
+        Args:
+            rule_name (str): name of the rule
+            key (str): key identifying the result of the rule
+            result (_xr.DataArray): result to store
+            logger (ILogger): logger for reporting messages
+        """
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+        dataset = result.to_dataset(name=_RESULT_VARIABLE)
+        dataset.attrs[_KEY_ATTRIBUTE] = key
+
+        # write to a temporary file first, so that a stopped run never
+        # leaves a partially written result
+        path = self._get_path(rule_name)
+        temporary_path = path.with_name(f"{path.stem}.{uuid.uuid4().hex}.tmp")
+        try:
+            dataset.to_netcdf(temporary_path)
+            os.replace(temporary_path, path)
+        except (OSError, TypeError, ValueError) as exc:
+            logger.log_warning(f"Could not store checkpoint of rule {rule_name}: {exc}")
+            temporary_path.unlink(missing_ok=True)
+
+    def _get_path(self, rule_name: str) -> Path:
+        file_name = re.sub(r"[^\w.-]", "_", rule_name)
+        return self._directory / f"{file_name}.nc"
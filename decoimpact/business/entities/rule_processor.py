@@ -12,13 +12,18 @@ Classes:
 
 """
 
-from typing import Dict, Iterable, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import numpy as _np
 import xarray as _xr
 
 import decoimpact.business.utils.dataset_utils as _du
 import decoimpact.business.utils.list_utils as _lu
+from decoimpact.business.entities.rule_checkpoint import RuleCheckpoint
+from decoimpact.business.entities.rule_result_cache import RuleResultCache
+from decoimpact.business.entities.rule_scheduler import RuleScheduler
 from decoimpact.business.entities.rules.i_array_based_rule import IArrayBasedRule
 from decoimpact.business.entities.rules.i_cell_based_rule import ICellBasedRule
 from decoimpact.business.entities.rules.i_multi_array_based_rule import (
@@ -28,20 +33,58 @@ from decoimpact.business.entities.rules.i_multi_cell_based_rule import (
     IMultiCellBasedRule,
 )
 from decoimpact.business.entities.rules.i_rule import IRule
+from decoimpact.business.entities.rules.i_vectorized_cell_based_rule import (
+    IVectorizedCellBasedRule,
+)
+from decoimpact.business.entities.rules.i_vectorized_multi_cell_based_rule import (
+    IVectorizedMultiCellBasedRule,
+)
+from decoimpact.business.entities.rules.rule_base import RuleBase
 from decoimpact.crosscutting.i_logger import ILogger
+from decoimpact.crosscutting.prefixed_logger import PrefixedLogger
+from decoimpact.data.api.execution_mode import ExecutionMode
 from decoimpact.data.dictionary_utils import get_dict_element
 
 
 class RuleProcessor:
     """Model class for processing models based on rules"""
 
-    def __init__(self, rules: List[IRule], dataset: _xr.Dataset) -> None:
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-positional-arguments
+    def __init__(
+        self,
+        rules: List[IRule],
+        dataset: _xr.Dataset,
+        execution_mode: ExecutionMode = ExecutionMode.SEQUENTIAL,
+        max_workers: Optional[int] = None,
+        variables_to_save: Optional[List[str]] = None,
+        scheduler: Optional[RuleScheduler] = None,
+        result_cache: Optional[RuleResultCache] = None,
+        input_identity: str = "",
+        checkpoint: Optional[RuleCheckpoint] = None,
+    ) -> None:
         """Creates instance of a rule processor using the provided
         rules and input datasets
 
         Args:
             rules (List[IRule]): rules to process
             input_dataset (_xr.Dataset): input dataset to use
+            execution_mode (ExecutionMode): way in which the rules of a
+                rule-set (that do not depend on each other) are executed
+            max_workers (Optional[int]): maximum number of threads used
+                for parallel execution (None for the executor default)
+            variables_to_save (Optional[List[str]]): variables that will be
+                saved, only the rules needed for these variables are executed
+                (None or empty for all rules)
+            scheduler (Optional[RuleScheduler]): (shared) scheduler of the
+                rules for the variables of the dataset (None to create one)
+            result_cache (Optional[RuleResultCache]): cache for reusing the
+                results of earlier runs (None for always executing the rules)
+            input_identity (str): identity of the input data (files) used
+                for identifying results in the cache and checkpoint (empty
+                for no caching and checkpointing)
+            checkpoint (Optional[RuleCheckpoint]): checkpoint for storing
+                the result of every completed rule (None for no checkpoints)
         """
         if len(rules) < 1:
             raise ValueError("No rules defined.")
@@ -52,6 +95,16 @@ class RuleProcessor:
         self._rules = rules
         self._input_dataset = dataset
         self._processing_list: List[List[IRule]] = []
+        self._scheduler: Optional[RuleScheduler] = scheduler
+        self._execution_mode = execution_mode
+        self._max_workers = max_workers
+        self._variables_to_save = variables_to_save or []
+        self._releasable_variables: List[List[str]] = []
+        self._result_cache = result_cache
+        self._input_identity = input_identity
+        self._checkpoint = checkpoint
+        self._cache_keys: Dict[int, str] = {}
+        self._initialized = False
 
     def initialize(self, logger: ILogger) -> bool:
         """Creates an ordered list of rule arrays, where every rule array
@@ -69,10 +122,26 @@ class RuleProcessor:
             [_du.list_vars(self._input_dataset), _du.list_coords(self._input_dataset)]
         )
 
-        tree, success = self._create_rule_sets(inputs, self._rules, [], logger)
+        if self._scheduler is None:
+            self._scheduler = RuleScheduler(self._rules, inputs)
+
+        success = self._scheduler.schedule(logger)
         if success:
-            self._processing_list = tree
+            self._processing_list = self._scheduler.rule_sets
+
+            if len(self._variables_to_save) > 0:
+                self._processing_list = self._remove_unneeded_rules(
+                    self._scheduler, logger
+                )
+                self._releasable_variables = self._get_releasable_variables(inputs)
 
+            stores_results = (
+                self._result_cache is not None or self._checkpoint is not None
+            )
+            if stores_results and self._input_identity:
+                self._cache_keys = self._create_cache_keys(inputs)
+
+        self._initialized = success
         return success
 
     def process_rules(
@@ -90,20 +159,22 @@ class RuleProcessor:
             RuntimeError: if initialization is not correctly done
         """
 
-        if len(self._processing_list) < 1:
+        if not self._initialized:
             message = "Processor is not properly initialized, please initialize."
             raise RuntimeError(message)
 
-        for rule_set in self._processing_list:
-            for rule in rule_set:
-                logger.log_info(f"Starting rule {rule.name}")
+        for index, rule_set in enumerate(self._processing_list):
+            rule_results = self._execute_rule_set(rule_set, output_dataset, logger)
 
-                rule_result = self._execute_rule(rule, output_dataset, logger)
+            # results are added in the order of the rule-set, also when the
+            # rules have been executed in parallel
+            for rule, rule_result in zip(rule_set, rule_results):
                 output_name = rule.output_variable_name
 
+                # use the data (not the values) to keep dask arrays lazy
                 output_dataset[output_name] = (
                     rule_result.dims,
-                    rule_result.values,
+                    rule_result.data,
                     rule_result.attrs,
                     rule_result.coords,
                 )
@@ -111,69 +182,203 @@ class RuleProcessor:
                     # the coord_key is overwritten in case we don't have the if
                     # statement below
                     if coord_key not in output_dataset.coords:
-                        output_dataset = output_dataset.assign_coords(
-                            {coord_key: rule_result[coord_key]}
-                        )
+                        output_dataset.coords[coord_key] = rule_result[coord_key]
+
+            if index < len(self._releasable_variables):
+                self._release_variables(
+                    output_dataset, self._releasable_variables[index], logger
+                )
         return output_dataset
 
-    def _create_rule_sets(
-        self,
-        inputs: List[str],
-        unprocessed_rules: List[IRule],
-        current_tree: List[List[IRule]],
-        logger: ILogger,
-    ) -> Tuple[List[List[IRule]], bool]:
-        """Creates an ordered list of rule-sets that can be processed in parallel.
+    def _get_releasable_variables(self, inputs: List[str]) -> List[List[str]]:
+        """Determines for every rule-set which intermediate rule results are
+        no longer needed after processing it (liveness of the variables).
+        Results that are saved or that replace an input variable are kept.
 
         Args:
-            inputs (List[str]): input names that are available to rules
-            unprocessed_rules (List[IRule]): rules that still need to be handled
-            current_tree (List[List[IRule]]): the current output list state
-            logger (ILogger): logger for logging messages
+            inputs (List[str]): names of the variables of the input dataset
 
         Returns:
-            Tuple[List[List[IRule]], bool]: Ordered list of rule-sets
+            List[List[str]]: variables to release after every rule-set
         """
-        solvable_rules = self._get_solvable_rules(inputs, unprocessed_rules)
+        last_use: Dict[str, int] = {}
+        for index, rule_set in enumerate(self._processing_list):
+            for rule in rule_set:
+                last_use[rule.output_variable_name] = index
+                for name in rule.input_variable_names:
+                    last_use[name] = index
 
-        if len(solvable_rules) == 0:
-            rules_list = [str(rule.name) for rule in unprocessed_rules]
-            rules_text = ", ".join(rules_list)
-            logger.log_warning(f"Some rules can not be resolved: {rules_text}")
-            return [], False
+        kept_variables = set(self._variables_to_save) | set(inputs)
+        releasable_variables: List[List[str]] = [[] for _ in self._processing_list]
 
-        for rule in solvable_rules:
-            unprocessed_rules.remove(rule)
-            inputs.append(rule.output_variable_name)
+        for rule_set in self._processing_list:
+            for rule in rule_set:
+                name = rule.output_variable_name
+                if (
+                    name not in kept_variables
+                    and name not in releasable_variables[last_use[name]]
+                ):
+                    releasable_variables[last_use[name]].append(name)
+
+        return releasable_variables
 
-        current_tree.append(solvable_rules)
+    def _release_variables(
+        self, output_dataset: _xr.Dataset, names: List[str], logger: ILogger
+    ):
+        """Removes the provided (intermediate) variables from the dataset, so
+        that their memory can be freed. The dataset is changed in place,
+        because the caller still refers to it."""
+        names = [name for name in names if name in output_dataset.data_vars]
+        if len(names) == 0:
+            return
+
+        logger.log_debug(f"Releasing intermediate variables: {', '.join(names)}")
+        for name in names:
+            del output_dataset[name]
+
+    def _remove_unneeded_rules(
+        self, scheduler: RuleScheduler, logger: ILogger
+    ) -> List[List[IRule]]:
+        """Removes the rules that are not (indirectly) needed to calculate
+        the variables to save from the processing list.
 
-        if len(unprocessed_rules) > 0:
-            return self._create_rule_sets(
-                inputs, unprocessed_rules, current_tree, logger
+        Returns:
+            List[List[IRule]]: Ordered list of rule-sets with the needed rules
+        """
+        required_rules = scheduler.get_required_rules(self._variables_to_save)
+        required_ids = {id(rule) for rule in required_rules}
+        skipped_rules = [rule for rule in self._rules if id(rule) not in required_ids]
+
+        if len(skipped_rules) > 0:
+            skipped_cost = scheduler.get_cost(skipped_rules)
+            total_cost = scheduler.get_cost(self._rules)
+            rules_text = ", ".join(str(rule.name) for rule in skipped_rules)
+            logger.log_info(
+                "Skipping rules that are not needed for the variables to save: "
+                f"{rules_text} (estimated {skipped_cost / total_cost:.0%} "
+                "of the work)"
             )
-        return current_tree, True
 
-    def _get_solvable_rules(
-        self, inputs: List[str], unprocessed_rules: List[IRule]
-    ) -> List[IRule]:
-        """Checks which rules can be resolved using the provided "inputs" list.
+        rule_sets = [
+            [rule for rule in rule_set if id(rule) in required_ids]
+            for rule_set in self._processing_list
+        ]
+        return [rule_set for rule_set in rule_sets if len(rule_set) > 0]
+
+    def _execute_rule_set(
+        self, rule_set: List[IRule], output_dataset: _xr.Dataset, logger: ILogger
+    ) -> Iterable[_xr.DataArray]:
+        """Executes the rules of a rule-set, in parallel if the execution mode
+        allows it. The rules in a rule-set do not depend on each other, so
+        they only read (previously calculated) variables of the dataset.
+
+        Returns:
+            Iterable[_xr.DataArray]: results in the order of the rule-set
+        """
+        if self._execution_mode == ExecutionMode.THREADS and len(rule_set) > 1:
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                # start the rules on the longest (critical) path first
+                futures = {
+                    id(rule): executor.submit(
+                        self._start_rule,
+                        rule,
+                        output_dataset,
+                        PrefixedLogger(logger, f"[{rule.name}] "),
+                    )
+                    for rule in self._get_scheduler().sort_by_critical_path(rule_set)
+                }
+                return [futures[id(rule)].result() for rule in rule_set]
+
+        return (self._start_rule(rule, output_dataset, logger) for rule in rule_set)
+
+    def _get_scheduler(self) -> RuleScheduler:
+        if self._scheduler is None:
+            raise RuntimeError("Processor is not initialized, please initialize.")
+        return self._scheduler
+
+    def _start_rule(
+        self, rule: IRule, output_dataset: _xr.Dataset, logger: ILogger
+    ) -> _xr.DataArray:
+        cache_key = self._cache_keys.get(id(rule))
+        if cache_key is None:
+            logger.log_info(f"Starting rule {rule.name}")
+            return self._execute_rule(rule, output_dataset, logger)
+
+        if self._checkpoint is not None:
+            checkpoint_result = self._checkpoint.load(rule.name, cache_key)
+            if checkpoint_result is not None:
+                logger.log_info(f"Resuming from checkpoint of rule {rule.name}")
+                return checkpoint_result
+
+        result = self._get_result(rule, cache_key, output_dataset, logger)
+
+        # lazy (time window) results would have to be calculated twice
+        if self._checkpoint is not None and result.chunks is None:
+            self._checkpoint.store(rule.name, cache_key, result, logger)
+        return result
+
+    def _get_result(
+        self,
+        rule: IRule,
+        cache_key: str,
+        output_dataset: _xr.Dataset,
+        logger: ILogger,
+    ) -> _xr.DataArray:
+        if self._result_cache is None:
+            logger.log_info(f"Starting rule {rule.name}")
+            return self._execute_rule(rule, output_dataset, logger)
+
+        cached_result = self._result_cache.load(cache_key)
+        if cached_result is not None:
+            logger.log_info(f"Using cached result for rule {rule.name}")
+            return cached_result
+
+        logger.log_info(f"Starting rule {rule.name}")
+        result = self._execute_rule(rule, output_dataset, logger)
+
+        # lazy (time window) results would have to be calculated twice
+        if result.chunks is None:
+            self._result_cache.store(cache_key, result, logger)
+        return result
+
+    def _create_cache_keys(self, inputs: List[str]) -> Dict[int, str]:
+        """Creates the keys identifying the results of the rules in the
+        cache (and checkpoint), based on the definition of the rule, the
+        keys of the rules producing its inputs and the identity of the input
+        data. Rules without a definition (and rules depending on them) get
+        no key.
 
         Args:
-            inputs (List[str]): available inputs to resolve rules with
-            unprocessed_rules (List[IRule]): rules that need need to be checked
+            inputs (List[str]): names of the variables of the input dataset
 
         Returns:
-            List[IRule]: list of rules that can be resolved with the provided inputs
+            Dict[int, str]: key per rule (id)
         """
-        solvable_rules: List[IRule] = []
+        producers: Dict[str, List[IRule]] = {}
+        for rule in self._rules:
+            producers.setdefault(rule.output_variable_name, []).append(rule)
 
-        for rule in unprocessed_rules:
-            names = rule.input_variable_names
-            if all(name in inputs for name in names):
-                solvable_rules.append(rule)
+        available_inputs = set(inputs)
+        cache_keys: Dict[int, str] = {}
 
-        return solvable_rules
+        # rule-sets are ordered, so producing rules get their key first
+        for rule_set in self._processing_list:
+            for rule in rule_set:
+                definition = rule.definition if isinstance(rule, RuleBase) else ""
+                parts = [definition]
+                for name in rule.input_variable_names:
+                    if name in available_inputs:
+                        parts.append(f"{self._input_identity}/{name}")
+                    else:
+                        parts.extend(
+                            cache_keys.get(id(producer), "")
+                            for producer in producers[name]
+                        )
+
+                if all(parts):
+                    cache_keys[id(rule)] = RuleResultCache.create_key(parts)
+
+        return cache_keys
 
     def _execute_rule(
         self, rule: IRule, output_dataset: _xr.Dataset, logger: ILogger
@@ -208,6 +413,11 @@ class RuleProcessor:
             self._set_output_attributes(rule, result, input_variable)
             return result
 
+        if isinstance(rule, IVectorizedCellBasedRule):
+            result = self._process_by_array(rule, input_variable, logger)
+            self._set_output_attributes(rule, result, input_variable)
+            return result
+
         if isinstance(rule, ICellBasedRule):
             result = self._process_by_cell(rule, input_variable, logger)
             self._set_output_attributes(rule, result, input_variable)
@@ -260,7 +470,52 @@ class RuleProcessor:
             warning_counter_total[0] += warning_counter[0]
             warning_counter_total[1] += warning_counter[1]
 
-        # show warnings values outside range (for some rules):
+        self._log_warning_counts(warning_counter_total, logger)
+
+        # use copy to get the same dimensions as the
+        # original input variable
+        return input_variable.copy(data=result_variable)
+
+    def _process_by_array(
+        self,
+        rule: IVectorizedCellBasedRule,
+        input_variable: _xr.DataArray,
+        logger: ILogger,
+    ) -> _xr.DataArray:
+        """Processes all values of the input_variable at once and creates a
+        new one from it (same result as processing it cell by cell)
+
+        Args:
+            rule (IVectorizedCellBasedRule): rule to process
+            input_variable (_xr.DataArray): input variable/data
+            logger (ILogger): logger for log messages
+
+        Returns:
+            _xr.DataArray: result of the rule for every cell
+        """
+        if input_variable.chunks is not None:
+            return self._process_chunks_by_array(rule, input_variable, logger)
+
+        result, warning_counter_total = rule.execute_array(input_variable, logger)
+
+        self._log_warning_counts(warning_counter_total, logger)
+
+        # the cell based processing writes the results in an array with the
+        # type of the input variable, so cast the result in the same way
+        result = result.astype(input_variable.dtype, copy=False)
+
+        # use copy to get the same dimensions and coordinates as the
+        # original input variable
+        return input_variable.copy(data=result.transpose(*input_variable.dims).data)
+
+    def _log_warning_counts(self, warning_counter_total: List[int], logger: ILogger):
+        """Shows warnings for values outside range (for some rules)
+
+        Args:
+            warning_counter_total (List[int]): number of values less than min
+                                               and greater than max
+            logger (ILogger): logger for log messages
+        """
         if warning_counter_total[0] > 0:
             logger.log_warning(
                 f"value less than min: {warning_counter_total[0]} occurence(s)"
@@ -270,10 +525,6 @@ class RuleProcessor:
                 f"value greater than max: {warning_counter_total[1]} occurence(s)"
             )
 
-        # use copy to get the same dimensions as the
-        # original input variable
-        return input_variable.copy(data=result_variable)
-
     def _process_by_multi_cell(
         self,
         rule: IMultiCellBasedRule,
@@ -301,27 +552,54 @@ class RuleProcessor:
         # Check the amount of dimensions of all variables
         len_dims = _np.array([len(vals.dims) for vals in value_arrays])
 
-        # Use the variable with the most dimensions. Broadcast all other
-        # variables to these dimensions
+        # Use the variable with the most dimensions. All other variables are
+        # read through a (read-only) broadcast view with these dimensions, so
+        # no full size copies are made of variables with fewer dimensions
         most_dims_bool = len_dims == max(len_dims)
-
         ref_var = value_arrays[_np.argmax(len_dims)]
-        for ind_vars, enough_dims in enumerate(most_dims_bool):
+
+        # Check if all variables with the most dimensions have the same dimensions
+        self._check_variable_dimensions(
+            [var for var, enough in zip(value_arrays, most_dims_bool) if enough], rule
+        )
+
+        for var_orig, enough_dims in zip(value_arrays, most_dims_bool):
             if not enough_dims:
-                var_orig = value_arrays[ind_vars]
-                value_arrays[ind_vars] = self._expand_dimensions_of_variable(
-                    var_orig, ref_var, logger
-                )
+                self._check_variable_dimensions([var_orig, ref_var], rule, True)
+                self._log_expanded_dimensions(var_orig, ref_var, logger)
 
-        # Check if all variables now have the same dimensions
-        self._check_variable_dimensions(value_arrays, rule)
+        # the values are combined by position, so the coordinates of the
+        # shared dimensions should be the same
+        self._check_variable_coordinates(value_arrays, ref_var, rule, logger)
 
-        result_variable = _np.zeros_like(ref_var.to_numpy())
+        execute_array = (
+            isinstance(rule, IVectorizedMultiCellBasedRule) and rule.can_execute_array
+        )
+        if execute_array and any(var.chunks is not None for var in value_arrays):
+            return self._process_lazily_by_array(rule, value_arrays, ref_var, logger)
+
+        array_values: Dict[str, _np.ndarray] = {
+            str(var_orig.name): self._broadcast_view_of_variable(var_orig, ref_var)
+            for var_orig in value_arrays
+        }
+
+        if execute_array:
+            result = rule.execute_array(array_values, logger)
+
+            # write the results in an array with the type of the reference
+            # variable (like the cell based processing below)
+            result_variable = _np.broadcast_to(result, ref_var.shape).astype(
+                ref_var.dtype
+            )
+            return ref_var.copy(data=result_variable)
+
+        result_variable = _np.zeros(ref_var.shape, dtype=ref_var.dtype)
         cell_values = {}
+        array_items = list(array_values.items())
 
-        for indices, _ in _np.ndenumerate(ref_var.to_numpy()):
-            for value in value_arrays:
-                cell_values[value.name] = value.data[indices]
+        for indices in _np.ndindex(ref_var.shape):
+            for name, values in array_items:
+                cell_values[name] = values[indices]
 
             result_variable[indices] = rule.execute(cell_values, logger)
 
@@ -329,6 +607,81 @@ class RuleProcessor:
         # original input variable
         return ref_var.copy(data=result_variable)
 
+    def _process_lazily_by_array(
+        self,
+        rule: IVectorizedMultiCellBasedRule,
+        value_arrays: List[_xr.DataArray],
+        ref_var: _xr.DataArray,
+        logger: ILogger,
+    ) -> _xr.DataArray:
+        """Processes (dask) chunked input variables chunk by chunk, so the
+        variables are not loaded into memory at once.
+
+        Returns:
+            _xr.DataArray: lazy result with the dimensions of ref_var
+        """
+        names = [str(var.name) for var in value_arrays]
+
+        def execute_chunk(*chunks: _np.ndarray) -> _np.ndarray:
+            shape = _np.broadcast_shapes(*(chunk.shape for chunk in chunks))
+            chunk_values = {
+                name: _np.broadcast_to(chunk, shape)
+                for name, chunk in zip(names, chunks)
+            }
+            result = rule.execute_array(chunk_values, logger)
+            return _np.broadcast_to(result, shape).astype(ref_var.dtype)
+
+        result = _xr.apply_ufunc(
+            execute_chunk,
+            *value_arrays,
+            dask="parallelized",
+            output_dtypes=[ref_var.dtype],
+        )
+        return ref_var.copy(data=result.transpose(*ref_var.dims).data)
+
+    def _process_chunks_by_array(
+        self,
+        rule: IVectorizedCellBasedRule,
+        input_variable: _xr.DataArray,
+        logger: ILogger,
+    ) -> _xr.DataArray:
+        """Processes a (dask) chunked input variable chunk by chunk. Every
+        chunk is computed once and gives both its result and its warning
+        counts. The counts of all chunks are summed and the totals are
+        reported once, when the last chunk has been computed.
+
+        Returns:
+            _xr.DataArray: lazy result with the dimensions of input_variable
+        """
+        data = input_variable.data
+        chunk_counts: Dict[Tuple[int, ...], List[int]] = {}
+        lock = Lock()
+
+        def add_chunk_counts(location: Tuple[int, ...], warning_counter: List[int]):
+            with lock:
+                if len(chunk_counts) == data.npartitions:
+                    # totals are already reported (chunk is recomputed)
+                    return
+
+                chunk_counts[location] = warning_counter
+                if len(chunk_counts) == data.npartitions:
+                    self._log_warning_counts(
+                        [sum(counts) for counts in zip(*chunk_counts.values())],
+                        logger,
+                    )
+
+        def execute_chunk(chunk: _np.ndarray, block_info=None) -> _np.ndarray:
+            result, warning_counter = rule.execute_array(_xr.DataArray(chunk), logger)
+            add_chunk_counts(block_info[None]["chunk-location"], warning_counter)
+            return result.values.astype(input_variable.dtype, copy=False)
+
+        result = data.map_blocks(
+            execute_chunk,
+            dtype=input_variable.dtype,
+            meta=_np.array((), dtype=input_variable.dtype),
+        )
+        return input_variable.copy(data=result)
+
     def _get_rule_input_variables(
         self, rule: IRule, output_dataset: _xr.Dataset
     ) -> Iterable[Tuple[str, _xr.DataArray]]:
@@ -352,15 +705,21 @@ class RuleProcessor:
         )
 
     def _check_variable_dimensions(
-        self, value_arrays: List[_xr.DataArray], rule: IMultiCellBasedRule
+        self,
+        value_arrays: List[_xr.DataArray],
+        rule: IMultiCellBasedRule,
+        allow_subset: bool = False,
     ):
         for val_index in range(len(value_arrays) - 1):
             var1 = value_arrays[val_index]
             var2 = value_arrays[val_index + 1]
             diff = set(var1.dims) ^ set(var2.dims)
+            if allow_subset:
+                diff = set(var1.dims) - set(var2.dims)
 
             # If the variables with the most dimensions have different dimensions,
-            # stop the calculation
+            # (or a variable with less dimensions has a dimension that the others
+            # do not have) stop the calculation
             if len(diff) != 0:
                 raise NotImplementedError(
                     f"Can not execute rule {rule.name} with variables with different \
@@ -368,11 +727,33 @@ class RuleProcessor:
                     different than {var2.name} with dimensions:{var2.dims}"
                 )
 
-    def _expand_dimensions_of_variable(
+    def _check_variable_coordinates(
+        self,
+        value_arrays: List[_xr.DataArray],
+        ref_var: _xr.DataArray,
+        rule: IMultiCellBasedRule,
+        logger: ILogger,
+    ):
+        for var in value_arrays:
+            for dim in var.dims:
+                same_size = var.sizes[dim] == ref_var.sizes[dim]
+                same_coordinates = not (
+                    dim in var.indexes and dim in ref_var.indexes
+                ) or var.indexes[dim].equals(ref_var.indexes[dim])
+
+                if not (same_size and same_coordinates):
+                    message = (
+                        f"Can not execute rule {rule.name} with variables with "
+                        f"different coordinates. Variable {var.name} has other "
+                        f"values for dimension {dim} than variable {ref_var.name}."
+                    )
+                    logger.log_error(message)
+                    raise ValueError(message)
+
+    def _log_expanded_dimensions(
         self, var_orig: _xr.DataArray, ref_var: _xr.DataArray, logger: ILogger
     ):
-        """Creates a new data-array with the values of the var_org expanded to
-        include all dimensions of the ref_var
+        """Lets the user know which variables will be broadcast to all dimensions
 
         Args:
             var_orig (_xr.DataArray): variable to expand with extra dimensions
@@ -380,7 +761,6 @@ class RuleProcessor:
                                      dimensions with
             logger (ILogger): logger for logging messages
         """
-        # Let the user know which variables will be broadcast to all dimensions
         dims_orig = var_orig.dims
         dims_result = ref_var.dims
         dims_diff = [str(x) for x in dims_result if x not in dims_orig]
@@ -390,8 +770,27 @@ class RuleProcessor:
             dimensions: {str_dims_broadcasted} """
         )
 
-        # perform the broadcast
-        var_broadcasted = _xr.broadcast(var_orig, ref_var)[0]
+    def _broadcast_view_of_variable(
+        self, var_orig: _xr.DataArray, ref_var: _xr.DataArray
+    ) -> _np.ndarray:
+        """Creates a read-only view on the values of the var_orig with the shape
+        (and dimension order) of the ref_var. Dimensions that var_orig does not
+        have are added with a stride of 0, so the values are not copied.
 
+        Args:
+            var_orig (_xr.DataArray): variable to expand with extra dimensions
+            ref_var (_xr.DataArray): reference variable to synchronize the
+                                     dimensions with
+
+        Returns:
+            _np.ndarray: values of var_orig with the shape of the ref_var
+        """
         # Make sure the dimensions are in the same order
-        return var_broadcasted.transpose(*ref_var.dims)
+        ordered_dims = [dim for dim in ref_var.dims if dim in var_orig.dims]
+        values = var_orig.transpose(*ordered_dims).to_numpy()
+
+        # add the missing dimensions with length 1 and broadcast them
+        expanded_shape = [
+            ref_var.sizes[dim] if dim in var_orig.dims else 1 for dim in ref_var.dims
+        ]
+        return _np.broadcast_to(values.reshape(expanded_shape), ref_var.shape)
@@ -0,0 +1,142 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Module for RuleResultCache class
+
+Classes:
+    RuleResultCache
+
+"""
+
+import hashlib
+import os
+import uuid
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+import xarray as _xr
+
+from decoimpact.business.utils.version_utils import read_version_number
+from decoimpact.crosscutting.i_logger import ILogger
+
+_CACHE_FILE_SUFFIX = ".nc"
+
+
+class RuleResultCache:
+    """On-disk store for the results of rules, so that results of rules that
+    did not change (and have the same inputs) can be reused by later runs.
+    Results are identified by a key (hash) of the rule definition, the keys
+    of the rules it depends on and the identity of the input data. The least
+    recently used results are removed when the store exceeds its size."""
+
+    def __init__(self, directory: Path, max_size: int):
+        """Creates a cache storing its results in the provided directory
+
+        Args:
+            directory (Path): directory for storing the results
+            max_size (int): maximum size of the stored results (in bytes)
+        """
+        self._directory = Path(directory)
+        self._max_size = max_size
+
+    @property
+    def directory(self) -> Path:
+        """Directory in which the results are stored"""
+        return self._directory
+
+    @staticmethod
+    def create_key(parts: Iterable[str]) -> str:
+        """Creates the key identifying a result, based on the provided parts
+        (and the version of the application, because rule implementations
+        can change between versions)
+
+        Args:
+            parts (Iterable[str]): texts identifying the result
+
+        Returns:
+            str: key (hash) for the result
+        """
+        key_hash = hashlib.sha256(read_version_number().encode("utf-8"))
+        for part in parts:
+            key_hash.update(b"\0" + part.encode("utf-8"))
+        return key_hash.hexdigest()
+
+    def load(self, key: str) -> Optional[_xr.DataArray]:
+        """Loads the result stored for the key (and marks it as recently used)
+
+        Args:
+            key (str): key of the result
+
+        Returns:
+            Optional[_xr.DataArray]: stored result (None if not available)
+        """
+        path = self._get_path(key)
+        try:
+            result = _xr.load_dataarray(path)
+            os.utime(path)
+        except (OSError, ValueError):
+            # not stored (or removed by another process in the meantime)
+            return None
+
+        return result
+
+    def store(self, key: str, result: _xr.DataArray, logger: ILogger) -> None:
+        """Stores the result for the key, removing the least recently used
+        results if the cache becomes too large. Results that can not be
+        stored are skipped (reported as debug message).
+
+        Args:
+            key (str): key of the result
+            result (_xr.DataArray): result to store
+            logger (ILogger): logger for reporting messages
+        """
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+        # write to a temporary file first, so that other processes never
+        # read a partially written result
+        path = self._get_path(key)
+        temporary_path = path.with_name(f"{key}.{uuid.uuid4().hex}.tmp")
+        try:
+            result.to_netcdf(temporary_path)
+            os.replace(temporary_path, path)
+        except (OSError, TypeError, ValueError) as exc:
+            logger.log_debug(f"Could not store result in cache: {exc}")
+            temporary_path.unlink(missing_ok=True)
+            return
+
+        self._remove_least_recently_used(logger)
+
+    def clear(self) -> None:
+        """Removes all stored results"""
+        for path in self._get_result_files():
+            path.unlink(missing_ok=True)
+
+    def _get_path(self, key: str) -> Path:
+        return self._directory / f"{key}{_CACHE_FILE_SUFFIX}"
+
+    def _get_result_files(self) -> List[Path]:
+        if not self._directory.is_dir():
+            return []
+        return list(self._directory.glob(f"*{_CACHE_FILE_SUFFIX}"))
+
+    def _remove_least_recently_used(self, logger: ILogger):
+        files = []
+        for path in self._get_result_files():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total_size <= self._max_size:
+                break
+
+            logger.log_debug(f"Removing least recently used result {path.name}")
+            path.unlink(missing_ok=True)
+            total_size -= size
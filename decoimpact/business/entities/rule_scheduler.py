@@ -0,0 +1,219 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Module for RuleScheduler class
+
+Classes:
+    RuleScheduler
+
+"""
+
+from typing import Dict, Iterable, List, Set
+
+from decoimpact.business.entities.rules.i_rule import IRule
+from decoimpact.business.entities.rules.rule_base import RuleBase
+from decoimpact.crosscutting.i_logger import ILogger
+
+
+class RuleScheduler:
+    """Determines the order in which rules can be processed, based on the
+    dependencies between the (input and output) variables of the rules"""
+
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self, rules: List[IRule], available_variables: Iterable[str]):
+        """Creates a scheduler for the provided rules
+
+        Args:
+            rules (List[IRule]): rules to schedule
+            available_variables (Iterable[str]): names of the variables that
+                are available before any rule is processed
+        """
+        self._rules = rules
+        self._rule_sets: List[List[IRule]] = []
+        self._critical_path_lengths: List[float] = [0.0] * len(rules)
+
+        # rules are referred to by their index in the rules list
+        self._dependencies: List[Set[int]] = [set() for _ in rules]
+        self._dependents: List[Set[int]] = [set() for _ in rules]
+        self._missing_inputs: List[List[str]] = [[] for _ in rules]
+        self._producers: Dict[str, List[int]] = {}
+        self._scheduled = False
+        self._create_dependency_graph(set(available_variables))
+
+    @property
+    def rule_sets(self) -> List[List[IRule]]:
+        """Ordered list of rule-sets, the rules of a rule-set only depend on
+        rules of earlier rule-sets (and can be processed simultaneously)"""
+        return self._rule_sets
+
+    def schedule(self, logger: ILogger) -> bool:
+        """Creates the ordered list of rule-sets (Kahn's algorithm), the level
+        of every rule is determined by its longest chain of dependencies.
+
+        Args:
+            logger (ILogger): logger for reporting messages
+
+        Returns:
+            bool: A boolean to indicate if all the rules can be processed.
+        """
+        # a successful schedule does not change anymore
+        if self._scheduled:
+            return True
+
+        unresolved_dependencies = [len(deps) for deps in self._dependencies]
+        current_level = [
+            index
+            for index, count in enumerate(unresolved_dependencies)
+            if count == 0 and not self._missing_inputs[index]
+        ]
+        levels: List[List[int]] = []
+
+        while current_level:
+            levels.append(current_level)
+            next_level = []
+            for index in current_level:
+                for dependent in self._dependents[index]:
+                    unresolved_dependencies[dependent] -= 1
+                    if (
+                        unresolved_dependencies[dependent] == 0
+                        and not self._missing_inputs[dependent]
+                    ):
+                        next_level.append(dependent)
+
+            # keep the order of the rules within a level
+            current_level = sorted(next_level)
+
+        scheduled = {index for level in levels for index in level}
+        if len(scheduled) < len(self._rules):
+            unresolved = [i for i in range(len(self._rules)) if i not in scheduled]
+            self._log_unresolved_rules(unresolved, logger)
+            self._rule_sets = []
+            return False
+
+        self._rule_sets = [[self._rules[index] for index in level] for level in levels]
+        self._calculate_critical_path_lengths(levels)
+        self._scheduled = True
+        return True
+
+    def sort_by_critical_path(self, rule_set: List[IRule]) -> List[IRule]:
+        """Sorts the rules so that the rules with the longest (most expensive)
+        chain of dependent rules come first. Starting these rules first
+        shortens the total runtime when rules are processed in parallel.
+
+        Args:
+            rule_set (List[IRule]): rules to sort
+
+        Returns:
+            List[IRule]: sorted rules (keeps the order for equal paths)
+        """
+        indices = {id(rule): index for index, rule in enumerate(self._rules)}
+        return sorted(
+            rule_set,
+            key=lambda rule: -self._critical_path_lengths[indices[id(rule)]],
+        )
+
+    def get_required_rules(self, variable_names: Iterable[str]) -> List[IRule]:
+        """Gets the rules that are (directly or indirectly) needed to
+        produce the provided variables.
+
+        Args:
+            variable_names (Iterable[str]): names of the required variables
+
+        Returns:
+            List[IRule]: required rules (in the order of the rules)
+        """
+        to_visit = [
+            index for name in variable_names for index in self._producers.get(name, [])
+        ]
+        required: Set[int] = set()
+
+        while to_visit:
+            index = to_visit.pop()
+            if index not in required:
+                required.add(index)
+                to_visit.extend(self._dependencies[index])
+
+        return [rule for index, rule in enumerate(self._rules) if index in required]
+
+    def get_cost(self, rules: Iterable[IRule]) -> float:
+        """Gets the (estimated) relative cost of executing the provided rules
+
+        Args:
+            rules (Iterable[IRule]): rules to get the cost for
+
+        Returns:
+            float: sum of the relative cost of the rules
+        """
+        return sum(self._get_cost(rule) for rule in rules)
+
+    def _create_dependency_graph(self, available_variables: Set[str]):
+        producers = self._producers
+        for index, rule in enumerate(self._rules):
+            producers.setdefault(rule.output_variable_name, []).append(index)
+
+        for index, rule in enumerate(self._rules):
+            for name in rule.input_variable_names:
+                if name in available_variables:
+                    continue
+
+                if name not in producers:
+                    self._missing_inputs[index].append(name)
+                    continue
+
+                for producer in producers[name]:
+                    self._dependencies[index].add(producer)
+                    self._dependents[producer].add(index)
+
+    def _calculate_critical_path_lengths(self, levels: List[List[int]]):
+        # the critical path of a rule is its own cost plus the most
+        # expensive path of the rules depending on it
+        for level in reversed(levels):
+            for index in level:
+                longest_dependent_path = max(
+                    (self._critical_path_lengths[d] for d in self._dependents[index]),
+                    default=0.0,
+                )
+                self._critical_path_lengths[index] = (
+                    self._get_cost(self._rules[index]) + longest_dependent_path
+                )
+
+    def _log_unresolved_rules(self, unresolved: List[int], logger: ILogger):
+        rules_text = ", ".join(str(self._rules[index].name) for index in unresolved)
+        logger.log_warning(f"Some rules can not be resolved: {rules_text}")
+
+        for index in unresolved:
+            if self._missing_inputs[index]:
+                missing_text = ", ".join(self._missing_inputs[index])
+                logger.log_warning(
+                    f"Rule {self._rules[index].name} is missing input "
+                    f"variable(s): {missing_text}"
+                )
+
+        cyclic = [index for index in unresolved if self._is_on_cycle(index)]
+        if cyclic:
+            cyclic_text = ", ".join(str(self._rules[index].name) for index in cyclic)
+            logger.log_warning(f"Rules with a circular dependency: {cyclic_text}")
+
+    def _is_on_cycle(self, start: int) -> bool:
+        visited: Set[int] = set()
+        to_visit = list(self._dependencies[start])
+
+        while to_visit:
+            index = to_visit.pop()
+            if index == start:
+                return True
+            if index not in visited:
+                visited.add(index)
+                to_visit.extend(self._dependencies[index])
+
+        return False
+
+    @staticmethod
+    def _get_cost(rule: IRule) -> float:
+        if isinstance(rule, RuleBase):
+            return rule.relative_cost
+        return 1.0
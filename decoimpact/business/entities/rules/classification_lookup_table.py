@@ -0,0 +1,187 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Module for ClassificationLookupTable class
+
+Classes:
+    ClassificationLookupTable
+"""
+
+from typing import Any, List, Optional, Sequence
+
+import numpy as _np
+
+from decoimpact.business.entities.rules.criteria_interval import CriteriaInterval
+
+# maximum number of interval combinations of a lookup table
+_MAX_LOOKUP_TABLE_SIZE = 1_000_000
+
+
+class ClassificationLookupTable:
+    """N-dimensional table with the output for every combination of the
+    criteria intervals of the columns of a criteria table. A value can only
+    be looked up if the intervals of its column do not overlap, so that
+    every value falls in at most one interval (a search in the sorted
+    interval bounds) and the output is found with a single gather."""
+
+    def __init__(
+        self,
+        columns: List[Optional["_ColumnIntervals"]],
+        outputs: _np.ndarray,
+    ):
+        self._columns = columns
+        self._outputs = outputs
+
+    @staticmethod
+    def create(
+        criteria_intervals: List[List[Optional[CriteriaInterval]]],
+        outputs: Sequence[Any],
+    ) -> Optional["ClassificationLookupTable"]:
+        """Creates a lookup table for the criteria of a criteria table
+
+        Args:
+            criteria_intervals (List[List[Optional[CriteriaInterval]]]):
+                criteria of every row, per column (None for not applicable)
+            outputs (Sequence[Any]): output of every row
+
+        Returns:
+            Optional[ClassificationLookupTable]: lookup table or None if the
+                criteria can not be looked up (overlapping criteria within a
+                column or too many combinations)
+        """
+        columns: List[Optional[_ColumnIntervals]] = []
+        for column_criteria in criteria_intervals:
+            if all(interval is None for interval in column_criteria):
+                # the column does not restrict any row
+                columns.append(None)
+                continue
+
+            if any(interval is None for interval in column_criteria):
+                # not applicable overlaps with all other criteria
+                return None
+
+            column = _ColumnIntervals.create(column_criteria)
+            if column is None:
+                return None
+            columns.append(column)
+
+        used_columns = [column for column in columns if column is not None]
+        shape = tuple(column.number_of_intervals for column in used_columns)
+        if len(shape) == 0 or _np.prod(shape) > _MAX_LOOKUP_TABLE_SIZE:
+            return None
+
+        # an extra (NaN) element per dimension for values outside all
+        # intervals (interval index -1)
+        table = _np.full(tuple(size + 1 for size in shape), _np.nan)
+
+        # the first matching row wins, so the rows are filled in reverse order
+        for row in reversed(range(len(outputs))):
+            index = tuple(
+                column.get_interval_index(criteria[row])
+                for column, criteria in zip(columns, criteria_intervals)
+                if column is not None
+            )
+            table[index] = outputs[row]
+
+        return ClassificationLookupTable(columns, table)
+
+    def classify(self, column_values: Sequence[_np.ndarray]) -> _np.ndarray:
+        """Looks up the output for the values of all columns
+
+        Args:
+            column_values (Sequence[ndarray]): (broadcast) values per column
+
+        Returns:
+            ndarray: output for every cell (NaN if no row matches)
+        """
+        index = tuple(
+            column.find_intervals(values)
+            for column, values in zip(self._columns, column_values)
+            if column is not None
+        )
+        return self._outputs[index]
+
+
+class _ColumnIntervals:
+    """Non overlapping criteria intervals of a column. The finite bounds of
+    all intervals split the values in pieces (alternating the open range
+    before a bound and the bound itself), every piece belongs to at most
+    one interval."""
+
+    def __init__(
+        self,
+        bounds: _np.ndarray,
+        piece_intervals: _np.ndarray,
+        intervals: List[CriteriaInterval],
+    ):
+        self._bounds = bounds
+        self._piece_intervals = piece_intervals
+        self._intervals = intervals
+
+    @property
+    def number_of_intervals(self) -> int:
+        """Number of (unique) intervals of the column"""
+        return len(self._intervals)
+
+    @staticmethod
+    def create(criteria: List[CriteriaInterval]) -> Optional["_ColumnIntervals"]:
+        """Creates the column intervals or None if the intervals overlap"""
+        intervals = list(dict.fromkeys(criteria))
+
+        finite_bounds = [
+            bound
+            for interval in intervals
+            for bound in [interval.lower, interval.upper]
+            if _np.isfinite(bound)
+        ]
+        bounds = _np.unique(finite_bounds)
+        piece_intervals = _np.full(2 * len(bounds) + 1, -1)
+
+        for interval_index, interval in enumerate(intervals):
+            first_piece, last_piece = _get_piece_range(interval, bounds)
+            pieces = piece_intervals[first_piece : last_piece + 1]
+            if _np.any(pieces != -1):
+                return None
+            pieces[:] = interval_index
+
+        return _ColumnIntervals(bounds, piece_intervals, intervals)
+
+    def get_interval_index(self, interval: CriteriaInterval) -> int:
+        """Index of the provided interval"""
+        return self._intervals.index(interval)
+
+    def find_intervals(self, values: _np.ndarray) -> _np.ndarray:
+        """Index of the interval of every value (-1 if none)"""
+        bound_indices = _np.searchsorted(self._bounds, values, side="left")
+
+        on_bound = _np.zeros(_np.shape(values), dtype=bool)
+        if len(self._bounds) > 0:
+            closest_bounds = self._bounds[
+                _np.minimum(bound_indices, len(self._bounds) - 1)
+            ]
+            on_bound = closest_bounds == values
+
+        interval_indices = self._piece_intervals[2 * bound_indices + on_bound]
+        return _np.where(_np.isnan(values), -1, interval_indices)
+
+
+def _get_piece_range(interval: CriteriaInterval, bounds: _np.ndarray):
+    """Gives the first and last piece covered by the interval (piece 2k is the
+    open range before bound k, piece 2k + 1 the bound itself)"""
+    if interval.lower == -_np.inf:
+        first_piece = 0
+    else:
+        lower_index = int(_np.searchsorted(bounds, interval.lower))
+        first_piece = 2 * lower_index + (1 if interval.lower_inclusive else 2)
+
+    if interval.upper == _np.inf:
+        last_piece = 2 * len(bounds)
+    else:
+        upper_index = int(_np.searchsorted(bounds, interval.upper))
+        last_piece = 2 * upper_index + (1 if interval.upper_inclusive else 0)
+
+    return first_piece, last_piece
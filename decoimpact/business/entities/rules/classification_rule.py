@@ -13,17 +13,17 @@ Classes:
 
 from typing import Dict, List, Optional
 
+import numpy as _np
 import xarray as _xr
 
+from decoimpact.business.entities.rules.classification_lookup_table import (
+    ClassificationLookupTable,
+)
+from decoimpact.business.entities.rules.criteria_interval import CriteriaInterval
 from decoimpact.business.entities.rules.i_multi_array_based_rule import (
     IMultiArrayBasedRule,
 )
 from decoimpact.business.entities.rules.rule_base import RuleBase
-from decoimpact.business.entities.rules.string_parser_utils import (
-    read_str_comparison,
-    str_range_to_list,
-    type_of_classification,
-)
 from decoimpact.crosscutting.i_logger import ILogger
 
 
@@ -39,6 +39,19 @@ class ClassificationRule(RuleBase, IMultiArrayBasedRule):
         super().__init__(name, input_variable_names)
         self._criteria_table = criteria_table
 
+        # the criteria are parsed once, as intervals per column
+        self._column_names = [key for key in criteria_table.keys() if key != "output"]
+        self._criteria_intervals: List[List[Optional[CriteriaInterval]]] = [
+            [CriteriaInterval.from_criterion(c) for c in criteria_table[column_name]]
+            for column_name in self._column_names
+        ]
+
+        # tables with non overlapping criteria per column (for example a grid
+        # of classes) are classified with a lookup in a table of all classes
+        self._lookup_table = ClassificationLookupTable.create(
+            self._criteria_intervals, criteria_table["output"]
+        )
+
     @property
     def criteria_table(self) -> Dict:
         """Criteria property"""
@@ -47,75 +60,53 @@ class ClassificationRule(RuleBase, IMultiArrayBasedRule):
     def execute(
         self, value_arrays: Dict[str, _xr.DataArray], logger: ILogger
     ) -> _xr.DataArray:
-        """Determine the classification based on the table with criteria
+        """Determine the classification based on the table with criteria.
+        The output of the first row that matches all criteria is used (NaN
+        if no row matches).
+
         Args:
             values (Dict[str, float]): Dictionary holding the values
                                          for making the rule
         Returns:
             integer: classification
         """
-
-        # Get all the headers in the criteria_table representing a value to be checked
-        column_names = list(self._criteria_table.keys())
-        column_names.remove("output")
-
-        # Create an empty result_array to be filled
-        result_array = _xr.zeros_like(value_arrays[column_names[0]])
-
-        for row, out in reversed(list(enumerate(self._criteria_table["output"]))):
-            criteria_comparison = _xr.full_like(value_arrays[column_names[0]], True)
-            for column_name in column_names:
-                # DataArray on which the criteria needs to be checked
-                data = value_arrays[column_name]
-
-                # Retrieving criteria and applying it in correct format (number,
-                # range or comparison)
-                criteria = self.criteria_table[column_name][row]
-                comparison = self._get_comparison_for_criteria(criteria, data)
-                if comparison is None:
-                    comparison = True
-
-                # Criteria_comparison == 1 -> to check where the value is True
-                criteria_comparison = _xr.where(
-                    comparison & (criteria_comparison == 1), True, False
-                )
-            # For the first row set the default to None, for all the other
-            # rows use the already created dataarray
-            default_val = None
-            if row != len(self._criteria_table["output"]) - 1:
-                default_val = result_array
-
-            result_array = _xr.where(criteria_comparison, out, default_val)
-        return result_array
-
-    def _get_comparison_for_criteria(
-        self, criteria: str, data: _xr.DataArray
-    ) -> Optional[_xr.DataArray]:
-
-        criteria_class = type_of_classification(criteria)
-
-        comparison = None
-        if criteria_class == "number":
-            comparison = data == float(criteria)
-
-        elif criteria_class == "range":
-            begin, end = str_range_to_list(criteria)
-            comparison = (data >= begin) & (data <= end)
-
-        elif criteria_class == "larger_equal":
-            comparison_val = read_str_comparison(criteria, ">=")
-            comparison = data >= float(comparison_val)
-
-        elif criteria_class == "smaller_equal":
-            comparison_val = read_str_comparison(criteria, "<=")
-            comparison = data <= float(comparison_val)
-
-        elif criteria_class == "larger":
-            comparison_val = read_str_comparison(criteria, ">")
-            comparison = data > float(comparison_val)
-
-        elif criteria_class == "smaller":
-            comparison_val = read_str_comparison(criteria, "<")
-            comparison = data < float(comparison_val)
-
-        return comparison
+        return _xr.apply_ufunc(
+            self._classify,
+            *[value_arrays[column_name] for column_name in self._column_names],
+            dask="parallelized",
+            output_dtypes=[float],
+        )
+
+    def _classify(self, *column_values: _np.ndarray) -> _np.ndarray:
+        column_values = _np.broadcast_arrays(*column_values)
+        if self._lookup_table is not None:
+            return self._lookup_table.classify(column_values)
+
+        result = _np.full(column_values[0].shape, _np.nan)
+        unclassified = _np.ones(result.shape, dtype=bool)
+
+        # every unique criterion of a column is only compared once
+        comparisons: List[Dict[CriteriaInterval, _np.ndarray]] = [
+            {} for _ in self._column_names
+        ]
+
+        for row, output in enumerate(self._criteria_table["output"]):
+            matches = unclassified.copy()
+            for values, intervals, column_comparisons in zip(
+                column_values, self._criteria_intervals, comparisons
+            ):
+                interval = intervals[row]
+                if interval is None:
+                    continue
+
+                if interval not in column_comparisons:
+                    column_comparisons[interval] = interval.contains(values)
+                matches &= column_comparisons[interval]
+
+            result[matches] = output
+            unclassified &= ~matches
+
+            if not unclassified.any():
+                break
+
+        return result
@@ -79,53 +79,86 @@ class CombineResultsRule(RuleBase, IMultiArrayBasedRule):
         if len(value_arrays) != len(self._input_variable_names):
             raise ValueError("Not all expected arrays where provided.")
 
-        np_arrays = [a_array.to_numpy() for a_array in value_arrays.values()]
-        if not self._check_dimensions(np_arrays):
+        arrays = list(value_arrays.values())
+        if not self._check_dimensions(arrays):
             raise ValueError("The arrays must have the same dimensions.")
 
         operation_to_use = self._operations[self._operation_type]
 
-        first_value_array = next(iter(value_arrays.values()))
+        first_value_array = arrays[0]
+
+        # the arrays are combined value by value (using the dimensions of the
+        # first array), lazily (per chunk) for chunked arrays
+        result_data = _xr.apply_ufunc(
+            lambda *npa: operation_to_use(list(npa)),
+            *[_xr.Variable(first_value_array.dims, a.data) for a in arrays],
+            dask="parallelized",
+            output_dtypes=[
+                operation_to_use([_np.zeros(1, a.dtype) for a in arrays]).dtype
+            ],
+        )
 
         result_variable = _xr.DataArray(
-            data=operation_to_use(np_arrays),
-            dims=first_value_array.dims,
+            data=result_data,
             attrs=first_value_array.attrs,
         )
 
         return result_variable
 
+    def __getstate__(self):
+        # the operations (lambdas) can not be pickled (for processing
+        # partitions in separate processes), they are created again
+        state = self.__dict__.copy()
+        del state["_operations"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._operations = self._create_operations()
+
     def _create_operations(self) -> dict[MultiArrayOperationType, Callable]:
         if self.ignore_nan:
             return {
-                MultiArrayOperationType.MULTIPLY: lambda npa: _np.prod(npa, axis=0),
-                MultiArrayOperationType.MIN: lambda npa: _np.nanmin(npa, axis=0),
-                MultiArrayOperationType.MAX: lambda npa: _np.nanmax(npa, axis=0),
-                MultiArrayOperationType.AVERAGE: lambda npa: _np.nanmean(npa, axis=0),
+                MultiArrayOperationType.MULTIPLY: lambda npa: _accumulate(
+                    _np.multiply, npa, _get_sum_dtype(npa)
+                ),
+                MultiArrayOperationType.MIN: lambda npa: _accumulate(
+                    _np.fmin, npa, _np.result_type(*npa)
+                ),
+                MultiArrayOperationType.MAX: lambda npa: _accumulate(
+                    _np.fmax, npa, _np.result_type(*npa)
+                ),
+                MultiArrayOperationType.AVERAGE: lambda npa: _average(npa, True),
                 MultiArrayOperationType.MEDIAN: lambda npa: _np.nanmedian(npa, axis=0),
-                MultiArrayOperationType.ADD: lambda npa: _np.nansum(npa, axis=0),
-                MultiArrayOperationType.SUBTRACT: lambda npa: _np.subtract(
-                    npa[0], _np.nansum(npa[1:], axis=0)
+                MultiArrayOperationType.ADD: lambda npa: _accumulate(
+                    _np.add, npa, _get_sum_dtype(npa), True
                 ),
+                MultiArrayOperationType.SUBTRACT: lambda npa: _subtract(npa, True),
             }
         # and if ignore_nan is False:
         return {
-            MultiArrayOperationType.MULTIPLY: lambda npa: _np.prod(npa, axis=0),
-            MultiArrayOperationType.MIN: lambda npa: _np.min(npa, axis=0),
-            MultiArrayOperationType.MAX: lambda npa: _np.max(npa, axis=0),
-            MultiArrayOperationType.AVERAGE: lambda npa: _np.average(npa, axis=0),
+            MultiArrayOperationType.MULTIPLY: lambda npa: _accumulate(
+                _np.multiply, npa, _get_sum_dtype(npa)
+            ),
+            MultiArrayOperationType.MIN: lambda npa: _accumulate(
+                _np.minimum, npa, _np.result_type(*npa)
+            ),
+            MultiArrayOperationType.MAX: lambda npa: _accumulate(
+                _np.maximum, npa, _np.result_type(*npa)
+            ),
+            MultiArrayOperationType.AVERAGE: lambda npa: _average(npa, False),
             MultiArrayOperationType.MEDIAN: lambda npa: _np.median(npa, axis=0),
-            MultiArrayOperationType.ADD: lambda npa: _np.sum(npa, axis=0),
-            MultiArrayOperationType.SUBTRACT: lambda npa: _np.subtract(
-                npa[0], _np.sum(npa[1:], axis=0)
+            MultiArrayOperationType.ADD: lambda npa: _accumulate(
+                _np.add, npa, _get_sum_dtype(npa)
             ),
+            MultiArrayOperationType.SUBTRACT: lambda npa: _subtract(npa, False),
         }
 
-    def _check_dimensions(self, np_arrays: List[_np.ndarray]) -> bool:
+    def _check_dimensions(self, np_arrays: List[_xr.DataArray]) -> bool:
         """Brief check if all the arrays to be combined have the
            same size/dimension/length
         Args:
-            np_arrays: List of numpy arrays
+            np_arrays: List of (data) arrays
         Returns:
             Boolean: True of False
         """
@@ -140,3 +173,65 @@ class CombineResultsRule(RuleBase, IMultiArrayBasedRule):
             if expected_shape != a_array.shape:
                 return False
         return True
+
+
+def _accumulate(
+    ufunc: _np.ufunc,
+    np_arrays: List[_np.ndarray],
+    dtype: _np.dtype,
+    ignore_nan: bool = False,
+) -> _np.ndarray:
+    """Combines the arrays one by one into a single result array, instead of
+    reducing a stack of all arrays (which also combines the arrays one by
+    one along the first axis, giving the same result)
+    Args:
+        ufunc: function combining two arrays (add, multiply, minimum, ..)
+        np_arrays: List of numpy arrays
+        dtype: type of the result
+        ignore_nan: treat NaN values as zero (for a sum)
+    Returns:
+        numpy array: combined values
+    """
+    result = _np.array(np_arrays[0], dtype=dtype)
+    ignore_nan = ignore_nan and dtype.kind == "f"
+    if ignore_nan:
+        result[_np.isnan(result)] = 0
+
+    for a_array in np_arrays[1:]:
+        where = ~_np.isnan(a_array) if ignore_nan else True
+        ufunc(result, a_array, out=result, where=where)
+    return result
+
+
+def _average(np_arrays: List[_np.ndarray], ignore_nan: bool) -> _np.ndarray:
+    """Mean of the arrays, using a running sum (and count if NaN values
+    are ignored)"""
+    dtype = _np.result_type(*np_arrays)
+    if dtype.kind != "f":
+        dtype = _np.dtype(float)
+
+    if not ignore_nan:
+        totals = _accumulate(_np.add, np_arrays, dtype)
+        return _np.divide(totals, len(np_arrays), out=totals)
+
+    totals = _np.zeros(_np.shape(np_arrays[0]), dtype=dtype)
+    counts = _np.zeros(totals.shape, dtype=int)
+    for a_array in np_arrays:
+        is_value = ~_np.isnan(a_array)
+        _np.add(totals, a_array, out=totals, where=is_value)
+        counts += is_value
+
+    with _np.errstate(invalid="ignore", divide="ignore"):
+        return _np.divide(totals, counts, out=totals)
+
+
+def _subtract(np_arrays: List[_np.ndarray], ignore_nan: bool) -> _np.ndarray:
+    """Subtracts all other arrays from the first array"""
+    others = _accumulate(_np.add, np_arrays[1:], _get_sum_dtype(np_arrays), ignore_nan)
+    return _np.subtract(np_arrays[0], others, out=others)
+
+
+def _get_sum_dtype(np_arrays: List[_np.ndarray]) -> _np.dtype:
+    """Type numpy uses for the sum of the arrays (booleans and small integers
+    are summed as platform integers)"""
+    return _np.empty(0, dtype=_np.result_type(*np_arrays)).sum().dtype
@@ -0,0 +1,139 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Module for CriteriaInterval class
+
+Classes:
+    CriteriaInterval
+"""
+
+from typing import Any, Optional, Tuple
+
+import numpy as _np
+
+from decoimpact.business.entities.rules.string_parser_utils import (
+    read_str_comparison,
+    str_range_to_list,
+    type_of_classification,
+)
+
+
+class CriteriaInterval:
+    """Interval of values that meet a criterion of a criteria table
+    (number, range or comparison)"""
+
+    def __init__(
+        self,
+        lower: float,
+        upper: float,
+        lower_inclusive: bool = True,
+        upper_inclusive: bool = True,
+    ):
+        self._lower = lower
+        self._upper = upper
+        self._lower_inclusive = lower_inclusive
+        self._upper_inclusive = upper_inclusive
+
+    @property
+    def lower(self) -> float:
+        """Lower bound of the interval"""
+        return self._lower
+
+    @property
+    def upper(self) -> float:
+        """Upper bound of the interval"""
+        return self._upper
+
+    @property
+    def lower_inclusive(self) -> bool:
+        """If the lower bound is part of the interval"""
+        return self._lower_inclusive
+
+    @property
+    def upper_inclusive(self) -> bool:
+        """If the upper bound is part of the interval"""
+        return self._upper_inclusive
+
+    @staticmethod
+    def from_criterion(criterion: Any) -> Optional["CriteriaInterval"]:
+        """Parses a criterion of a criteria table
+
+        Args:
+            criterion (Any): number, range ("x:y") or comparison (">x",
+                             ">=x", "<x" or "<=x"), "-" for not applicable
+
+        Raises:
+            ValueError: if the criterion is not valid
+
+        Returns:
+            Optional[CriteriaInterval]: interval of the values that meet the
+                                        criterion or None if not applicable
+        """
+        criterion_type = type_of_classification(criterion)
+
+        if criterion_type == "number":
+            value = float(criterion)
+            return CriteriaInterval(value, value)
+
+        if criterion_type == "range":
+            begin, end = str_range_to_list(criterion)
+            return CriteriaInterval(begin, end)
+
+        if criterion_type == "larger_equal":
+            return CriteriaInterval(read_str_comparison(criterion, ">="), _np.inf)
+
+        if criterion_type == "smaller_equal":
+            return CriteriaInterval(-_np.inf, read_str_comparison(criterion, "<="))
+
+        if criterion_type == "larger":
+            lower = read_str_comparison(criterion, ">")
+            return CriteriaInterval(lower, _np.inf, lower_inclusive=False)
+
+        if criterion_type == "smaller":
+            upper = read_str_comparison(criterion, "<")
+            return CriteriaInterval(-_np.inf, upper, upper_inclusive=False)
+
+        return None
+
+    def contains(self, values: _np.ndarray) -> _np.ndarray:
+        """Checks which of the values are inside the interval (NaN never is)
+
+        Args:
+            values (ndarray): values to check
+
+        Returns:
+            ndarray: boolean array (same shape as values)
+        """
+        lower, upper = self._lower, self._upper
+
+        if lower == upper:
+            return values == lower
+
+        above_lower = values >= lower if self._lower_inclusive else values > lower
+        below_upper = values <= upper if self._upper_inclusive else values < upper
+
+        if lower == -_np.inf and self._lower_inclusive:
+            return below_upper
+        if upper == _np.inf and self._upper_inclusive:
+            return above_lower
+        return above_lower & below_upper
+
+    def _as_tuple(self) -> Tuple[float, float, bool, bool]:
+        return (self._lower, self._upper, self._lower_inclusive, self._upper_inclusive)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, CriteriaInterval) and self._as_tuple() == (
+            other._as_tuple()
+        )
+
+    def __hash__(self) -> int:
+        return hash(self._as_tuple())
+
+    def __repr__(self) -> str:
+        left = "[" if self._lower_inclusive else "("
+        right = "]" if self._upper_inclusive else ")"
+        return f"{left}{self._lower}, {self._upper}{right}"
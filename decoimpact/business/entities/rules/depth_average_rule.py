@@ -12,6 +12,7 @@ Classes:
 """
 from typing import Dict
 
+import numpy as _np
 import xarray as _xr
 
 from decoimpact.business.entities.rules.i_multi_array_based_rule import (
@@ -48,7 +49,9 @@ class DepthAverageRule(RuleBase, IMultiArrayBasedRule):
         depths_interfaces = values_list[3]
 
         # Get the dimension names for the interfaces and for the layers
-        dim_interfaces_name = list(depths_interfaces.dims)[0]
+        dim_interfaces_name = [
+            d for d in depths_interfaces.dims if d not in water_level_values.dims
+        ][0]
         interfaces_len = depths_interfaces[dim_interfaces_name].size
 
         dim_layer_name = [
@@ -65,40 +68,78 @@ class DepthAverageRule(RuleBase, IMultiArrayBasedRule):
             )
             return variable
 
-        # Deal with open layer system at water level and bed level
-        depths_interfaces.values[depths_interfaces.values.argmin()] = -100000
-        depths_interfaces.values[depths_interfaces.values.argmax()] = 100000
-
-        # Broadcast the depths to the dimensions of the bed levels. Then make a
-        # correction for the depths to the bed level, in other words all depths lower
-        # than the bed level will be corrected to the bed level.
-        depths_interfaces_broadcasted = depths_interfaces.broadcast_like(
-            bed_level_values
+        # The layers are processed per block of cells (if the values are
+        # chunked), so every block needs all layers and interfaces
+        if variable.chunks is not None:
+            variable = variable.chunk({dim_layer_name: -1})
+        if depths_interfaces.chunks is not None:
+            depths_interfaces = depths_interfaces.chunk({dim_interfaces_name: -1})
+
+        return _xr.apply_ufunc(
+            _calculate_depth_average,
+            variable,
+            bed_level_values,
+            water_level_values,
+            depths_interfaces,
+            input_core_dims=[[dim_layer_name], [], [], [dim_interfaces_name]],
+            dask="parallelized",
+            output_dtypes=[float],
         )
 
-        corrected_depth_bed = depths_interfaces_broadcasted.where(
-            bed_level_values < depths_interfaces_broadcasted, bed_level_values
-        )
-
-        # Make a similar correction for the waterlevels (first broadcast to match
-        # dimensions and then replace all values higher than waterlevel with
-        # waterlevel)
-        corrected_depth_bed = corrected_depth_bed.broadcast_like(water_level_values)
-        corrected_depth_bed = corrected_depth_bed.where(
-            water_level_values > corrected_depth_bed, water_level_values
-        )
 
-        # Calculate the layer heights between depths
-        layer_heights = corrected_depth_bed.diff(dim=dim_interfaces_name)
-        layer_heights = layer_heights.rename({dim_interfaces_name: dim_layer_name})
-
-        # Use the NaN filtering of the variable to set the correct depth per column
-        layer_heights = layer_heights.where(variable.notnull())
-
-        # Calculate depth average using relative value
-        relative_values = variable * layer_heights
-
-        # Calculate average
-        return relative_values.sum(dim=dim_layer_name) / layer_heights.sum(
-            dim=dim_layer_name
-        )
+def _calculate_depth_average(
+    values: _np.ndarray,
+    bed_levels: _np.ndarray,
+    water_levels: _np.ndarray,
+    interface_depths: _np.ndarray,
+) -> _np.ndarray:
+    """Calculates the depth average of the values (layers as last axis), using
+    the part of every layer between the bed level and the water level. The
+    layers are added one by one, so no arrays with all layers of all cells
+    are created (besides the values themselves).
+
+    Args:
+        values (ndarray): values per layer (layers as last axis)
+        bed_levels (ndarray): bed level of every cell
+        water_levels (ndarray): water level of every cell
+        interface_depths (ndarray): depths of the layer interfaces (interfaces
+                                    as last axis, can be different per cell)
+
+    Returns:
+        ndarray: depth averaged values (NaN if no layer contains water)
+    """
+    # Deal with open layer system at water level and bed level (on a copy, the
+    # input is not changed)
+    depths = _np.array(interface_depths, dtype=float)
+    lowest = _np.expand_dims(_np.argmin(depths, axis=-1), -1)
+    highest = _np.expand_dims(_np.argmax(depths, axis=-1), -1)
+    _np.put_along_axis(depths, lowest, -100000, axis=-1)
+    _np.put_along_axis(depths, highest, 100000, axis=-1)
+
+    def correct_depth(depth: _np.ndarray) -> _np.ndarray:
+        # all depths lower than the bed level are corrected to the bed level
+        # and all depths higher than the water level to the water level
+        depth = _np.where(bed_levels < depth, depth, bed_levels)
+        return _np.where(water_levels > depth, depth, water_levels)
+
+    shape = _np.broadcast_shapes(
+        values.shape[:-1], bed_levels.shape, water_levels.shape, depths.shape[:-1]
+    )
+    weighted_sum = _np.zeros(shape)
+    total_height = _np.zeros(shape)
+
+    lower_depth = correct_depth(depths[..., 0])
+    for layer in range(values.shape[-1]):
+        upper_depth = correct_depth(depths[..., layer + 1])
+        layer_heights = upper_depth - lower_depth
+        layer_values = values[..., layer]
+
+        # NaN values (and heights) are skipped
+        valid = ~(_np.isnan(layer_values) | _np.isnan(layer_heights))
+        weighted_sum += _np.where(valid, layer_values * layer_heights, 0)
+        total_height += _np.where(valid, layer_heights, 0)
+
+        lower_depth = upper_depth
+
+    with _np.errstate(invalid="ignore", divide="ignore"):
+        return weighted_sum / total_height
@@ -15,12 +15,12 @@ from typing import List
 
 import numpy as _np
 import xarray as _xr
-from scipy import signal
 
 from decoimpact.business.entities.rules.i_array_based_rule import IArrayBasedRule
 from decoimpact.business.entities.rules.options.options_filter_extreme_rule import (
     ExtremeTypeOptions,
 )
+from decoimpact.business.entities.rules.peak_detection import find_peaks
 from decoimpact.business.entities.rules.rule_base import RuleBase
 from decoimpact.business.entities.rules.time_operation_settings import (
     TimeOperationSettings,
@@ -74,6 +74,11 @@ class FilterExtremesRule(RuleBase, IArrayBasedRule):
         True/False array"""
         return self._mask
 
+    @property
+    def relative_cost(self) -> float:
+        """Peaks are searched in the time series of every cell"""
+        return 10.0
+
     def validate(self, logger: ILogger) -> bool:
         """Validates if the rule is valid
 
@@ -107,12 +112,18 @@ class FilterExtremesRule(RuleBase, IArrayBasedRule):
         width_time = _np.timedelta64(self.distance, time_scale)
         distance = width_time / timestep
 
+        # the peaks are searched over the complete time series of a cell,
+        # chunks of cells are processed in parallel (all series at once)
+        if value_array.chunks is not None:
+            value_array = value_array.chunk({time_dim_name: -1})
+
         results = _xr.apply_ufunc(
-            self._process_peaks,
+            _filter_extremes,
             value_array,
             input_core_dims=[[time_dim_name]],
             output_core_dims=[[time_dim_name]],
-            vectorize=True,
+            dask="parallelized",
+            output_dtypes=[float],
             kwargs={
                 "distance": distance,
                 "mask": self.mask,
@@ -123,16 +134,19 @@ class FilterExtremesRule(RuleBase, IArrayBasedRule):
         results = results.transpose(*value_array.dims)
         return results
 
-    def _process_peaks(
-        self, arr: _xr.DataArray, distance: float, mask: bool, extreme_type: str
-    ):
-        factor = 1
-        if extreme_type == "troughs":
-            factor = -1
-        peaks, _ = signal.find_peaks(factor * arr, distance=distance)
-        values = arr[peaks]
-        if mask:
-            values = True
-        new_arr = _np.full_like(arr, _np.nan, dtype=float)
-        new_arr[peaks] = values
-        return new_arr
+
+def _filter_extremes(
+    values: _np.ndarray, distance: float, mask: bool, extreme_type: str
+) -> _np.ndarray:
+    """Keeps the values at the extremes (along the last axis) of all series,
+    all other values are set to NaN"""
+    values = _np.asarray(values, dtype=float)
+    if extreme_type == "troughs":
+        peaks = find_peaks(-values, distance)
+    else:
+        peaks = find_peaks(values, distance)
+
+    extreme_values = values
+    if mask:
+        extreme_values = 1.0
+    return _np.where(peaks, extreme_values, _np.nan)
@@ -14,14 +14,18 @@ Classes:
 # Import safe modules
 import math
 from argparse import ArgumentError as _ArgumentError
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy
 from RestrictedPython import compile_restricted as _compile_restricted
 from RestrictedPython import safe_builtins as _safe_builtins
 
-from decoimpact.business.entities.rules.i_multi_cell_based_rule import (
-    IMultiCellBasedRule,
+from decoimpact.business.entities.rules.formula_vectorizer import (
+    ARRAY_MATH_MODULE_NAME,
+    vectorize_formula,
+)
+from decoimpact.business.entities.rules.i_vectorized_multi_cell_based_rule import (
+    IVectorizedMultiCellBasedRule,
 )
 from decoimpact.business.entities.rules.rule_base import RuleBase
 from decoimpact.crosscutting.i_logger import ILogger
@@ -30,7 +34,7 @@ from decoimpact.crosscutting.i_logger import ILogger
 # pylint: disable=W0122
 
 
-class FormulaRule(RuleBase, IMultiCellBasedRule):
+class FormulaRule(RuleBase, IVectorizedMultiCellBasedRule):
     """Implementation for the Formula rule"""
 
     formula_output_name: str = "formula_result"
@@ -39,6 +43,8 @@ class FormulaRule(RuleBase, IMultiCellBasedRule):
         super().__init__(name, input_variable_names)
         self._formula = formula
         self._byte_code = None
+        self._array_formula = vectorize_formula(formula, input_variable_names)
+        self._array_byte_code = None
         self._setup_environment()
 
     def validate(self, logger: ILogger) -> bool:
@@ -55,6 +61,8 @@ class FormulaRule(RuleBase, IMultiCellBasedRule):
             logger.log_error(f"Could not create formula function: {exception}")
             return False
 
+        # reuse the validated code for executing the rule
+        self._byte_code = byte_code
         return True
 
     @property
@@ -87,6 +95,88 @@ class FormulaRule(RuleBase, IMultiCellBasedRule):
 
         return float(local_variables[self.formula_output_name])
 
+    @property
+    def can_execute_array(self) -> bool:
+        """Indicates if the formula can be evaluated on complete arrays"""
+        return self._array_formula is not None
+
+    def execute_array(
+        self, values: Dict[str, numpy.ndarray], logger: ILogger
+    ) -> numpy.ndarray:
+        """Calculates the formula for all cells at once, using the array based
+        variant of the formula (still executed as restricted code)
+        Args:
+            values (Dict[str, ndarray]): arrays with values per input variable
+        Returns:
+            ndarray: Calculated floats
+        """
+        if not self._array_byte_code:
+            self._array_byte_code = _compile_restricted(
+                f"{self.formula_output_name} = {self._array_formula}",
+                filename="<inline code>",
+                mode="exec",
+            )
+
+        array_math = _ArrayMath()
+        global_variables = {
+            **self._global_variables,
+            ARRAY_MATH_MODULE_NAME: array_math,
+        }
+        local_variables = values.copy()
+
+        # numpy warns where math raises (for example sqrt of a negative value in
+        # a branch of a conditional expression that is not used for that cell)
+        with numpy.errstate(all="ignore"):
+            exec(self._array_byte_code, global_variables, local_variables)
+
+        result = numpy.asarray(local_variables[self.formula_output_name], dtype=float)
+        if array_math.error_cells is None or not array_math.error_cells.any():
+            return result
+
+        return self._recalculate_error_cells(
+            result, array_math.error_cells, values, logger
+        )
+
+    def _recalculate_error_cells(
+        self,
+        result: numpy.ndarray,
+        error_cells: numpy.ndarray,
+        values: Dict[str, numpy.ndarray],
+        logger: ILogger,
+    ) -> numpy.ndarray:
+        """Calculates the cells for which a math function would raise an error
+        cell by cell, so these give the same result (or error) as calculating
+        the formula cell by cell. Errors in a branch of a conditional
+        expression that is not used for a cell are not taken into account."""
+        names = list(values)
+        result, error_cells, *arrays = numpy.broadcast_arrays(
+            result, error_cells, *values.values()
+        )
+
+        result = result.copy()
+        for indices in zip(*numpy.nonzero(error_cells)):
+            cell_values = {name: array[indices] for name, array in zip(names, arrays)}
+            result[indices] = self.execute(cell_values, logger)
+
+        return result
+
+    def __getstate__(self):
+        # the modules and compiled code can not be pickled (for processing
+        # partitions in separate processes), they are set up again
+        state = self.__dict__.copy()
+        for name in [
+            "_safe_modules_dict",
+            "_global_variables",
+            "_byte_code",
+            "_array_byte_code",
+        ]:
+            del state[name]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._setup_environment()
+
     def _setup_environment(self):
         # use standard libraries that are considered safe
         self._safe_modules_dict = {
@@ -101,9 +191,79 @@ class FormulaRule(RuleBase, IMultiCellBasedRule):
         }
 
         self._byte_code = None
+        self._array_byte_code = None
 
     def _safe_import(self, name, *args, **kwargs):
         # Redefine import, to only import from safe modules
         if name not in self._safe_modules_dict:
             raise _ArgumentError(None, f"Importing {name!r} is not allowed!")
         return __import__(name, *args, **kwargs)
+
+
+class _ArrayMath:
+    """Element-wise numpy variants of the math functions (by numpy name), that
+    keep track of the cells for which the math function would raise an error
+    (like the square root of a negative value or the log of zero)"""
+
+    def __init__(self):
+        self.error_cells: Optional[numpy.ndarray] = None
+
+    def __getattr__(self, name: str):
+        function = getattr(numpy, name)
+
+        def call(*args):
+            floating_point_errors = []
+            with numpy.errstate(
+                all="call", call=lambda *_: floating_point_errors.append(True)
+            ):
+                result = function(*args)
+
+            if floating_point_errors:
+                self._add_error_cells(_get_error_cells(result, args))
+            return result
+
+        return call
+
+    def collect(self, value) -> Tuple[Any, Optional[numpy.ndarray]]:
+        """Takes the error cells of the calculation of value (since the
+        previous collect), to use them in where"""
+        error_cells = self.error_cells
+        self.error_cells = None
+        return value, error_cells
+
+    def where(self, test, body, orelse):
+        """numpy.where for collected values, only keeping the error cells
+        of the test and of the branch that is used for a cell"""
+        (condition, test_errors), (body_value, body_errors) = test, body
+        orelse_value, orelse_errors = orelse
+
+        branch_errors = numpy.where(
+            condition,
+            False if body_errors is None else body_errors,
+            False if orelse_errors is None else orelse_errors,
+        )
+        self._add_error_cells(test_errors)
+        if branch_errors.any():
+            self._add_error_cells(branch_errors)
+
+        return numpy.where(condition, body_value, orelse_value)
+
+    def _add_error_cells(self, error_cells: Optional[numpy.ndarray]):
+        if error_cells is None:
+            return
+
+        if self.error_cells is None:
+            self.error_cells = error_cells
+        else:
+            self.error_cells = self.error_cells | error_cells
+
+
+def _get_error_cells(result, args) -> numpy.ndarray:
+    # math raises where numpy gives NaN for non-NaN arguments or
+    # an infinite value for finite arguments
+    arguments = [numpy.asarray(arg) for arg in args]
+    nan_arguments = numpy.logical_or.reduce([numpy.isnan(a) for a in arguments])
+    finite_arguments = numpy.logical_and.reduce([numpy.isfinite(a) for a in arguments])
+    return (numpy.isnan(result) & ~nan_arguments) | (
+        numpy.isinf(result) & finite_arguments
+    )
@@ -0,0 +1,306 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Module for rewriting formulas so that they can be evaluated on complete
+(numpy) arrays instead of on single values.
+
+Only expressions that give the same result for every cell when evaluated
+on an array are rewritten: arithmetic, comparisons, boolean logic,
+conditional expressions and element-wise math/numpy functions.
+Sub-expressions that do not use any of the input variables are kept as
+they are, because they evaluate to the same value in both cases.
+
+Math functions are replaced by element-wise numpy functions of the module
+ARRAY_MATH_MODULE_NAME. That module is expected to keep track of the cells
+for which the math function would raise an error. Conditional expressions
+with math functions use the "where" of that module, with every argument
+wrapped in its "collect" function, so that only errors of the branch used
+for a cell are kept.
+"""
+
+import ast
+from typing import List, Optional
+
+import numpy
+
+# name of the module with the element-wise numpy variants of math functions
+ARRAY_MATH_MODULE_NAME = "math_array"
+
+# math functions with an element-wise numpy counterpart
+_MATH_TO_NUMPY = {
+    "sqrt": "sqrt",
+    "exp": "exp",
+    "expm1": "expm1",
+    "log": "log",
+    "log10": "log10",
+    "log2": "log2",
+    "log1p": "log1p",
+    "sin": "sin",
+    "cos": "cos",
+    "tan": "tan",
+    "asin": "arcsin",
+    "acos": "arccos",
+    "atan": "arctan",
+    "atan2": "arctan2",
+    "sinh": "sinh",
+    "cosh": "cosh",
+    "tanh": "tanh",
+    "asinh": "arcsinh",
+    "acosh": "arccosh",
+    "atanh": "arctanh",
+    "fabs": "fabs",
+    "floor": "floor",
+    "ceil": "ceil",
+    "trunc": "trunc",
+    "isnan": "isnan",
+    "isinf": "isinf",
+    "isfinite": "isfinite",
+    "hypot": "hypot",
+    "pow": "power",
+    "degrees": "degrees",
+    "radians": "radians",
+    "copysign": "copysign",
+    "fmod": "fmod",
+}
+
+# element-wise numpy functions that are not ufuncs
+_NUMPY_ELEMENT_WISE_FUNCTIONS = ["where", "clip"]
+
+# builtin functions with an element-wise numpy counterpart
+_BUILTIN_TO_NUMPY = {"abs": "absolute"}
+
+_MODULE_NAMES = ["math", "numpy"]
+
+_RESERVED_NAMES = _MODULE_NAMES + [ARRAY_MATH_MODULE_NAME] + list(_BUILTIN_TO_NUMPY)
+
+_SUPPORTED_BINARY_OPERATORS = (
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.Pow,
+    ast.BitAnd,
+    ast.BitOr,
+    ast.BitXor,
+    ast.LShift,
+    ast.RShift,
+)
+
+_SUPPORTED_COMPARISON_OPERATORS = (
+    ast.Eq,
+    ast.NotEq,
+    ast.Lt,
+    ast.LtE,
+    ast.Gt,
+    ast.GtE,
+)
+
+
+def vectorize_formula(formula: str, variable_names: List[str]) -> Optional[str]:
+    """Rewrites the formula into an expression that can be evaluated on
+    complete arrays of the input variables, giving the same result as
+    evaluating the formula for every cell separately. Math functions are
+    replaced by their numpy equivalents (of ARRAY_MATH_MODULE_NAME),
+    conditional expressions (a if c else b) by numpy.where and boolean
+    operators by their element-wise numpy counterparts.
+
+    Args:
+        formula (str): formula to rewrite
+        variable_names (List[str]): names of the (array) input variables
+
+    Returns:
+        Optional[str]: rewritten formula or None if the formula can not be
+                       evaluated on complete arrays
+    """
+    if any(name in _RESERVED_NAMES for name in variable_names):
+        return None
+
+    try:
+        expression = ast.parse(formula.strip(), mode="eval")
+        rewritten_body = _FormulaRewriter(variable_names).rewrite(expression.body)
+    except (SyntaxError, _NotVectorizableError):
+        return None
+
+    return ast.unparse(rewritten_body)
+
+
+class _NotVectorizableError(Exception):
+    """Raised when a (sub) expression can not be evaluated on arrays"""
+
+
+class _FormulaRewriter:
+    """Rewrites a formula expression (ast) to its array based variant"""
+
+    def __init__(self, variable_names: List[str]):
+        self._variable_names = variable_names
+
+    def rewrite(self, node: ast.expr) -> ast.expr:
+        """Rewrites the provided expression node
+
+        Raises:
+            _NotVectorizableError: if the expression can not be rewritten
+
+        Returns:
+            ast.expr: array based variant of the expression
+        """
+        # constant parts are evaluated once, exactly like for a single cell
+        if not self._uses_variables(node):
+            return node
+
+        # pylint: disable=too-many-return-statements
+        if isinstance(node, ast.Name):
+            return node
+
+        if isinstance(node, ast.BinOp):
+            if not isinstance(node.op, _SUPPORTED_BINARY_OPERATORS):
+                raise _NotVectorizableError()
+            node.left = self.rewrite(node.left)
+            node.right = self.rewrite(node.right)
+            return node
+
+        if isinstance(node, ast.UnaryOp):
+            operand = self.rewrite(node.operand)
+            if isinstance(node.op, ast.Not):
+                return _numpy_call("logical_not", [operand])
+            node.operand = operand
+            return node
+
+        if isinstance(node, ast.Compare):
+            return self._rewrite_comparison(node)
+
+        if isinstance(node, ast.BoolOp):
+            return self._rewrite_boolean_operation(node)
+
+        if isinstance(node, ast.IfExp):
+            return _where(
+                self.rewrite(node.test),
+                self.rewrite(node.body),
+                self.rewrite(node.orelse),
+            )
+
+        if isinstance(node, ast.Call):
+            return self._rewrite_call(node)
+
+        raise _NotVectorizableError()
+
+    def _rewrite_comparison(self, node: ast.Compare) -> ast.expr:
+        if not all(isinstance(op, _SUPPORTED_COMPARISON_OPERATORS) for op in node.ops):
+            raise _NotVectorizableError()
+
+        operands = [self.rewrite(operand) for operand in [node.left] + node.comparators]
+
+        # a < b < c is evaluated as (a < b) and (b < c)
+        comparisons = [
+            ast.Compare(left=left, ops=[op], comparators=[right])
+            for left, op, right in zip(operands[:-1], node.ops, operands[1:])
+        ]
+
+        result = comparisons[0]
+        for comparison in comparisons[1:]:
+            result = _numpy_call("logical_and", [result, comparison])
+        return result
+
+    def _rewrite_boolean_operation(self, node: ast.BoolOp) -> ast.expr:
+        values = [self.rewrite(value) for value in node.values]
+
+        # "a and b" gives b if a is true, otherwise a
+        # "a or b" gives a if a is true, otherwise b
+        result = values[-1]
+        for value in reversed(values[:-1]):
+            if isinstance(node.op, ast.And):
+                result = _where(value, result, value)
+            else:
+                result = _where(value, value, result)
+        return result
+
+    def _rewrite_call(self, node: ast.Call) -> ast.expr:
+        function_name = self._get_numpy_function_name(node.func)
+        module_name = "numpy"
+        if isinstance(node.func, ast.Attribute) and node.func.value.id == "math":
+            module_name = ARRAY_MATH_MODULE_NAME
+
+        if function_name == "log" and len(node.args) != 1:
+            # math.log(x, base) has no numpy equivalent
+            raise _NotVectorizableError()
+
+        if any(isinstance(arg, ast.Starred) for arg in node.args) or any(
+            keyword.arg is None for keyword in node.keywords
+        ):
+            raise _NotVectorizableError()
+
+        arguments = [self.rewrite(arg) for arg in node.args]
+        keywords = [
+            ast.keyword(arg=keyword.arg, value=self.rewrite(keyword.value))
+            for keyword in node.keywords
+        ]
+        return _numpy_call(function_name, arguments, keywords, module_name)
+
+    def _get_numpy_function_name(self, function: ast.expr) -> str:
+        if isinstance(function, ast.Name) and function.id in _BUILTIN_TO_NUMPY:
+            return _BUILTIN_TO_NUMPY[function.id]
+
+        if not (
+            isinstance(function, ast.Attribute)
+            and isinstance(function.value, ast.Name)
+            and function.value.id in _MODULE_NAMES
+        ):
+            raise _NotVectorizableError()
+
+        if function.value.id == "math":
+            if function.attr not in _MATH_TO_NUMPY:
+                raise _NotVectorizableError()
+            return _MATH_TO_NUMPY[function.attr]
+
+        numpy_function = getattr(numpy, function.attr, None)
+        if not (
+            isinstance(numpy_function, numpy.ufunc)
+            or function.attr in _NUMPY_ELEMENT_WISE_FUNCTIONS
+        ):
+            raise _NotVectorizableError()
+        return function.attr
+
+    def _uses_variables(self, node: ast.AST) -> bool:
+        return any(
+            isinstance(child, ast.Name) and child.id in self._variable_names
+            for child in ast.walk(node)
+        )
+
+
+def _where(test: ast.expr, body: ast.expr, orelse: ast.expr) -> ast.Call:
+    arguments = [test, body, orelse]
+    uses_math = any(
+        isinstance(child, ast.Name) and child.id == ARRAY_MATH_MODULE_NAME
+        for argument in arguments
+        for child in ast.walk(argument)
+    )
+    if not uses_math:
+        return _numpy_call("where", arguments)
+
+    collected_arguments = [
+        _numpy_call("collect", [argument], module_name=ARRAY_MATH_MODULE_NAME)
+        for argument in arguments
+    ]
+    return _numpy_call("where", collected_arguments, module_name=ARRAY_MATH_MODULE_NAME)
+
+
+def _numpy_call(
+    function_name: str,
+    arguments: List[ast.expr],
+    keywords: Optional[List[ast.keyword]] = None,
+    module_name: str = "numpy",
+) -> ast.Call:
+    return ast.Call(
+        func=ast.Attribute(
+            value=ast.Name(id=module_name, ctx=ast.Load()),
+            attr=function_name,
+            ctx=ast.Load(),
+        ),
+        args=arguments,
+        keywords=keywords or [],
+    )
@@ -0,0 +1,43 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Module for IVectorizedCellBasedRule interface
+
+Interfaces:
+    IVectorizedCellBasedRule
+
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Tuple
+
+import xarray as _xr
+
+from decoimpact.business.entities.rules.i_cell_based_rule import ICellBasedRule
+from decoimpact.crosscutting.i_logger import ILogger
+
+
+class IVectorizedCellBasedRule(ICellBasedRule, ABC):
+    """Rule applied to every cell, that can also process a complete array
+    at once. The rule processor prefers the array based execution, the
+    cell based execute method gives the reference result for every cell.
+    Chunked (dask) arrays are passed to execute_array chunk by chunk."""
+
+    @abstractmethod
+    def execute_array(
+        self, value_array: _xr.DataArray, logger: ILogger
+    ) -> Tuple[_xr.DataArray, List[int]]:
+        """Executes the rule for all cells of the provided array
+
+        Args:
+            value_array (DataArray): values to process
+            logger (ILogger): logger for reporting messages
+
+        Returns:
+            DataArray: result for every cell (same dimensions as value_array)
+            int[]: number of warnings less than minimum and greater than maximum
+        """
@@ -0,0 +1,49 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Module for IVectorizedMultiCellBasedRule interface
+
+Interfaces:
+    IVectorizedMultiCellBasedRule
+
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict
+
+import numpy as _np
+
+from decoimpact.business.entities.rules.i_multi_cell_based_rule import (
+    IMultiCellBasedRule,
+)
+from decoimpact.crosscutting.i_logger import ILogger
+
+
+class IVectorizedMultiCellBasedRule(IMultiCellBasedRule, ABC):
+    """Rule applied to every cell, that can (depending on its definition)
+    also process complete arrays at once. The rule processor prefers the
+    array based execution when it is available."""
+
+    @property
+    @abstractmethod
+    def can_execute_array(self) -> bool:
+        """Indicates if the rule can be executed on complete arrays"""
+
+    @abstractmethod
+    def execute_array(
+        self, values: Dict[str, _np.ndarray], logger: ILogger
+    ) -> _np.ndarray:
+        """Executes the rule for all cells of the provided arrays (all arrays
+        have the same shape)
+
+        Args:
+            values (Dict[str, np.ndarray]): arrays with the values per variable
+            logger (ILogger): logger for reporting messages
+
+        Returns:
+            np.ndarray: result for every cell
+        """
@@ -36,6 +36,13 @@ class MultiplyRule(RuleBase, IArrayBasedRule):
         self._multipliers = multipliers
         self._date_range = date_range
 
+        # the date ranges (DD-MM) are converted once to MMDD numbers, which
+        # compare in the same (calendar) order as the dates
+        self._month_day_ranges = [
+            (self._convert_to_month_day(start), self._convert_to_month_day(end))
+            for start, end in date_range or []
+        ]
+
     @property
     def multipliers(self) -> List[List[float]]:
         """Multiplier property"""
@@ -59,22 +66,27 @@ class MultiplyRule(RuleBase, IArrayBasedRule):
         # Per time period multiple multipliers can be given, reduce this to
         # one multiplier by taking the product of all multipliers.
         result_multipliers = [_np.prod(mp) for mp in self._multipliers]
-        old_dr = _xr.DataArray(value_array)
-        new_dr = _xr.full_like(old_dr, _np.nan)
-
-        for index, _mp in enumerate(result_multipliers):
-            if self.date_range is not None and len(self.date_range) != 0:
-                # Date is given in DD-MM, convert to MM-DD for comparison
-                start = self._convert_datestr(self.date_range[index][0])
-                end = self._convert_datestr(self.date_range[index][1])
-                dr_date = old_dr.time.dt.strftime(r"%m-%d")
-                new_dr = _xr.where(
-                    (start < dr_date) & (dr_date < end), old_dr * _mp, new_dr
-                )
-            else:
-                new_dr = old_dr * _mp
-        return new_dr
-
-    def _convert_datestr(self, date_str: str) -> str:
-        parsed_str = _dt.strptime(date_str, r"%d-%m")
-        return parsed_str.strftime(r"%m-%d")
+
+        if len(self._month_day_ranges) == 0:
+            return value_array * result_multipliers[-1]
+
+        # determine the period of every time step (-1 if not in any period),
+        # a later period overrides an earlier one
+        time = value_array.time
+        month_days = (time.dt.month * 100 + time.dt.day).values
+        period_indices = _np.full(len(month_days), -1)
+
+        for index, (start, end) in enumerate(self._month_day_ranges):
+            period_indices[(start < month_days) & (month_days < end)] = index
+
+        # time steps outside all periods get NaN (the last element)
+        time_multipliers = _np.append(result_multipliers, _np.nan)[period_indices]
+
+        multiplier_array = _xr.DataArray(
+            time_multipliers, coords={"time": time}, dims=["time"]
+        )
+        return value_array * multiplier_array
+
+    def _convert_to_month_day(self, date_str: str) -> int:
+        parsed_date = _dt.strptime(date_str, r"%d-%m")
+        return parsed_date.month * 100 + parsed_date.day
@@ -0,0 +1,210 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Module for finding peaks (local maxima) in many time series at once.
+
+The peaks are determined exactly as scipy.signal.find_peaks does for a
+single series (using only a minimal distance between the peaks), but for
+all series of an array together:
+
+- a peak is a value (or flat plateau of equal values, using its middle)
+  that is larger than both neighbours. The first and last value are never
+  a peak and NaN values are never part of a peak.
+- the peaks are handled from high to low and every remaining peak removes
+  the lower peaks closer than the distance.
+
+The peaks of all series are handled together, one peak per series at a
+time (the highest remaining). Every round has a fixed overhead, so this is
+only faster than searching series by series for short series (with few
+peaks). Longer series are still searched one by one with scipy.
+"""
+
+import math
+
+import numpy as _np
+from scipy import signal
+
+# largest series length for which the peaks of all series are handled at once
+_MAX_COMBINED_SEARCH_LENGTH = 128
+
+
+def find_peaks(values: _np.ndarray, distance: float) -> _np.ndarray:
+    """Finds the peaks along the last axis of the values
+
+    Args:
+        values (ndarray): values with time as last axis
+        distance (float): minimal distance (in time steps) between peaks
+
+    Raises:
+        ValueError: if the distance is smaller than 1
+
+    Returns:
+        ndarray: boolean array (same shape as values), True at the peaks
+    """
+    if distance < 1:
+        raise ValueError("`distance` must be greater or equal to 1")
+
+    values = _np.asarray(values, dtype=float)
+    length = values.shape[-1]
+    series_values = _np.ascontiguousarray(values.reshape(-1, length))
+    is_peak = _np.zeros(series_values.shape, dtype=bool)
+
+    if length > _MAX_COMBINED_SEARCH_LENGTH:
+        for series_index, series in enumerate(series_values):
+            peaks, _ = signal.find_peaks(series, distance=distance)
+            is_peak[series_index, peaks] = True
+        return is_peak.reshape(values.shape)
+
+    peaks = _find_local_maxima(series_values)
+    keep = _select_by_peak_distance(
+        series_values.ravel(), peaks, math.ceil(distance), length
+    )
+    is_peak.ravel()[peaks[keep]] = True
+    return is_peak.reshape(values.shape)
+
+
+def _find_local_maxima(values: _np.ndarray) -> _np.ndarray:
+    """Finds the local maxima (middle of flat peaks) of every series (row)
+
+    Returns:
+        ndarray: sorted indices of the maxima in the flattened values
+    """
+    length = values.shape[-1]
+    if length < 3:
+        return _np.array([], dtype=int)
+
+    # a peak starts with a rise (the first and last value can not be a peak)
+    middle = values[:, 1:-1]
+    rises = middle > values[:, :-2]
+
+    # a sharp peak is followed by a lower value
+    is_peak = _np.zeros(values.shape, dtype=bool)
+    _np.greater(middle, values[:, 2:], out=is_peak[:, 1:-1])
+    is_peak[:, 1:-1] &= rises
+
+    # a flat peak is followed by equal values
+    flat_starts = _np.flatnonzero(rises & (middle == values[:, 2:]))
+    if len(flat_starts) > 0:
+        flat_starts += flat_starts // (length - 2) * 2 + 1
+        is_peak.ravel()[_find_flat_peak_middles(values, flat_starts)] = True
+
+    return _np.flatnonzero(is_peak)
+
+
+def _find_flat_peak_middles(values: _np.ndarray, starts: _np.ndarray) -> _np.ndarray:
+    """Finds the middle of the flat peaks starting at the (flat) indices"""
+    length = values.shape[-1]
+
+    # the run of equal values ends at a change (NaN never equals), the last
+    # value of a series always ends a run
+    changes = _np.ones(values.shape, dtype=bool)
+    _np.not_equal(values[:, 1:], values[:, :-1], out=changes[:, :-1])
+    change_positions = _np.flatnonzero(changes)
+    ends = change_positions[_np.searchsorted(change_positions, starts)]
+
+    # the value after the run should be lower (not the end of the series)
+    flat_values = values.ravel()
+    next_values = flat_values[_np.minimum(ends + 1, flat_values.size - 1)]
+    is_peak = (ends % length < length - 1) & (next_values < flat_values[starts])
+
+    return (starts[is_peak] + ends[is_peak]) // 2
+
+
+def _select_by_peak_distance(
+    values: _np.ndarray, peaks: _np.ndarray, distance: int, length: int
+) -> _np.ndarray:
+    """Determines which peaks remain when higher peaks remove the lower
+    peaks of the same series that are closer than the distance.
+
+    The peaks are handled in rounds: every round handles the next highest
+    peak of all series at once. A peak that is not removed yet is kept and
+    removes the peaks within the distance. The kept peaks of a series are
+    at least the distance apart, so every peak is removed at most twice and
+    the work grows with the number of peaks (not with the distance).
+
+    Args:
+        values (ndarray): flattened values of all series
+        peaks (ndarray): sorted (flat) indices of the peaks
+        distance (int): minimal distance between peaks
+        length (int): length of every series
+
+    Returns:
+        ndarray: for every peak if it is kept
+    """
+    keep = _np.zeros(len(peaks), dtype=bool)
+    if len(peaks) == 0:
+        return keep
+
+    # the smallest integer type sorts the rounds fastest (radix sort)
+    rounds = _get_handling_rounds(values, peaks, length)
+    rounds = rounds.astype(_np.min_scalar_type(rounds.max()))
+    round_order = _np.argsort(rounds, kind="stable")
+    round_ends = _np.cumsum(_np.bincount(rounds))
+
+    removed = _np.zeros(len(peaks), dtype=bool)
+    round_start = 0
+    for round_end in round_ends:
+        candidates = round_order[round_start:round_end]
+        round_start = round_end
+
+        kept = candidates[~removed[candidates]]
+        keep[kept] = True
+        removed[_get_peaks_within_distance(peaks, kept, distance, length)] = True
+
+    return keep
+
+
+def _get_handling_rounds(
+    values: _np.ndarray, peaks: _np.ndarray, length: int
+) -> _np.ndarray:
+    """Determines in which round every peak is handled: the highest peak of
+    a series in the first round (0), the next highest in the second, etc.
+    Like scipy, this is the reversed order of numpy.argsort of the peak
+    values of the series (the order of equal values depends on all sorted
+    values)."""
+    series_starts = _np.flatnonzero(_np.diff(peaks // length, prepend=-1) != 0)
+    peak_counts = _np.diff(series_starts, append=len(peaks))
+
+    # series with the same number of peaks are sorted together (row by row)
+    rounds = _np.zeros(len(peaks), dtype=int)
+    for peak_count in _np.unique(peak_counts):
+        series_peaks = series_starts[peak_counts == peak_count, None] + _np.arange(
+            peak_count
+        )
+        series_rounds = _np.empty(series_peaks.shape, dtype=int)
+        _np.put_along_axis(
+            series_rounds,
+            _np.argsort(values[peaks[series_peaks]], axis=-1),
+            _np.arange(peak_count - 1, -1, -1),
+            axis=-1,
+        )
+        rounds[series_peaks] = series_rounds
+
+    return rounds
+
+
+def _get_peaks_within_distance(
+    peaks: _np.ndarray, selection: _np.ndarray, distance: int, length: int
+) -> _np.ndarray:
+    """Gets the peaks of the same series within the distance of the selected
+    peaks (including these peaks), which are a range of the sorted peaks"""
+    selected_peaks = peaks[selection]
+    series_starts = selected_peaks // length * length
+    lower = _np.searchsorted(
+        peaks, _np.maximum(selected_peaks - distance + 1, series_starts)
+    )
+    upper = _np.searchsorted(
+        peaks, _np.minimum(selected_peaks + distance, series_starts + length)
+    )
+    return _get_ranges(lower, upper)
+
+
+def _get_ranges(starts: _np.ndarray, ends: _np.ndarray) -> _np.ndarray:
+    """Gets all indices of the ranges (start inclusive, end exclusive)"""
+    sizes = ends - starts
+    offsets = _np.cumsum(sizes) - sizes
+    return _np.arange(sizes.sum()) - _np.repeat(offsets - starts, sizes)
@@ -0,0 +1,128 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Module for analyzing periods (runs of consecutive values of 1) along the
+time axis of N-dimensional arrays.
+
+A period is a sequence of consecutive time steps with value 1. NaN values
+are skipped: they neither end nor extend a period, so [1, NaN, 1] is a
+single period with a duration of 2.
+"""
+
+import numpy as _np
+
+from decoimpact.data.api.time_operation_type import TimeOperationType
+
+PERIOD_OPERATION_TYPES = [
+    TimeOperationType.COUNT_PERIODS,
+    TimeOperationType.MAX_DURATION_PERIODS,
+    TimeOperationType.AVG_DURATION_PERIODS,
+]
+
+
+def analyze_periods(
+    values: _np.ndarray,
+    bucket_sizes: _np.ndarray,
+    operation_type: TimeOperationType,
+) -> _np.ndarray:
+    """Analyzes the periods of every cell per time bucket in one pass over
+    the complete array. The time axis is the last axis of values, the
+    buckets are consecutive ranges of time steps (periods do not continue
+    in the next bucket).
+        - COUNT_PERIODS: number of periods ([0, 1, 1, 0, 1, 0] gives 2)
+        - MAX_DURATION_PERIODS: longest period ([0, 1, 1, 0, 1, 0] gives 2)
+        - AVG_DURATION_PERIODS: average period ([0, 1, 1, 0, 1, 0] gives 1.5)
+
+    Args:
+        values (ndarray): values (0, 1 or NaN) with time as last axis
+        bucket_sizes (ndarray): number of time steps of every bucket
+        operation_type (TimeOperationType): period operation to perform
+
+    Raises:
+        NotImplementedError: if the operation type is not a period operation
+
+    Returns:
+        ndarray: result with the buckets as last axis (NaN for empty buckets)
+    """
+    if operation_type not in PERIOD_OPERATION_TYPES:
+        raise NotImplementedError(
+            f"The operation type '{operation_type}' is not a period operation"
+        )
+
+    values = _np.asarray(values, dtype=float)
+    bucket_sizes = _np.asarray(bucket_sizes, dtype=int)
+    bucket_starts = _np.cumsum(bucket_sizes) - bucket_sizes
+
+    in_period = values == 1
+    period_starts = in_period & ~_is_previous_value_in_period(
+        values, _np.repeat(bucket_starts, bucket_sizes)
+    )
+
+    # only the non-empty buckets can be reduced (reduceat needs increasing indices)
+    non_empty = bucket_sizes > 0
+    reduce_indices = bucket_starts[non_empty]
+
+    if len(reduce_indices) == 0:
+        return _np.full(values.shape[:-1] + (len(bucket_sizes),), _np.nan)
+
+    period_counts = _np.add.reduceat(period_starts, reduce_indices, axis=-1)
+
+    if operation_type is TimeOperationType.COUNT_PERIODS:
+        result = period_counts
+
+    elif operation_type is TimeOperationType.MAX_DURATION_PERIODS:
+        durations = _get_durations(in_period, period_starts)
+        result = _np.maximum.reduceat(durations, reduce_indices, axis=-1).astype(float)
+
+    else:
+        period_lengths = _np.add.reduceat(in_period, reduce_indices, axis=-1)
+        result = _np.divide(
+            period_lengths,
+            period_counts,
+            out=_np.zeros(period_counts.shape),
+            where=period_counts != 0,
+        )
+
+    if _np.all(non_empty):
+        return result
+
+    bucket_results = _np.full(values.shape[:-1] + (len(bucket_sizes),), _np.nan)
+    bucket_results[..., non_empty] = result
+    return bucket_results
+
+
+def _is_previous_value_in_period(
+    values: _np.ndarray, step_bucket_starts: _np.ndarray
+) -> _np.ndarray:
+    """Checks for every time step if the previous (non NaN) value of the same
+    bucket is 1"""
+    time_steps = _np.arange(values.shape[-1])
+
+    # index of the last non NaN value up to (and including) every time step
+    last_valid = _np.maximum.accumulate(
+        _np.where(_np.isnan(values), -1, time_steps), axis=-1
+    )
+    previous_valid = _np.concatenate(
+        [_np.full(values.shape[:-1] + (1,), -1), last_valid[..., :-1]], axis=-1
+    )
+
+    previous_values = _np.take_along_axis(
+        values, _np.maximum(previous_valid, 0), axis=-1
+    )
+    return (previous_valid >= step_bucket_starts) & (previous_values == 1)
+
+
+def _get_durations(in_period: _np.ndarray, period_starts: _np.ndarray) -> _np.ndarray:
+    """Gives the duration of the period up to every time step (0 outside of
+    a period). For example [0, 1, 1, 0, 1, 1, 1] gives [0, 1, 2, 0, 1, 2, 3]"""
+    cumulative = _np.cumsum(in_period, axis=-1)
+
+    # cumulative value just before the start of the current period
+    offsets = _np.maximum.accumulate(
+        _np.where(period_starts, cumulative - 1, 0), axis=-1
+    )
+    return _np.where(in_period, cumulative - offsets, 0)
@@ -11,16 +11,19 @@ Classes:
     Response Curve Rule
 """
 
-from typing import List
+from typing import List, Tuple
 
 import numpy as _np
+import xarray as _xr
 
-from decoimpact.business.entities.rules.i_cell_based_rule import ICellBasedRule
+from decoimpact.business.entities.rules.i_vectorized_cell_based_rule import (
+    IVectorizedCellBasedRule,
+)
 from decoimpact.business.entities.rules.rule_base import RuleBase
 from decoimpact.crosscutting.i_logger import ILogger
 
 
-class ResponseCurveRule(RuleBase, ICellBasedRule):
+class ResponseCurveRule(RuleBase, IVectorizedCellBasedRule):
     """Rule for response function"""
 
     def __init__(
@@ -85,3 +88,32 @@ class ResponseCurveRule(RuleBase, ICellBasedRule):
             return values_output[-1], warning_counter
 
         return _np.interp(value, values_input, values_output), warning_counter
+
+    def execute_array(
+        self, value_array: _xr.DataArray, logger: ILogger
+    ) -> Tuple[_xr.DataArray, List[int]]:
+        """Interpolate all values of an array, based on given input and output
+        values. Values lower than the lowest input value get the first output
+        value, values larger than the highest input value get the last output
+        value (same results as calling execute for every value).
+
+        Args:
+            value_array (DataArray): values to interpolate
+
+        Returns:
+            DataArray: responses corresponding to the values to interpolate
+            int[]: number of warnings less than minimum and greater than maximum
+        """
+        values_input = self._input_values
+        values = value_array.values
+
+        warning_counter = [
+            int((values < _np.min(values_input)).sum()),
+            int((values > _np.max(values_input)).sum()),
+        ]
+
+        # np.interp already returns the first and last output value for
+        # values outside the range of the input values
+        result = _np.interp(values, values_input, self._output_values)
+
+        return value_array.copy(data=result), warning_counter
@@ -11,7 +11,6 @@ Classes:
     RollingStatisticsRule
 """
 
-import copy as _cp
 import datetime as _dt
 from typing import List
 
@@ -19,6 +18,11 @@ import numpy as _np
 import xarray as _xr
 
 from decoimpact.business.entities.rules.i_array_based_rule import IArrayBasedRule
+from decoimpact.business.entities.rules.rolling_window_statistics import (
+    SUPPORTED_OPERATION_TYPES,
+    calculate_window_statistic,
+    get_window_bounds,
+)
 from decoimpact.business.entities.rules.rule_base import RuleBase
 from decoimpact.business.entities.rules.time_operation_settings import (
     TimeOperationSettings,
@@ -59,6 +63,11 @@ class RollingStatisticsRule(RuleBase, IArrayBasedRule):
     def period(self, period: float):
         self._period = period
 
+    @property
+    def relative_cost(self) -> float:
+        """A rolling statistic needs a window of values for every time step"""
+        return 10.0
+
     def validate(self, logger: ILogger) -> bool:
         """Validates if the rule is valid
 
@@ -115,9 +124,6 @@ class RollingStatisticsRule(RuleBase, IArrayBasedRule):
             DataArray: Values of operation type
         """
 
-        result_array = _cp.deepcopy(values)
-        result_array = result_array.where(False, _np.nan)
-
         if time_scale == "H":
             operation_time_delta = _dt.timedelta(hours=self._period)
         elif time_scale == "D":
@@ -127,51 +133,35 @@ class RollingStatisticsRule(RuleBase, IArrayBasedRule):
             logger.log_error(error_message)
             raise ValueError(error_message)
 
-        time_delta_ms = _np.array([operation_time_delta], dtype="timedelta64[ms]")[0]
-        last_timestamp = values.time.isel(time=-1).values
-        for time_step in values.time.values:  # Interested in vectorizing this loop
-            if last_timestamp - time_step < time_delta_ms:
-                break
-
-            data = values.sel(time=slice(time_step, time_step + time_delta_ms))
-            last_timestamp_data = data.time.isel(time=-1).values
-            result = self._apply_operation(data, time_dim_name)
-
-            result_array.loc[{"time": last_timestamp_data}] = result
-
-        return _xr.DataArray(result_array)
-
-    def _apply_operation(
-        self, data: _xr.DataArray, time_dim_name: str
-    ) -> _xr.DataArray:
         operation_type = self.settings.operation_type
-
-        if operation_type is TimeOperationType.ADD:
-            result = data.sum(dim=time_dim_name)
-
-        elif operation_type is TimeOperationType.MIN:
-            result = data.min(dim=time_dim_name)
-
-        elif operation_type is TimeOperationType.MAX:
-            result = data.max(dim=time_dim_name)
-
-        elif operation_type is TimeOperationType.AVERAGE:
-            result = data.mean(dim=time_dim_name)
-
-        elif operation_type is TimeOperationType.MEDIAN:
-            result = data.median(dim=time_dim_name)
-
-        elif operation_type is TimeOperationType.STDEV:
-            result = data.std(dim=time_dim_name)
-
-        elif operation_type is TimeOperationType.PERCENTILE:
-            result = data.quantile(
-                self.settings.percentile_value / 100, dim=time_dim_name
-            ).drop_vars("quantile")
-
-        else:
+        if operation_type not in SUPPORTED_OPERATION_TYPES:
             raise NotImplementedError(
                 f"The operation type '{operation_type}' " "is currently not supported"
             )
 
-        return result
+        time_delta_ms = _np.array([operation_time_delta], dtype="timedelta64[ms]")[0]
+        window_starts, window_ends = get_window_bounds(
+            values[time_dim_name].values, time_delta_ms
+        )
+
+        # the windows are taken from the complete time series of a cell
+        if values.chunks is not None:
+            values = values.chunk({time_dim_name: -1})
+
+        result = _xr.apply_ufunc(
+            calculate_window_statistic,
+            values,
+            input_core_dims=[[time_dim_name]],
+            output_core_dims=[[time_dim_name]],
+            dask="parallelized",
+            output_dtypes=[float],
+            keep_attrs=True,
+            kwargs={
+                "window_starts": window_starts,
+                "window_ends": window_ends,
+                "operation_type": operation_type,
+                "percentile_value": self.settings.percentile_value,
+            },
+        )
+
+        return result.transpose(*values.dims)
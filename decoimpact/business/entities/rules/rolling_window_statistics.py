@@ -0,0 +1,277 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Module for calculating statistics over sliding time windows of
+N-dimensional arrays (time as last axis) for all cells at once.
+
+The windows are determined once from the time values and every statistic
+is calculated in (close to) linear time: sums, averages and standard
+deviations from prefix sums, minimum and maximum from a doubling
+(sparse table) range query and medians and percentiles from strided
+window views, processed in batches to limit the memory use.
+"""
+
+import warnings
+from typing import Callable, Tuple
+
+import numpy as _np
+
+from decoimpact.data.api.time_operation_type import TimeOperationType
+
+SUPPORTED_OPERATION_TYPES = [
+    TimeOperationType.ADD,
+    TimeOperationType.MIN,
+    TimeOperationType.MAX,
+    TimeOperationType.AVERAGE,
+    TimeOperationType.MEDIAN,
+    TimeOperationType.STDEV,
+    TimeOperationType.PERCENTILE,
+]
+
+# maximum number of values copied at once for calculating quantiles
+_MAX_QUANTILE_BATCH_SIZE = 10_000_000
+
+
+def get_window_bounds(
+    times: _np.ndarray, window_length: _np.timedelta64
+) -> Tuple[_np.ndarray, _np.ndarray]:
+    """Determines the windows of the provided (sorted) times. A window starts
+    at every time step for which the window (start up to and including
+    start + window_length) fits in the time series. Of the windows that end
+    at the same time step only the last (shortest) one is kept, because the
+    result of a window is stored at its last time step.
+
+    Args:
+        times (ndarray): sorted time values
+        window_length (timedelta64): length of the windows
+
+    Returns:
+        Tuple[ndarray, ndarray]: index of the first and last time step of
+                                 every window
+    """
+    if len(times) == 0:
+        return _np.array([], dtype=int), _np.array([], dtype=int)
+
+    starts = _np.flatnonzero(times[-1] - times >= window_length)
+    ends = _np.searchsorted(times, times[starts] + window_length, side="right") - 1
+
+    last_window_per_end = _np.diff(ends, append=len(times)) != 0
+    return starts[last_window_per_end], ends[last_window_per_end]
+
+
+def calculate_window_statistic(
+    values: _np.ndarray,
+    window_starts: _np.ndarray,
+    window_ends: _np.ndarray,
+    operation_type: TimeOperationType,
+    percentile_value: float = 0,
+) -> _np.ndarray:
+    """Calculates the statistic of every window (NaN values are skipped) and
+    stores it at the last time step of the window
+
+    Args:
+        values (ndarray): values with time as last axis
+        window_starts (ndarray): index of the first time step of every window
+        window_ends (ndarray): index of the last time step of every window
+        operation_type (TimeOperationType): statistic to calculate
+        percentile_value (float): percentile (0-100) for PERCENTILE
+
+    Raises:
+        NotImplementedError: If operation type is not supported
+
+    Returns:
+        ndarray: statistics at the window ends, NaN for the other time steps
+    """
+    values = _np.asarray(values, dtype=float)
+    result = _np.full(values.shape, _np.nan)
+
+    if operation_type not in SUPPORTED_OPERATION_TYPES:
+        raise NotImplementedError(
+            f"The operation type '{operation_type}' " "is currently not supported"
+        )
+
+    if len(window_starts) == 0:
+        return result
+
+    if operation_type in [TimeOperationType.MIN, TimeOperationType.MAX]:
+        reduce_function = (
+            _np.fmin if operation_type is TimeOperationType.MIN else _np.fmax
+        )
+        statistic = _get_window_extremes(
+            values, window_starts, window_ends, reduce_function
+        )
+
+    elif operation_type in [TimeOperationType.MEDIAN, TimeOperationType.PERCENTILE]:
+        quantile = (
+            0.5
+            if operation_type is TimeOperationType.MEDIAN
+            else percentile_value / 100
+        )
+        statistic = _get_window_quantiles(
+            values,
+            window_starts,
+            window_ends,
+            quantile,
+            operation_type is TimeOperationType.MEDIAN,
+        )
+
+    else:
+        statistic = _get_window_moments(
+            values, window_starts, window_ends, operation_type
+        )
+
+    result[..., window_ends] = statistic
+    return result
+
+
+def _get_window_moments(
+    values: _np.ndarray,
+    window_starts: _np.ndarray,
+    window_ends: _np.ndarray,
+    operation_type: TimeOperationType,
+) -> _np.ndarray:
+    """Calculates the sum, average or standard deviation using prefix sums"""
+    valid = ~_np.isnan(values)
+
+    if operation_type is TimeOperationType.ADD:
+        sums = _get_prefix_sums(_np.where(valid, values, 0.0))
+        return sums[..., window_ends + 1] - sums[..., window_starts]
+
+    # the values are shifted by the mean of the cell to limit the loss of
+    # precision when subtracting prefix sums (of squares)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        shift = _np.nan_to_num(_np.nanmean(values, axis=-1, keepdims=True))
+
+    shifted_values = _np.where(valid, values - shift, 0.0)
+    counts = _get_prefix_sums(valid.astype(float))
+    counts = counts[..., window_ends + 1] - counts[..., window_starts]
+
+    sums = _get_prefix_sums(shifted_values)
+    squared_sums = _get_prefix_sums(shifted_values**2)
+
+    with _np.errstate(invalid="ignore", divide="ignore"):
+        means = (sums[..., window_ends + 1] - sums[..., window_starts]) / counts
+
+        if operation_type is TimeOperationType.AVERAGE:
+            return _np.where(counts > 0, means + shift, _np.nan)
+
+        squared_sums_end = squared_sums[..., window_ends + 1]
+        squared_sums_start = squared_sums[..., window_starts]
+        variances = (squared_sums_end - squared_sums_start) / counts - means**2
+
+        # variances within the rounding error of the prefix sums are noise
+        # (for example for windows with a single value)
+        rounding_error = (
+            8 * _np.finfo(float).eps * (squared_sums_end + squared_sums_start) / counts
+        )
+        variances = _np.where(variances > rounding_error, variances, 0.0)
+
+        return _np.where(counts > 0, _np.sqrt(variances), _np.nan)
+
+
+def _get_prefix_sums(values: _np.ndarray) -> _np.ndarray:
+    """Gives the sums of the values before every time step (and of all
+    values as last element), so that the sum of time steps i up to and
+    including j is prefix_sums[j + 1] - prefix_sums[i]"""
+    prefix_sums = _np.zeros(values.shape[:-1] + (values.shape[-1] + 1,))
+    _np.cumsum(values, axis=-1, out=prefix_sums[..., 1:])
+    return prefix_sums
+
+
+def _get_window_extremes(
+    values: _np.ndarray,
+    window_starts: _np.ndarray,
+    window_ends: _np.ndarray,
+    reduce_function: Callable,
+) -> _np.ndarray:
+    """Calculates the minimum or maximum of every window. The extremes of
+    ranges of 2^k time steps are built up level by level; a window of length
+    n is covered by two (overlapping) ranges of 2^floor(log2(n)) time steps."""
+    lengths = window_ends - window_starts + 1
+    levels = _np.floor(_np.log2(lengths)).astype(int)
+    result = _np.full(values.shape[:-1] + (len(window_starts),), _np.nan)
+
+    # extreme of the 2^level values starting at every time step
+    range_extremes = values
+    for level in range(levels.max() + 1):
+        if level > 0:
+            half = 2 ** (level - 1)
+            range_extremes = reduce_function(
+                range_extremes[..., :-half], range_extremes[..., half:]
+            )
+
+        windows = _np.flatnonzero(levels == level)
+        if len(windows) == 0:
+            continue
+
+        last_range_starts = window_ends[windows] - 2**level + 1
+        result[..., windows] = reduce_function(
+            range_extremes[..., window_starts[windows]],
+            range_extremes[..., last_range_starts],
+        )
+
+    return result
+
+
+def _get_window_quantiles(
+    values: _np.ndarray,
+    window_starts: _np.ndarray,
+    window_ends: _np.ndarray,
+    quantile: float,
+    median: bool,
+) -> _np.ndarray:
+    """Calculates the median or quantile of every window, for all windows of
+    the same length at once (in batches)"""
+    lengths = window_ends - window_starts + 1
+    number_of_cells = max(1, int(_np.prod(values.shape[:-1])))
+    result = _np.full(values.shape[:-1] + (len(window_starts),), _np.nan)
+
+    for length in _np.unique(lengths):
+        window_views = _np.lib.stride_tricks.sliding_window_view(
+            values, length, axis=-1
+        )
+        windows = _np.flatnonzero(lengths == length)
+
+        batch_size = max(1, _MAX_QUANTILE_BATCH_SIZE // (number_of_cells * length))
+        for batch_start in range(0, len(windows), batch_size):
+            batch = windows[batch_start : batch_start + batch_size]
+            batch_values = window_views[..., window_starts[batch], :]
+
+            result[..., batch] = _get_sorted_quantiles(batch_values, quantile, median)
+
+    return result
+
+
+def _get_sorted_quantiles(
+    values: _np.ndarray, quantile: float, median: bool
+) -> _np.ndarray:
+    """Calculates the quantile along the last axis by sorting, interpolating
+    linearly like numpy.nanquantile (and numpy.nanmedian for the median).
+    NaN values are sorted to the end and skipped."""
+    sorted_values = _np.sort(values, axis=-1)
+    counts = _np.sum(~_np.isnan(values), axis=-1)
+
+    positions = quantile * (_np.maximum(counts, 1) - 1)
+    lower_indices = _np.floor(positions).astype(int)
+    upper_indices = _np.minimum(lower_indices + 1, _np.maximum(counts - 1, 0))
+    fractions = positions - lower_indices
+
+    lower = _np.take_along_axis(sorted_values, lower_indices[..., None], -1)[..., 0]
+    upper = _np.take_along_axis(sorted_values, upper_indices[..., None], -1)[..., 0]
+
+    if median:
+        result = _np.where(fractions == 0, lower, (lower + upper) / 2)
+    else:
+        differences = upper - lower
+        result = _np.where(
+            fractions >= 0.5,
+            upper - differences * (1 - fractions),
+            lower + differences * fractions,
+        )
+
+    return _np.where(counts > 0, result, _np.nan)
@@ -27,6 +27,7 @@ class RuleBase(IRule, ABC):
         self._description = ""
         self._input_variable_names = input_variable_names
         self._output_variable_name = "output"
+        self._definition = ""
 
     @property
     def name(self) -> str:
@@ -68,6 +69,23 @@ class RuleBase(IRule, ABC):
         """Name of the output variable"""
         self._output_variable_name = output_variable_name
 
+    @property
+    def definition(self) -> str:
+        """Text describing the complete configuration of the rule, used for
+        identifying its results (empty if unknown)"""
+        return self._definition
+
+    @definition.setter
+    def definition(self, definition: str):
+        """Text describing the complete configuration of the rule"""
+        self._definition = definition
+
+    @property
+    def relative_cost(self) -> float:
+        """Indication of the execution time of the rule, relative to a
+        simple rule (used to start expensive rules first)"""
+        return 1.0
+
     def validate(self, logger: ILogger) -> bool:
         """Validates if the rule is valid
 
@@ -12,16 +12,19 @@ Classes:
 
 """
 
-from typing import List
+from typing import List, Tuple
 
 import numpy as _np
+import xarray as _xr
 
-from decoimpact.business.entities.rules.i_cell_based_rule import ICellBasedRule
+from decoimpact.business.entities.rules.i_vectorized_cell_based_rule import (
+    IVectorizedCellBasedRule,
+)
 from decoimpact.business.entities.rules.rule_base import RuleBase
 from decoimpact.crosscutting.i_logger import ILogger
 
 
-class StepFunctionRule(RuleBase, ICellBasedRule):
+class StepFunctionRule(RuleBase, IVectorizedCellBasedRule):
     """Rule for Step function
 
     Defines a step function output (float) to an input (float).
@@ -107,3 +110,36 @@ class StepFunctionRule(RuleBase, ICellBasedRule):
                 warning_counter[1] = 1
 
         return responses[selected_bin], warning_counter
+
+    def execute_array(
+        self, value_array: _xr.DataArray, logger: ILogger
+    ) -> Tuple[_xr.DataArray, List[int]]:
+        """Classify all values of an array, based on given bins. Gives the
+        same results as calling execute for every value (NaN values stay NaN).
+
+        Args:
+            value_array (DataArray): values to classify
+
+        Returns:
+            DataArray: responses corresponding to the values to classify
+            int[]: number of warnings less than minimum and greater than maximum
+        """
+        values = value_array.values
+        warning_counter = [
+            int((values < self._limits[0]).sum()),
+            int((values > self._limits[-1]).sum()),
+        ]
+
+        return value_array.copy(data=self._classify(values)), warning_counter
+
+    def _classify(self, values: _np.ndarray) -> _np.ndarray:
+        # values below the lowest limit are digitized to -1, and should get
+        # the response of the first bin
+        selected_bins = _np.maximum(_np.digitize(values, self._limits) - 1, 0)
+        responses = self._responses[selected_bins]
+
+        nan_mask = _np.isnan(values)
+        if not nan_mask.any():
+            return responses
+
+        return _np.where(nan_mask, values, responses)
@@ -17,11 +17,21 @@ import numpy as _np
 import xarray as _xr
 
 from decoimpact.business.entities.rules.i_array_based_rule import IArrayBasedRule
+from decoimpact.business.entities.rules.period_analysis import (
+    PERIOD_OPERATION_TYPES,
+    analyze_periods,
+)
 from decoimpact.business.entities.rules.rule_base import RuleBase
 from decoimpact.business.entities.rules.time_operation_settings import (
     TimeOperationSettings,
 )
-from decoimpact.business.utils.data_array_utils import get_time_dimension_name
+from decoimpact.business.entities.rules.time_window_aggregator import (
+    TimeWindowAggregator,
+)
+from decoimpact.business.utils.data_array_utils import (
+    get_time_bucket_sizes,
+    get_time_dimension_name,
+)
 from decoimpact.crosscutting.i_logger import ILogger
 from decoimpact.data.api.time_operation_type import TimeOperationType
 from decoimpact.data.dictionary_utils import get_dict_element
@@ -73,6 +83,11 @@ class TimeAggregationRule(RuleBase, IArrayBasedRule):
         # optional validation here
         self._multi_year_end = value
 
+    @property
+    def relative_cost(self) -> float:
+        """Aggregating over time resamples the complete time series"""
+        return 10.0
+
     def validate(self, logger: ILogger) -> bool:
         """Validates if the rule is valid
 
@@ -112,8 +127,7 @@ class TimeAggregationRule(RuleBase, IArrayBasedRule):
             compare_values = (
                 (value_array == 0) | (value_array == 1) | _np.isnan(value_array)
             )
-            check_values = _xr.where(compare_values, True, False)
-            if False in check_values:
+            if not compare_values.all():
                 raise ValueError(
                     "The value array for the time aggregation rule with operation type"
                     " COUNT_PERIODS should only contain the values 0 and 1 (or NaN)."
@@ -169,17 +183,76 @@ class TimeAggregationRule(RuleBase, IArrayBasedRule):
         value_array: _xr.DataArray,
     ) -> tuple[_xr.DataArray, str]:
         """Handles the aggregation operation for other operation types"""
-        aggregated_values = value_array.resample({time_dim_name: dim_name}, skipna=True)
+        if settings.operation_type in PERIOD_OPERATION_TYPES:
+            aggregation_result = self._analyze_periods(
+                value_array, time_dim_name, dim_name
+            )
+        elif value_array.chunks is not None and TimeWindowAggregator.supports(
+            settings.operation_type
+        ):
+            # streamed (chunked) input is aggregated one time window at a time
+            aggregator = TimeWindowAggregator(
+                settings.operation_type, settings.percentile_value
+            )
+            aggregation_result = aggregator.aggregate(
+                value_array, time_dim_name, dim_name
+            )
+        else:
+            aggregated_values = value_array.resample(
+                {time_dim_name: dim_name}, skipna=True
+            )
+            aggregation_result = self._perform_operation(
+                aggregated_values, settings.operation_type
+            )
+
         # create a new aggregated time dimension based on original time dimension
-        aggregation_result = self._perform_operation(
-            aggregated_values, settings.operation_type
-        )
         _result_time_dim_name = f"{time_dim_name}_{settings.time_scale}"
         aggregation_result = aggregation_result.rename(
             {time_dim_name: _result_time_dim_name}
         )
         return aggregation_result, _result_time_dim_name
 
+    def _analyze_periods(
+        self, value_array: _xr.DataArray, time_dim_name: str, frequency: str
+    ) -> _xr.DataArray:
+        """Analyzes the periods of all cells and time buckets at once"""
+        bucket_sizes = get_time_bucket_sizes(value_array, time_dim_name, frequency)
+        values = value_array.transpose(..., time_dim_name)
+
+        if values.chunks is None:
+            result = analyze_periods(
+                values.to_numpy(), bucket_sizes.values, self._settings.operation_type
+            )
+        else:
+            # the periods are analyzed over the complete time series of a
+            # cell, so (chunked) input is processed one chunk of cells at a time
+            result = _xr.apply_ufunc(
+                analyze_periods,
+                values.chunk({time_dim_name: -1}),
+                input_core_dims=[[time_dim_name]],
+                output_core_dims=[[time_dim_name]],
+                exclude_dims={time_dim_name},
+                dask="parallelized",
+                output_dtypes=[float],
+                dask_gufunc_kwargs={"output_sizes": {time_dim_name: len(bucket_sizes)}},
+                kwargs={
+                    "bucket_sizes": bucket_sizes.values,
+                    "operation_type": self._settings.operation_type,
+                },
+            ).data
+
+        coords = {
+            name: coord
+            for name, coord in value_array.coords.items()
+            if time_dim_name not in coord.dims
+        }
+        coords[time_dim_name] = bucket_sizes[time_dim_name]
+
+        result_array = _xr.DataArray(
+            result, dims=values.dims, coords=coords, attrs=value_array.attrs
+        )
+        return result_array.transpose(*value_array.dims)
+
     def _perform_grouping_operation(
         self,
         grouped_values,
@@ -220,12 +293,6 @@ class TimeAggregationRule(RuleBase, IArrayBasedRule):
         Returns:
             DataArray: Values of operation type
         """
-        period_operations = [
-            TimeOperationType.COUNT_PERIODS,
-            TimeOperationType.MAX_DURATION_PERIODS,
-            TimeOperationType.AVG_DURATION_PERIODS,
-        ]
-
         if operation_type is TimeOperationType.ADD:
             result = aggregated_values.sum()
 
@@ -241,9 +308,6 @@ class TimeAggregationRule(RuleBase, IArrayBasedRule):
         elif operation_type is TimeOperationType.MEDIAN:
             result = aggregated_values.median()
 
-        elif operation_type in period_operations:
-            result = aggregated_values.reduce(self.analyze_groups, dim="time")
-
         elif operation_type is TimeOperationType.STDEV:
             result = aggregated_values.std()
 
@@ -259,45 +323,6 @@ class TimeAggregationRule(RuleBase, IArrayBasedRule):
 
         return _xr.DataArray(result)
 
-    def count_groups(self, elem):
-        """
-        Count the amount of times the groups of 1 occur.
-
-        Args:
-            elem (Array): the data array in N-dimensions
-
-        Returns:
-            List: list with the counted periods
-        """
-        # in case of an example array with 5 values [1,1,0,1,0]:
-        # subtract last 4 values from the first 4 values: [1,0,1,0] - [1,1,0,1]:
-        # (the result of this example differences: [0,-1,1,-1])
-        differences = _np.diff(elem)
-        # First add the first element of the array to the difference array (as this
-        # could also indicate a beginning of a group or not and the diff is calculated
-        # from the second element)
-        # when the difference of two neighbouring elements is 1, this indicates the
-        # start of a group. to count the number of groups: count the occurences of
-        # difference == 1: (the result of this examples: 1 + 1 = 2)
-        differences = _np.append(differences, elem[0])
-        return _np.count_nonzero(differences == 1)
-
-    def duration_groups(self, elem):
-        """
-        Create an array that cumulative sums the values of the groups in the array,
-        but restarts when a 0 occurs. For example: [0, 1, 1, 0, 1, 1, 1, 0, 1]
-        This function will return: [0, 1, 2, 0, 1, 2, 3, 0, 1, 2, 0, 1]
-
-        Args:
-            elem (List): the data array in N-dimensions
-
-        Returns:
-            List: List with the duration of the periods
-        """
-        # Function to create a cumsum over the groups (where the elements in elem are 1)
-        cumsum_groups = _np.frompyfunc(lambda a, b: a + b if b == 1 else 0, 2, 1)
-        return cumsum_groups.accumulate(elem)
-
     def analyze_groups(self, elem, axis):
         """This function analyzes the input array (N-dimensional array containing 0
         and 1) The function will reduce the array over the time axis, depending on a
@@ -314,49 +339,10 @@ class TimeAggregationRule(RuleBase, IArrayBasedRule):
 
         Returns:
             array: array with the analyzed periods, with the same dimensions as elem
+                   (without the time axis)
         """
-        # Determine the number of axes in the array
-        no_axis = len(_np.shape(elem))
-
-        # The reduce function that calls this analyze_groups function should be reduces
-        # over the time axis. The argument axis in this function gives a number of which
-        # axis is in fact the time axis. This axis needs to move to the last position,
-        # because we need to reduce the N-dimensional arary to a 1D array with all the
-        # values in time for a specific cell in order to do the calculation for that
-        # cell. Because we are looping over the N-dimensional array iteratively, we
-        # should only move the time axis the first time this function is called (so when
-        # the axis is not yet set to -1!)
-        if axis != -1:
-            elem = _np.moveaxis(elem, axis, -1)
-            axis = -1
-
-        #  in case of 1 dimension:
-        if no_axis == 1:
-            # remove NaN values from the array (these are to be ignored)
-            elem = elem[~_np.isnan(elem)]
-            if len(elem) == 0:
-                return 0
-            if self.settings.operation_type is TimeOperationType.COUNT_PERIODS:
-                group_result = self.count_groups(elem)
-            elif self.settings.operation_type is TimeOperationType.MAX_DURATION_PERIODS:
-                group_result = _np.max((self.duration_groups(elem)))
-            elif self.settings.operation_type is TimeOperationType.AVG_DURATION_PERIODS:
-                period = float(_np.sum(elem))
-                group_count = float(self.count_groups(elem))
-                group_result = _np.divide(
-                    period,
-                    group_count,
-                    out=_np.zeros_like(period),
-                    where=group_count != 0,
-                )
-
-        # in case of multiple dimensions:
-        else:
-            group_result = []
-            for sub_elem in elem:
-                # loop through this recursive function, determine output per axis:
-                group_result_row = self.analyze_groups(sub_elem, axis)
-                # add the result to the list of results, per axis:
-                group_result.append(group_result_row)
-
-        return group_result
+        values = _np.moveaxis(_np.asarray(elem, dtype=float), axis, -1)
+        result = analyze_periods(
+            values, [values.shape[-1]], self.settings.operation_type
+        )
+        return _np.nan_to_num(result[..., 0])
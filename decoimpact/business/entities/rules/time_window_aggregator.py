@@ -0,0 +1,220 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Module for TimeWindowAggregator class
+
+Classes:
+    TimeWindowAggregator
+"""
+
+from typing import List, Optional, Tuple, Union
+
+import numpy as _np
+import xarray as _xr
+
+from decoimpact.business.utils.data_array_utils import get_time_bucket_sizes
+from decoimpact.data.api.time_operation_type import TimeOperationType
+
+_SUPPORTED_OPERATION_TYPES = [
+    TimeOperationType.ADD,
+    TimeOperationType.MIN,
+    TimeOperationType.MAX,
+    TimeOperationType.AVERAGE,
+    TimeOperationType.STDEV,
+    TimeOperationType.MEDIAN,
+    TimeOperationType.PERCENTILE,
+]
+
+
+class TimeWindowAggregator:
+    """Aggregates values per time bucket (month or year) by consuming the
+    time series one window of time steps at a time. Only the accumulators
+    of the current bucket are kept, so the complete time series never needs
+    to be in memory. The result is the same as resampling the time series.
+
+    For chunked (dask) input the accumulators are combined lazily, so the
+    values are only calculated (once) when the result is computed."""
+
+    def __init__(self, operation_type: TimeOperationType, percentile_value: float = 0):
+        """Creates an aggregator for the provided operation
+
+        Args:
+            operation_type (TimeOperationType): operation to aggregate with
+            percentile_value (float): percentile (0-100) for PERCENTILE
+
+        Raises:
+            NotImplementedError: if the operation is not supported
+        """
+        if not self.supports(operation_type):
+            raise NotImplementedError(
+                f"The operation type '{operation_type}' can not be aggregated "
+                "per time window"
+            )
+        self._operation_type = operation_type
+        self._quantile = percentile_value / 100
+
+    @staticmethod
+    def supports(operation_type: TimeOperationType) -> bool:
+        """Checks if the operation can be aggregated per time window
+
+        Args:
+            operation_type (TimeOperationType): operation to check
+
+        Returns:
+            bool: if the operation is supported
+        """
+        return operation_type in _SUPPORTED_OPERATION_TYPES
+
+    # pylint: disable=too-many-locals
+    def aggregate(
+        self, value_array: _xr.DataArray, time_dim_name: str, frequency: str
+    ) -> _xr.DataArray:
+        """Aggregates the values per time bucket. The windows are the chunks
+        of the time dimension (or the complete time axis if not chunked).
+
+        Args:
+            value_array (DataArray): values to aggregate
+            time_dim_name (str): name of the time dimension
+            frequency (str): resample frequency of the buckets ("ME" or "YE")
+
+        Returns:
+            DataArray: aggregated values, with the bucket labels as time
+                       (lazy for chunked input)
+        """
+        bucket_sizes = get_time_bucket_sizes(value_array, time_dim_name, frequency)
+        bucket_ends = _np.cumsum(bucket_sizes.values)
+        window_ends = self._get_window_ends(value_array, time_dim_name)
+
+        # empty buckets give NaN for all cells
+        empty_bucket = _xr.full_like(
+            value_array.isel({time_dim_name: 0}, drop=True), _np.nan, dtype=float
+        )
+
+        bucket_results = []
+        for bucket_end, bucket_size in zip(bucket_ends, bucket_sizes.values):
+            if bucket_size == 0:
+                bucket_results.append(empty_bucket)
+                continue
+
+            # consume the parts of the windows that fall within the bucket
+            accumulator = _BucketAccumulator(
+                self._operation_type, self._quantile, time_dim_name
+            )
+            position = bucket_end - bucket_size
+            for window_end in window_ends[window_ends > position]:
+                end = min(window_end, bucket_end)
+                accumulator.add(value_array.isel({time_dim_name: slice(position, end)}))
+                position = end
+                if position == bucket_end:
+                    break
+
+            bucket_results.append(accumulator.result())
+
+        result = _xr.concat(bucket_results, dim=bucket_sizes[time_dim_name])
+        result.attrs = value_array.attrs
+        return result.transpose(*value_array.dims)
+
+    @staticmethod
+    def _get_window_ends(value_array: _xr.DataArray, time_dim_name: str) -> _np.ndarray:
+        window_sizes: Tuple[int, ...] = (value_array.sizes[time_dim_name],)
+        if value_array.chunks is not None:
+            window_sizes = value_array.chunksizes[time_dim_name]
+
+        return _np.cumsum(window_sizes)
+
+
+class _BucketAccumulator:
+    """Accumulates the values of a single time bucket (NaN values are skipped)"""
+
+    # pylint: disable=too-many-instance-attributes
+    def __init__(
+        self, operation_type: TimeOperationType, quantile: float, time_dim_name: str
+    ):
+        self._operation_type = operation_type
+        self._quantile = quantile
+        self._time_dim_name = time_dim_name
+        # start with (integer) zeros, so sums of integers stay integers
+        self._count: Union[int, _xr.DataArray] = 0
+        self._sum: Union[int, _xr.DataArray] = 0
+        self._mean: Union[float, _xr.DataArray] = 0.0
+        self._sum_squared_differences: Union[float, _xr.DataArray] = 0.0
+        self._extreme: Optional[_xr.DataArray] = None
+        self._buffer: List[_xr.DataArray] = []
+
+    def add(self, values: _xr.DataArray):
+        """Adds the values of consecutive time steps to the bucket"""
+        operation_type = self._operation_type
+        dim = self._time_dim_name
+
+        if operation_type in [TimeOperationType.MEDIAN, TimeOperationType.PERCENTILE]:
+            # quantiles are calculated exactly over the values of the bucket
+            self._buffer.append(values)
+            return
+
+        if operation_type in [TimeOperationType.MIN, TimeOperationType.MAX]:
+            is_min = operation_type is TimeOperationType.MIN
+            extreme = (
+                values.min(dim, skipna=True) if is_min else values.max(dim, skipna=True)
+            )
+            if self._extreme is not None:
+                combine = _np.fmin if is_min else _np.fmax
+                extreme = combine(self._extreme, extreme)
+            self._extreme = extreme
+            return
+
+        count = values.count(dim)
+        values_sum = values.sum(dim, skipna=True)
+
+        if operation_type is TimeOperationType.STDEV:
+            # combine the mean and sum of squared differences of the new values
+            # with the current ones (parallel variant of Welford's algorithm)
+            mean = _divide(values_sum, count).fillna(0.0)
+            squared_differences = ((values - mean) ** 2).sum(dim, skipna=True)
+            total_count = self._count + count
+            delta = mean - self._mean
+            self._mean = (self._mean + _divide(delta * count, total_count)).fillna(0.0)
+            self._sum_squared_differences = (
+                self._sum_squared_differences
+                + squared_differences
+                + _divide(delta**2 * self._count * count, total_count)
+            ).fillna(0.0)
+
+        self._count = self._count + count
+        self._sum = self._sum + values_sum
+
+    def result(self) -> _xr.DataArray:
+        """Gives the aggregated values of the bucket"""
+        operation_type = self._operation_type
+        dim = self._time_dim_name
+
+        if operation_type in [TimeOperationType.MIN, TimeOperationType.MAX]:
+            return self._extreme
+
+        if operation_type in [TimeOperationType.MEDIAN, TimeOperationType.PERCENTILE]:
+            values = _xr.concat(self._buffer, dim=dim)
+            if values.chunks is not None:
+                values = values.chunk({dim: -1})
+
+            if operation_type is TimeOperationType.MEDIAN:
+                return values.median(dim, skipna=True)
+
+            return values.quantile(self._quantile, dim, skipna=True).drop_vars(
+                "quantile"
+            )
+
+        if operation_type is TimeOperationType.ADD:
+            return self._sum
+
+        if operation_type is TimeOperationType.STDEV:
+            return _np.sqrt(_divide(self._sum_squared_differences, self._count))
+
+        return _divide(self._sum, self._count)
+
+
+def _divide(numerator: _xr.DataArray, denominator: _xr.DataArray) -> _xr.DataArray:
+    """Divides the values, giving NaN (without warning) for a zero denominator"""
+    return numerator / denominator.where(denominator > 0)
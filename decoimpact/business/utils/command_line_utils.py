@@ -10,6 +10,7 @@ Module for command line utils
 import argparse
 import sys
 from pathlib import Path
+from typing import Any, Dict, Tuple
 
 from decoimpact.business.utils.version_utils import read_version_number
 
@@ -31,11 +32,12 @@ PROGRAM_DESCRIPTION = """
 """
 
 
-def read_command_line_arguments():
+def read_command_line_arguments() -> Tuple[Path, Dict[str, Any]]:
     """Reads the command line arguments given to the tool
 
     Returns:
         Path: input yaml path
+        Dict[str, Any]: run settings overriding the ones in the input yaml
     """
 
     # Initialize parser with the multiline description
@@ -51,6 +53,75 @@ def read_command_line_arguments():
         help="Input yaml file",
     )
     parser.add_argument("-v", "--version", action="store_true", help="Show version")
+    parser.add_argument(
+        "--execution-mode",
+        choices=["sequential", "threads"],
+        help="How to execute rules that do not depend on each other\n"
+        "(overrides execution_mode in the run-settings of the input file)",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        help="Maximum number of threads used for parallel execution\n"
+        "(overrides max_workers in the run-settings of the input file)",
+    )
+    parser.add_argument(
+        "--time-window",
+        type=int,
+        help="Number of time steps to process at once\n"
+        "(overrides time_window in the run-settings of the input file)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of processes used to process partitions (input files)\n"
+        "in parallel (overrides workers in the run-settings of the input file)",
+    )
+    parser.add_argument(
+        "--combine-partitions",
+        action="store_true",
+        default=None,
+        help="Write the results of all partitions into one output file\n"
+        "(overrides combine_partitions in the run-settings of the input file)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        help="Directory for caching the results of rules between runs\n"
+        "(overrides cache_directory in the run-settings of the input file)",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        help="Maximum size of the cache in MB\n"
+        "(overrides cache_size in the run-settings of the input file)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_false",
+        default=None,
+        dest="use_cache",
+        help="Execute all rules without using the cache",
+    )
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        default=None,
+        help="Remove all results from the cache before running",
+    )
+    parser.add_argument(
+        "--checkpoint-dir",
+        type=str,
+        help="Directory for storing the result of every completed rule\n"
+        "(overrides checkpoint_directory in the run-settings of the input file)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        default=None,
+        help="Skip the rules completed by an earlier run, using the results\n"
+        "in the checkpoint directory",
+    )
 
     # Read arguments from command line
     args = parser.parse_args()
@@ -68,4 +139,20 @@ def read_command_line_arguments():
         print("===========================================")
         input("\nPlease provide an input.yaml file. Hit Enter to exit.\n")
         sys.exit()
-    return input_path
+
+    run_settings = {
+        "execution_mode": args.execution_mode,
+        "max_workers": args.max_workers,
+        "time_window": args.time_window,
+        "workers": args.workers,
+        "combine_partitions": args.combine_partitions,
+        "cache_directory": args.cache_dir,
+        "cache_size": args.cache_size,
+        "use_cache": args.use_cache,
+        "clear_cache": args.clear_cache,
+        "checkpoint_directory": args.checkpoint_dir,
+        "resume": args.resume,
+    }
+    return input_path, {
+        key: value for key, value in run_settings.items() if value is not None
+    }
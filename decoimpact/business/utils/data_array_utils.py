@@ -34,3 +34,25 @@ def get_time_dimension_name(variable: _xr.DataArray, logger: ILogger) -> str:
     message = f"No time dimension found for {variable.name}"
     logger.log_error(message)
     raise ValueError(message)
+
+
+def get_time_bucket_sizes(
+    variable: _xr.DataArray, time_dim_name: str, frequency: str
+) -> _xr.DataArray:
+    """Retrieves the number of time steps of every time bucket (for example
+    month or year), in the same way as resampling the time dimension
+
+    Args:
+        variable (DataArray): values with a time dimension
+        time_dim_name (str): name of the time dimension
+        frequency (str): resample frequency of the buckets (for example "YE")
+
+    Returns:
+        DataArray: number of time steps per bucket (also the empty ones),
+                   with the bucket labels as time coordinate
+    """
+    time_values = variable[time_dim_name]
+    bucket_sizes = time_values.resample({time_dim_name: frequency}).count()
+
+    # empty buckets are counted as NaN
+    return bucket_sizes.fillna(0).astype(int)
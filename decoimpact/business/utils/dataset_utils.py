@@ -6,6 +6,7 @@
 # https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
 """Library for utility functions regarding an xarray dataset"""
 
+from importlib.util import find_spec
 from typing import List, Optional
 
 import xarray as _xr
@@ -350,3 +351,47 @@ def reduce_dataset_for_writing(
 
     dataset = remove_all_variables_except(dataset, save_only_variables)
     return dataset
+
+
+def chunk_time_dimensions(dataset: _xr.Dataset, window_size: int) -> _xr.Dataset:
+    """Chunks the time dimension(s) of the dataset in windows of the
+    provided number of time steps, so that the data is processed (and
+    written) one window at a time. Rules that need the complete time series
+    of a cell (like rolling statistics) combine the windows of a chunk of
+    cells, so the largest other dimension (the cells) is chunked as well,
+    keeping such a chunk about as large as one time window.
+
+    Args:
+        dataset (_xr.Dataset): dataset to chunk
+        window_size (int): number of time steps per window
+
+    Raises:
+        ValueError: if dask (needed for chunking) is not installed
+
+    Returns:
+        _xr.Dataset: dataset with (lazy) chunked time dimension(s) and cells
+    """
+    time_dims = [
+        dim
+        for dim in dataset.dims
+        if dim in dataset.coords and dataset[dim].dtype.name.startswith("datetime64")
+    ]
+    if len(time_dims) == 0:
+        return dataset
+
+    if find_spec("dask") is None:
+        raise ValueError(
+            "Processing in time windows requires dask to be installed "
+            "(pip install decoimpact[dask])"
+        )
+
+    chunks = {dim: window_size for dim in time_dims}
+
+    time_size = max(dataset.sizes[dim] for dim in time_dims)
+    other_dims = [dim for dim in dataset.dims if dim not in time_dims]
+    if len(other_dims) > 0 and time_size > window_size:
+        cell_dim = max(other_dims, key=lambda dim: dataset.sizes[dim])
+        number_of_windows = -(-time_size // window_size)
+        chunks[cell_dim] = -(-dataset.sizes[cell_dim] // number_of_windows)
+
+    return dataset.chunk(chunks)
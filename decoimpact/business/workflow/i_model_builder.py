@@ -14,8 +14,10 @@ InterfacesS:
 
 
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from decoimpact.business.entities.i_model import IModel
+from decoimpact.business.entities.rule_based_model_plan import RuleBasedModelPlan
 from decoimpact.data.api.i_model_data import IModelData
 
 
@@ -23,9 +25,26 @@ class IModelBuilder(ABC):
     """Factory for creating models"""
 
     @abstractmethod
-    def build_model(self, model_data: IModelData) -> IModel:
+    def create_plan(self, model_data: IModelData) -> RuleBasedModelPlan:
+        """Creates the partition independent plan (the rules) of a model
+        based on model data. The plan can be pickled, so that it can be
+        created once and sent to the processes of the partitions.
+
+        Returns:
+            RuleBasedModelPlan: plan for the models of the model data
+        """
+
+    @abstractmethod
+    def build_model(
+        self, model_data: IModelData, plan: Optional[RuleBasedModelPlan] = None
+    ) -> IModel:
         """Creates an model based on model data
 
+        Args:
+            model_data (IModelData): data describing the model
+            plan (Optional[RuleBasedModelPlan]): plan (created earlier) to use
+                for the model, instead of creating one
+
         Returns:
             IModel: instance of a model based on model data
         """
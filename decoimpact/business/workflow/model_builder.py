@@ -12,10 +12,11 @@ Classes:
 
 """
 
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 
 from decoimpact.business.entities.i_model import IModel
 from decoimpact.business.entities.rule_based_model import RuleBasedModel
+from decoimpact.business.entities.rule_based_model_plan import RuleBasedModelPlan
 from decoimpact.business.entities.rules.axis_filter_rule import AxisFilterRule
 from decoimpact.business.entities.rules.classification_rule import ClassificationRule
 from decoimpact.business.entities.rules.combine_results_rule import CombineResultsRule
@@ -62,10 +63,32 @@ class ModelBuilder(IModelBuilder):
     def __init__(self, da_layer: IDataAccessLayer, logger: ILogger) -> None:
         self._logger = logger
         self._da_layer = da_layer
+        self._plan: Optional[RuleBasedModelPlan] = None
+        self._plan_rule_data: Optional[List[IRuleData]] = None
 
-    def build_model(self, model_data: IModelData) -> IModel:
+    def create_plan(self, model_data: IModelData) -> RuleBasedModelPlan:
+        """Creates the partition independent plan (the rules) of a model
+        based on model data. The plan is reused by the models built for the
+        same rule data.
+
+        Returns:
+            RuleBasedModelPlan: plan for the models of the model data
+        """
+        return self._get_plan(model_data.rules)
+
+    def build_model(
+        self, model_data: IModelData, plan: Optional[RuleBasedModelPlan] = None
+    ) -> IModel:
         """Creates a model based on model data.
         Current mapping works only for one dataset.
+        The rules are only created once for all models sharing the same
+        rule data (like the partitions of a model), only the input datasets
+        are read for every model.
+
+        Args:
+            model_data (IModelData): data describing the model
+            plan (Optional[RuleBasedModelPlan]): plan (created earlier) to use
+                for the model, instead of creating one
 
         Returns:
             IModel: instance of a model based on model data
@@ -74,16 +97,32 @@ class ModelBuilder(IModelBuilder):
         self._logger.log_info("Creating rule-based model")
 
         datasets = [self._da_layer.read_input_dataset(ds) for ds in model_data.datasets]
-        rules = list(ModelBuilder._create_rules(model_data.rules))
+        if plan is None:
+            plan = self._get_plan(model_data.rules)
 
         mapping = model_data.datasets[0].mapping
 
         model: IModel = RuleBasedModel(
-            datasets, rules, mapping, model_data.name, model_data.partition
+            datasets,
+            plan.rules,
+            mapping,
+            model_data.name,
+            model_data.partition,
+            model_data.run_settings,
+            model_data.output_variables,
+            plan,
         )
 
         return model
 
+    def _get_plan(self, rule_data: List[IRuleData]) -> RuleBasedModelPlan:
+        if self._plan is None or rule_data is not self._plan_rule_data:
+            rules = list(ModelBuilder._create_rules(rule_data))
+            self._plan = RuleBasedModelPlan(rules)
+            self._plan_rule_data = rule_data
+
+        return self._plan
+
     @staticmethod
     def _create_rules(rule_data: List[IRuleData]) -> Iterable[IRule]:
         for rule_data_object in rule_data:
@@ -94,6 +133,11 @@ class ModelBuilder(IModelBuilder):
         rule.description = rule_data.description
         rule.output_variable_name = rule_data.output_variable
 
+        # the (plain) rule data describes the complete configuration of a rule
+        rule.definition = (
+            f"{type(rule_data).__name__}: {sorted(vars(rule_data).items())!r}"
+        )
+
     @staticmethod
     def _create_rule(rule_data: IRuleData) -> IRule:
 
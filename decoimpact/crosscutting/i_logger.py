@@ -49,3 +49,6 @@ class ILogger(ABC):
         Args:
             message (str): message to log
         """
+
+    def close(self) -> None:
+        """Releases the resources (like open log files) of the logger"""
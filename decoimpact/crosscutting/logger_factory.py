@@ -12,9 +12,11 @@ Classes:
 
 """
 
+from pathlib import Path
 
 from decoimpact.crosscutting.i_logger import ILogger
 from decoimpact.crosscutting.logging_logger import LoggingLogger
+from decoimpact.crosscutting.prefixed_logger import PrefixedLogger
 
 
 class LoggerFactory:
@@ -28,3 +30,21 @@ class LoggerFactory:
             Logger: created logger
         """
         return LoggingLogger()
+
+    @staticmethod
+    def create_partition_logger(partition: str, log_directory: Path) -> ILogger:
+        """Creates a logger for processing a partition in a separate process.
+        The messages are written to a log file for the partition
+        (decoimpact_<partition>.log in the log directory) and tagged with the
+        partition on the console. The log file stays open until the logger
+        is closed.
+
+        Args:
+            partition (str): name of the partition
+            log_directory (Path): directory to write the log file to
+
+        Returns:
+            Logger: created logger
+        """
+        log_file_name = str(Path(log_directory) / f"decoimpact_{partition}.log")
+        return PrefixedLogger(LoggingLogger(log_file_name), f"[{partition}] ")
@@ -13,15 +13,28 @@ Classes:
 """
 
 import logging as _log
+from pathlib import Path
+from typing import Optional
+
 from decoimpact.crosscutting.i_logger import ILogger
 
 
 class LoggingLogger(ILogger):
     """Logger implementation based on default logging library"""
 
-    def __init__(self) -> None:
+    def __init__(self, log_file_name: Optional[str] = None) -> None:
+        """Creates an instance of LoggingLogger
+
+        Args:
+            log_file_name (Optional[str]): file to write the messages to,
+                instead of the default log file (decoimpact.log)
+        """
         super().__init__()
-        self._log = self._setup_logging()
+        self._owns_handlers = log_file_name is not None
+        if log_file_name is None:
+            self._log = self._setup_logging()
+        else:
+            self._log = self._setup_file_logging(log_file_name)
 
     def log_error(self, message: str) -> None:
         """Logs an error message
@@ -55,6 +68,12 @@ class LoggingLogger(ILogger):
         """
         self._log.debug(message)
 
+    def close(self) -> None:
+        """Closes the log file of a logger with its own log file (the
+        default logger is left as it is)"""
+        if self._owns_handlers:
+            self._remove_handlers(self._log)
+
     def _setup_logging(self) -> _log.Logger:
         """Sets logging information and logger setup"""
         _log.basicConfig(
@@ -81,3 +100,31 @@ class LoggingLogger(ILogger):
         logger.addHandler(console)
 
         return _log.getLogger()
+
+    def _setup_file_logging(self, log_file_name: str) -> _log.Logger:
+        """Sets up a separate logger writing to its own log file (and the
+        console), so that processes running in parallel do not share a
+        log file"""
+        logger = _log.getLogger(f"decoimpact.{log_file_name}")
+        logger.setLevel(_log.INFO)
+        logger.propagate = False
+        self._remove_handlers(logger)
+
+        Path(log_file_name).parent.mkdir(parents=True, exist_ok=True)
+        formatter = _log.Formatter(
+            "%(asctime)s: %(levelname)-8s %(message)s", datefmt="%m-%d %H:%M:%S"
+        )
+        file_handler = _log.FileHandler(log_file_name, mode="w", encoding="utf-8")
+        file_handler.setFormatter(formatter)
+        logger.addHandler(file_handler)
+
+        console = _log.StreamHandler()
+        console.setFormatter(_log.Formatter("%(asctime)s: %(levelname)-8s %(message)s"))
+        logger.addHandler(console)
+
+        return logger
+
+    def _remove_handlers(self, logger: _log.Logger):
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            handler.close()
@@ -0,0 +1,68 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Module for PrefixedLogger class
+
+Classes:
+    PrefixedLogger
+
+"""
+
+from decoimpact.crosscutting.i_logger import ILogger
+
+
+class PrefixedLogger(ILogger):
+    """Logger that tags all messages with a prefix before passing them
+    on to another logger (used to identify the source of messages that
+    are logged in parallel)"""
+
+    def __init__(self, logger: ILogger, prefix: str) -> None:
+        """Creates an instance of PrefixedLogger
+
+        Args:
+            logger (ILogger): logger to pass the tagged messages to
+            prefix (str): prefix to add to every message
+        """
+        super().__init__()
+        self._logger = logger
+        self._prefix = prefix
+
+    def log_error(self, message: str) -> None:
+        """Logs an error message
+
+        Args:
+            message (str): message to log
+        """
+        self._logger.log_error(self._prefix + message)
+
+    def log_warning(self, message: str) -> None:
+        """Logs a warning message
+
+        Args:
+            message (str): message to log
+        """
+        self._logger.log_warning(self._prefix + message)
+
+    def log_info(self, message: str) -> None:
+        """Logs a info message
+
+        Args:
+            message (str): message to log
+        """
+        self._logger.log_info(self._prefix + message)
+
+    def log_debug(self, message: str) -> None:
+        """Logs a debug message
+
+        Args:
+            message (str): message to log
+        """
+        self._logger.log_debug(self._prefix + message)
+
+    def close(self) -> None:
+        """Releases the resources (like open log files) of the logger"""
+        self._logger.close()
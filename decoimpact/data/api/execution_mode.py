@@ -0,0 +1,20 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Module for ExecutionMode
+
+Classes:
+    ExecutionMode
+"""
+from enum import IntEnum
+
+
+class ExecutionMode(IntEnum):
+    """Classify the ways in which independent rules can be executed."""
+
+    SEQUENTIAL = 1
+    THREADS = 2
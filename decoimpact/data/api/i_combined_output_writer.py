@@ -0,0 +1,34 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Module for ICombinedOutputWriter interface
+
+Interfaces:
+    ICombinedOutputWriter
+
+"""
+
+from abc import ABC, abstractmethod
+
+import xarray as _xr
+
+
+class ICombinedOutputWriter(ABC):
+    """Interface for writing the results of all partitions of a dataset
+    into one (combined) output file"""
+
+    @abstractmethod
+    def write_partition(self, key: str, dataset: _xr.Dataset) -> None:
+        """Writes the results of a partition into the combined output file
+
+        Args:
+            key (str): key of the partition (as used for the input file)
+            dataset (_xr.Dataset): output dataset of the partition
+
+        Raises:
+            OSError: if the output file cannot be written
+        """
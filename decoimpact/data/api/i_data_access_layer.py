@@ -14,9 +14,11 @@ Interfaces:
 
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Dict
 
 import xarray as _xr
 
+from decoimpact.data.api.i_combined_output_writer import ICombinedOutputWriter
 from decoimpact.data.api.i_dataset import IDatasetData
 from decoimpact.data.api.i_model_data import IModelData
 from decoimpact.data.api.output_file_settings import OutputFileSettings
@@ -79,3 +81,26 @@ class IDataAccessLayer(ABC):
             FileExistsError: if output file location does not exist
             OSError: if output file cannot be written
         """
+
+    @abstractmethod
+    def create_combined_output_writer(
+        self,
+        path: Path,
+        partition_files: Dict[str, Path],
+        settings: OutputFileSettings,
+    ) -> ICombinedOutputWriter:
+        """Creates a writer that writes the results of all partitions of a
+        dataset into one output file
+
+        Args:
+            path (Path): path to the combined output file
+            partition_files (Dict[str, Path]): input file per partition key
+            settings (OutputFileSettings): settings to use for saving output
+
+        Returns:
+            ICombinedOutputWriter: writer for the combined output file
+
+        Raises:
+            FileExistsError: if output file location does not exist
+            NotImplementedError: if the output file type is not supported
+        """
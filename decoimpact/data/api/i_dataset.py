@@ -14,6 +14,7 @@ Interfaces:
 
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Dict, Optional, Union
 
 
 class IDatasetData(ABC):
@@ -41,6 +42,12 @@ class IDatasetData(ABC):
     def mapping(self) -> dict[str, str]:
         """Variable name mapping (source to target)"""
 
+    @property
+    @abstractmethod
+    def chunks(self) -> Optional[Union[str, Dict[str, Union[int, str]]]]:
+        """Chunk sizes per dimension (or "auto") for reading the dataset
+        lazily, None to read the dataset without chunking"""
+
     @path.setter
     def path(self, path: Path):
         """path of the model"""
@@ -18,6 +18,7 @@ from typing import List
 
 from decoimpact.data.api.i_dataset import IDatasetData
 from decoimpact.data.api.i_rule_data import IRuleData
+from decoimpact.data.api.run_settings import RunSettings
 
 
 class IModelData(ABC):
@@ -52,3 +53,8 @@ class IModelData(ABC):
     @abstractmethod
     def rules(self) -> List[IRuleData]:
         """Rules of the model"""
+
+    @property
+    @abstractmethod
+    def run_settings(self) -> RunSettings:
+        """Settings for running the model"""
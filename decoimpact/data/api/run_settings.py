@@ -0,0 +1,241 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Module for RunSettings class
+
+Classes:
+    RunSettings
+
+"""
+
+from typing import Any, Dict, Optional
+
+from decoimpact.data.api.execution_mode import ExecutionMode
+
+
+class RunSettings:
+    """settings class used to store information about how to run the model"""
+
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self) -> None:
+        """Creates an instance of RunSettings with the default settings"""
+        self._execution_mode: ExecutionMode = ExecutionMode.SEQUENTIAL
+        self._max_workers: Optional[int] = None
+        self._time_window: Optional[int] = None
+        self._workers: int = 1
+        self._combine_partitions: bool = False
+        self._cache_directory: Optional[str] = None
+        self._cache_size: int = 1024
+        self._use_cache: bool = True
+        self._clear_cache: bool = False
+        self._checkpoint_directory: Optional[str] = None
+        self._resume: bool = False
+
+    @property
+    def execution_mode(self) -> ExecutionMode:
+        """way in which independent rules are executed"""
+        return self._execution_mode
+
+    @execution_mode.setter
+    def execution_mode(self, execution_mode: ExecutionMode):
+        self._execution_mode = execution_mode
+
+    @property
+    def max_workers(self) -> Optional[int]:
+        """maximum number of workers used for parallel execution
+        (None for the default of the executor)"""
+        return self._max_workers
+
+    @max_workers.setter
+    def max_workers(self, max_workers: Optional[int]):
+        self._max_workers = max_workers
+
+    @property
+    def time_window(self) -> Optional[int]:
+        """number of time steps that are processed at once
+        (None for processing the complete time axis at once)"""
+        return self._time_window
+
+    @time_window.setter
+    def time_window(self, time_window: Optional[int]):
+        self._time_window = time_window
+
+    @property
+    def workers(self) -> int:
+        """number of processes used to process the partitions (input files)
+        of a dataset in parallel (1 for processing them one after another)"""
+        return self._workers
+
+    @workers.setter
+    def workers(self, workers: int):
+        self._workers = workers
+
+    @property
+    def combine_partitions(self) -> bool:
+        """write the results of all partitions (input files) of a dataset
+        into one output file (without the ghost cells)"""
+        return self._combine_partitions
+
+    @combine_partitions.setter
+    def combine_partitions(self, combine_partitions: bool):
+        self._combine_partitions = combine_partitions
+
+    @property
+    def cache_directory(self) -> Optional[str]:
+        """directory for caching the results of rules between runs
+        (None for not using a cache)"""
+        return self._cache_directory
+
+    @cache_directory.setter
+    def cache_directory(self, cache_directory: Optional[str]):
+        self._cache_directory = cache_directory
+
+    @property
+    def cache_size(self) -> int:
+        """maximum size of the cache (in MB), the least recently used results
+        are removed when the cache becomes larger"""
+        return self._cache_size
+
+    @cache_size.setter
+    def cache_size(self, cache_size: int):
+        self._cache_size = cache_size
+
+    @property
+    def use_cache(self) -> bool:
+        """use the cache (if a cache directory is given), false for
+        bypassing the cache"""
+        return self._use_cache
+
+    @use_cache.setter
+    def use_cache(self, use_cache: bool):
+        self._use_cache = use_cache
+
+    @property
+    def clear_cache(self) -> bool:
+        """remove all results from the cache before running"""
+        return self._clear_cache
+
+    @clear_cache.setter
+    def clear_cache(self, clear_cache: bool):
+        self._clear_cache = clear_cache
+
+    @property
+    def checkpoint_directory(self) -> Optional[str]:
+        """directory for storing the result of every completed rule
+        (None for no checkpoints)"""
+        return self._checkpoint_directory
+
+    @checkpoint_directory.setter
+    def checkpoint_directory(self, checkpoint_directory: Optional[str]):
+        self._checkpoint_directory = checkpoint_directory
+
+    @property
+    def resume(self) -> bool:
+        """skip the rules completed by an earlier run (that did not change),
+        using the results in the checkpoint directory"""
+        return self._resume
+
+    @resume.setter
+    def resume(self, resume: bool):
+        self._resume = resume
+
+    def update(self, settings: Dict[str, Any]) -> None:
+        """Updates the settings with the provided values (as given in the
+        run-settings section of the input file or on the command line).
+        Settings that are not provided keep their current value.
+
+        Args:
+            settings (Dict[str, Any]): settings to update
+
+        Raises:
+            ValueError: if a setting is unknown or has an invalid value
+        """
+        unknown_settings = set(settings) - {
+            "execution_mode",
+            "max_workers",
+            "time_window",
+            "workers",
+            "combine_partitions",
+            "cache_directory",
+            "cache_size",
+            "use_cache",
+            "clear_cache",
+            "checkpoint_directory",
+            "resume",
+        }
+        if len(unknown_settings) > 0:
+            raise ValueError(
+                f"Unknown run settings: {', '.join(sorted(unknown_settings))}"
+            )
+
+        execution_mode = settings.get("execution_mode")
+        if execution_mode is not None:
+            self._execution_mode = self._parse_execution_mode(execution_mode)
+
+        max_workers = settings.get("max_workers")
+        if max_workers is not None:
+            self._max_workers = self._parse_positive_integer("max_workers", max_workers)
+
+        time_window = settings.get("time_window")
+        if time_window is not None:
+            self._time_window = self._parse_positive_integer("time_window", time_window)
+
+        workers = settings.get("workers")
+        if workers is not None:
+            self._workers = self._parse_positive_integer("workers", workers)
+
+        combine_partitions = settings.get("combine_partitions")
+        if combine_partitions is not None:
+            self._combine_partitions = self._parse_boolean(
+                "combine_partitions", combine_partitions
+            )
+
+        cache_directory = settings.get("cache_directory")
+        if cache_directory is not None:
+            self._cache_directory = str(cache_directory)
+
+        cache_size = settings.get("cache_size")
+        if cache_size is not None:
+            self._cache_size = self._parse_positive_integer("cache_size", cache_size)
+
+        use_cache = settings.get("use_cache")
+        if use_cache is not None:
+            self._use_cache = self._parse_boolean("use_cache", use_cache)
+
+        clear_cache = settings.get("clear_cache")
+        if clear_cache is not None:
+            self._clear_cache = self._parse_boolean("clear_cache", clear_cache)
+
+        checkpoint_directory = settings.get("checkpoint_directory")
+        if checkpoint_directory is not None:
+            self._checkpoint_directory = str(checkpoint_directory)
+
+        resume = settings.get("resume")
+        if resume is not None:
+            self._resume = self._parse_boolean("resume", resume)
+
+    @staticmethod
+    def _parse_positive_integer(name: str, value: Any) -> int:
+        if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+            raise ValueError(f"{name} should be a positive integer, not '{value}'")
+        return value
+
+    @staticmethod
+    def _parse_boolean(name: str, value: Any) -> bool:
+        if not isinstance(value, bool):
+            raise ValueError(f"{name} should be true or false, not '{value}'")
+        return value
+
+    @staticmethod
+    def _parse_execution_mode(execution_mode: Any) -> ExecutionMode:
+        try:
+            return ExecutionMode[str(execution_mode).upper()]
+        except KeyError as exc:
+            options = ", ".join(mode.name.lower() for mode in ExecutionMode)
+            raise ValueError(
+                f"Unknown execution_mode '{execution_mode}', options are: {options}"
+            ) from exc
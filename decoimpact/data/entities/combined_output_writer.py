@@ -0,0 +1,343 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Module for CombinedOutputWriter class
+
+Classes:
+    CombinedOutputWriter
+
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, List, Set
+
+import numpy as _np
+import xarray as _xr
+from netCDF4 import Dataset as _NetCDFDataset  # pylint: disable=no-name-in-module
+
+from decoimpact.business.utils.dataset_utils import (
+    get_dummy_variable_in_ugrid,
+    reduce_dataset_for_writing,
+)
+from decoimpact.crosscutting.i_logger import ILogger
+from decoimpact.data.api.i_combined_output_writer import ICombinedOutputWriter
+from decoimpact.data.api.output_file_settings import OutputFileSettings
+
+_FACE_NODES_FILL_VALUE = -999
+
+
+class CombinedOutputWriter(ICombinedOutputWriter):
+    """Writes the results of all partitions of a (D-Flow FM) dataset into one
+    UGRID NetCDF file. The merged mesh is determined from the input files
+    of the partitions, leaving out the ghost cells (faces that belong to
+    another partition according to the domain number of the faces). The
+    results of every partition are written directly into their own region
+    of the face dimension, so the partitions do not need to be merged
+    afterwards."""
+
+    def __init__(
+        self,
+        path: Path,
+        partition_files: Dict[str, Path],
+        settings: OutputFileSettings,
+        logger: ILogger,
+    ):
+        """Creates a writer for the combined output of the partitions
+
+        Args:
+            path (Path): path of the combined output file
+            partition_files (Dict[str, Path]): input file per partition key
+            settings (OutputFileSettings): settings to use for saving output
+            logger (ILogger): logger for reporting messages
+        """
+        self._path = path
+        self._settings = settings
+        self._logger = logger
+        self._mesh = _MergedMesh(partition_files)
+        self._face_variables: List[str] = []
+        self._file_created = False
+
+        logger.log_info(
+            f"Combining {len(partition_files)} partitions into one mesh with "
+            f"{self._mesh.number_of_faces} faces and "
+            f"{len(self._mesh.node_x)} nodes"
+        )
+
+    def write_partition(self, key: str, dataset: _xr.Dataset) -> None:
+        """Writes the results of a partition into the combined output file,
+        the file is created when the first partition is written.
+
+        Args:
+            key (str): key of the partition (as used for the input file)
+            dataset (_xr.Dataset): output dataset of the partition
+
+        Raises:
+            OSError: if the output file cannot be written
+        """
+        self._logger.log_info(f'Writing partition "{key}" to {self._path}')
+
+        try:
+            if self._settings.variables_to_save:
+                dataset = reduce_dataset_for_writing(
+                    dataset, self._settings.variables_to_save, self._logger
+                )
+
+            if not self._file_created:
+                self._create_file(dataset)
+                self._file_created = True
+
+            self._write_face_variables(key, dataset)
+        except OSError as exc:
+            msg = f"ERROR: Cannot write output .nc file -- {self._path}"
+            self._logger.log_error(msg)
+            raise OSError(msg) from exc
+
+    def _create_file(self, dataset: _xr.Dataset):
+        """Writes the merged mesh and the variables that do not depend on
+        the mesh (like time), and defines the variables on the faces"""
+        mesh = self._mesh
+        topology_variables = mesh.get_topology_variables(dataset)
+
+        static_dataset = _xr.Dataset(
+            coords={
+                name: dataset[name]
+                for name in dataset.coords
+                if not mesh.is_located_on_mesh(dataset[name])
+            },
+            attrs=dataset.attrs,
+        )
+        static_dataset.attrs["Version"] = self._settings.application_version
+        static_dataset.attrs["Generated by"] = self._settings.application_name
+
+        skipped_variables = []
+        for name, variable in dataset.variables.items():
+            if name in static_dataset.variables:
+                continue
+
+            if not mesh.is_located_on_mesh(variable):
+                static_dataset[name] = variable
+            elif mesh.face_dimension in variable.dims:
+                if name not in (mesh.face_nodes_name, mesh.face_dimension):
+                    self._face_variables.append(str(name))
+            elif name not in topology_variables and name not in dataset.dims:
+                skipped_variables.append(str(name))
+
+        if len(skipped_variables) > 0:
+            self._logger.log_warning(
+                "Only results on the faces of the mesh are combined, skipping "
+                f"variable(s): {', '.join(skipped_variables)}"
+            )
+
+        self._add_merged_mesh(static_dataset, dataset)
+        static_dataset.to_netcdf(self._path, format="NETCDF4")
+
+        variables, _ = _encode_variables(dataset[self._face_variables])
+        with _NetCDFDataset(self._path, "a") as output_file:
+            for name in self._face_variables:
+                _define_variable(output_file, name, variables[name], dataset.sizes)
+
+    def _add_merged_mesh(self, static_dataset: _xr.Dataset, dataset: _xr.Dataset):
+        mesh = self._mesh
+
+        mesh_attributes = {
+            key: value
+            for key, value in dataset[mesh.name].attrs.items()
+            if not key.startswith("edge_")
+        }
+        static_dataset[mesh.name] = _xr.DataArray(
+            dataset[mesh.name].values, attrs=mesh_attributes
+        )
+
+        for name, values in zip(mesh.node_coordinate_names, [mesh.node_x, mesh.node_y]):
+            attributes = dataset[name].attrs if name in dataset else {}
+            static_dataset.coords[name] = _xr.DataArray(
+                values, dims=[mesh.node_dimension], attrs=attributes
+            )
+
+        face_nodes = _xr.DataArray(
+            _np.where(mesh.face_nodes >= 0, mesh.face_nodes, _np.nan),
+            dims=[mesh.face_dimension, mesh.max_face_nodes_dimension],
+            attrs=dataset[mesh.face_nodes_name].attrs,
+        )
+        face_nodes.encoding = {"_FillValue": _FACE_NODES_FILL_VALUE, "dtype": "int32"}
+        static_dataset[mesh.face_nodes_name] = face_nodes
+
+        # index coordinates are numbered for the merged mesh
+        for dimension, size in [
+            (mesh.face_dimension, mesh.number_of_faces),
+            (mesh.node_dimension, len(mesh.node_x)),
+        ]:
+            if dimension in dataset.indexes:
+                static_dataset.coords[dimension] = _np.arange(size)
+
+    def _write_face_variables(self, key: str, dataset: _xr.Dataset):
+        mesh = self._mesh
+        face_indices = mesh.face_indices[key]
+        first_face = mesh.face_offsets[key]
+        region = slice(first_face, first_face + len(face_indices))
+
+        variables, _ = _encode_variables(dataset[self._face_variables])
+        with _NetCDFDataset(self._path, "a") as output_file:
+            for name in self._face_variables:
+                variable = variables[name]
+                face_axis = variable.dims.index(mesh.face_dimension)
+
+                index = [slice(None)] * len(variable.dims)
+                index[face_axis] = region
+                output_file[name][tuple(index)] = _np.take(
+                    variable.values, face_indices, axis=face_axis
+                )
+
+
+class _MergedMesh:
+    """Mesh (2D UGRID topology) combining the faces of all partitions,
+    without the ghost cells. The faces are ordered per partition (in the
+    order of the partition keys) and nodes shared by partitions are merged."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, partition_files: Dict[str, Path]):
+        self.face_indices: Dict[str, _np.ndarray] = {}
+        self.face_offsets: Dict[str, int] = {}
+        self.number_of_faces = 0
+
+        node_coordinates = []
+        partition_face_nodes = []
+
+        for key in sorted(partition_files):
+            with _xr.open_dataset(partition_files[key]) as dataset:
+                self._read_topology_names(dataset)
+                face_indices = self._get_own_faces(dataset, key)
+                face_nodes = self._get_face_nodes(dataset)[face_indices]
+                node_x = dataset[self.node_coordinate_names[0]].values
+                node_y = dataset[self.node_coordinate_names[1]].values
+
+            # only keep the nodes used by the faces of the partition
+            used_nodes = _np.unique(face_nodes[face_nodes >= 0])
+            local_to_used = _np.full(len(node_x), -1)
+            local_to_used[used_nodes] = _np.arange(len(used_nodes))
+            face_nodes = _np.where(face_nodes >= 0, local_to_used[face_nodes], -1)
+
+            self.face_indices[key] = face_indices
+            self.face_offsets[key] = self.number_of_faces
+            self.number_of_faces += len(face_indices)
+
+            node_coordinates.append(
+                _np.column_stack([node_x[used_nodes], node_y[used_nodes]])
+            )
+            partition_face_nodes.append(face_nodes)
+
+        self._merge_nodes(node_coordinates, partition_face_nodes)
+
+    def is_located_on_mesh(self, variable: _xr.Variable) -> bool:
+        """Checks if the variable is located on the faces, edges or nodes"""
+        return any(dim in self._mesh_dimensions for dim in variable.dims)
+
+    def get_topology_variables(self, dataset: _xr.Dataset) -> Set[str]:
+        """Gets the names of the variables referred to by the mesh topology"""
+        names = " ".join(str(value) for value in dataset[self.name].attrs.values())
+        return {name for name in names.split() if name in dataset.variables}
+
+    def _read_topology_names(self, dataset: _xr.Dataset):
+        meshes = [
+            name
+            for name in get_dummy_variable_in_ugrid(dataset)
+            if dataset[name].attrs.get("topology_dimension") == 2
+        ]
+        if len(meshes) != 1:
+            raise ValueError(
+                "Combining partitions is only supported for datasets with "
+                "one 2D mesh."
+            )
+
+        attributes = dataset[meshes[0]].attrs
+        self.name = meshes[0]
+        self.face_dimension = attributes["face_dimension"]
+        self.node_dimension = attributes["node_dimension"]
+        self.face_nodes_name = attributes["face_node_connectivity"]
+        self.max_face_nodes_dimension = dataset[self.face_nodes_name].dims[1]
+        self.node_coordinate_names = attributes["node_coordinates"].split()
+        self._mesh_dimensions = {
+            self.face_dimension,
+            self.node_dimension,
+            attributes.get("edge_dimension"),
+        }
+
+    def _get_own_faces(self, dataset: _xr.Dataset, key: str) -> _np.ndarray:
+        """Gets the indices of the faces that belong to the partition
+        (leaving out the ghost cells)"""
+        domain_name = f"{self.name}_flowelem_domain"
+        number_of_faces = dataset.sizes[self.face_dimension]
+        if domain_name not in dataset:
+            return _np.arange(number_of_faces)
+
+        numbers = re.findall(r"\d+", key)
+        if len(numbers) == 0:
+            raise ValueError(
+                f'Could not determine the domain number of partition "{key}".'
+            )
+
+        return _np.flatnonzero(dataset[domain_name].values == int(numbers[-1]))
+
+    def _get_face_nodes(self, dataset: _xr.Dataset) -> _np.ndarray:
+        """Gets the (0-based) face node connectivity, using -1 for no node"""
+        face_nodes = dataset[self.face_nodes_name]
+        start_index = int(face_nodes.attrs.get("start_index", 0))
+        values = face_nodes.values
+        return _np.where(_np.isnan(values), -1, values - start_index).astype(int)
+
+    def _merge_nodes(
+        self, node_coordinates: List[_np.ndarray], face_nodes: List[_np.ndarray]
+    ):
+        """Merges the nodes of the partitions (nodes with the same coordinates
+        are shared by partitions) keeping the order of the first occurrence"""
+        all_coordinates = _np.concatenate(node_coordinates)
+        _, first_indices, inverse = _np.unique(
+            all_coordinates, axis=0, return_index=True, return_inverse=True
+        )
+        order = _np.argsort(first_indices)
+        new_index = _np.empty(len(order), dtype=int)
+        new_index[order] = _np.arange(len(order))
+        global_nodes = new_index[inverse.ravel()]
+
+        merged_face_nodes = []
+        offset = 0
+        for coordinates, partition_face_nodes in zip(node_coordinates, face_nodes):
+            nodes = global_nodes[offset : offset + len(coordinates)]
+            merged_face_nodes.append(
+                _np.where(partition_face_nodes >= 0, nodes[partition_face_nodes], -1)
+            )
+            offset += len(coordinates)
+
+        unique_coordinates = all_coordinates[_np.sort(first_indices)]
+        self.node_x = unique_coordinates[:, 0]
+        self.node_y = unique_coordinates[:, 1]
+        self.face_nodes = _np.concatenate(merged_face_nodes)
+
+
+def _encode_variables(dataset: _xr.Dataset):
+    """Encodes the variables the same way as when writing them with xarray"""
+    variables, attributes = _xr.conventions.encode_dataset_coordinates(dataset)
+    return _xr.conventions.cf_encoder(variables, attributes)
+
+
+def _define_variable(
+    output_file: _NetCDFDataset, name: str, variable: _xr.Variable, sizes
+):
+    """Defines a (face) variable in the output file, sizes of dimensions that
+    are not yet defined are taken from the dataset"""
+    for dimension in variable.dims:
+        if dimension not in output_file.dimensions:
+            output_file.createDimension(dimension, sizes[dimension])
+
+    attributes = dict(variable.attrs)
+    fill_value = attributes.pop("_FillValue", None)
+    nc_variable = output_file.createVariable(
+        name, variable.dtype, variable.dims, fill_value=fill_value
+    )
+    nc_variable.setncatts(attributes)
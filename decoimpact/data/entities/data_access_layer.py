@@ -14,18 +14,21 @@ Classes:
 
 import re
 from datetime import datetime
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict
 
 import xarray as _xr
 import yaml as _yaml
 
 from decoimpact.business.utils.dataset_utils import reduce_dataset_for_writing
 from decoimpact.crosscutting.i_logger import ILogger
+from decoimpact.data.api.i_combined_output_writer import ICombinedOutputWriter
 from decoimpact.data.api.i_data_access_layer import IDataAccessLayer
 from decoimpact.data.api.i_dataset import IDatasetData
 from decoimpact.data.api.i_model_data import IModelData
 from decoimpact.data.api.output_file_settings import OutputFileSettings
+from decoimpact.data.entities.combined_output_writer import CombinedOutputWriter
 from decoimpact.data.entities.model_data_builder import ModelDataBuilder
 
 
@@ -123,10 +126,20 @@ class DataAccessLayer(IDataAccessLayer):
                           Currently only UGrid (NetCDF) files are supported."""
             raise NotImplementedError(message)
 
-        # open input dataset (from .nc file)
+        # open input dataset (from .nc file), lazily (dask) when chunks are given
+        if dataset_data.chunks is not None:
+            if find_spec("dask") is None:
+                raise ValueError(
+                    f"ERROR: reading {dataset_data.path} with chunks requires "
+                    "dask to be installed (pip install decoimpact[dask])"
+                )
+            self._logger.log_info(
+                f"Reading dataset {dataset_data.path} lazily with chunks "
+                f"{dataset_data.chunks}"
+            )
         try:
             dataset: _xr.Dataset = _xr.open_dataset(
-                dataset_data.path, mask_and_scale=True
+                dataset_data.path, mask_and_scale=True, chunks=dataset_data.chunks
             )
             # mask_and_scale argument is needed to prevent inclusion of NaN's
             # in dataset for missing values. This inclusion converts integers
@@ -164,20 +177,7 @@ class DataAccessLayer(IDataAccessLayer):
             OSError: if output file cannot be written
         """
         self._logger.log_info(f"Writing model output data to {path}")
-
-        if not Path.exists(path.parent):
-            # try to make intermediate folders
-            Path(path.parent).mkdir(parents=True, exist_ok=True)
-
-            if not Path.exists(path.parent):
-                message = f"""The path {path.parent} is not found. \
-                            Make sure the output file location is valid."""
-                raise FileExistsError(message)
-
-        if Path(path).suffix != ".nc":
-            message = f"""The file {path} is not supported. \
-                          Currently only UGrid (NetCDF) files are supported."""
-            raise NotImplementedError(message)
+        self._check_output_path(path)
 
         try:
             dataset.attrs["Version"] = settings.application_version
@@ -200,6 +200,32 @@ class DataAccessLayer(IDataAccessLayer):
             self._logger.log_error(msg)
             raise OSError(msg) from exc
 
+    def create_combined_output_writer(
+        self,
+        path: Path,
+        partition_files: Dict[str, Path],
+        settings: OutputFileSettings,
+    ) -> ICombinedOutputWriter:
+        """Creates a writer that writes the results of all partitions of a
+        dataset into one output file (without the ghost cells)
+
+        Args:
+            path (Path): path to the combined output file
+            partition_files (Dict[str, Path]): input file per partition key
+            settings (OutputFileSettings): settings to use for saving output
+
+        Returns:
+            ICombinedOutputWriter: writer for the combined output file
+
+        Raises:
+            FileExistsError: if output file location does not exist
+            NotImplementedError: if the output file type is not supported
+        """
+        self._logger.log_info(f"Combining the output of the partitions in {path}")
+        self._check_output_path(path)
+
+        return CombinedOutputWriter(path, partition_files, settings, self._logger)
+
     def yaml_include_constructor(self, loader: _yaml.Loader, node: _yaml.Node) -> Any:
         """constructor function to make !include (referencedfile) possible"""
 
@@ -240,3 +266,19 @@ class DataAccessLayer(IDataAccessLayer):
         )
 
         return loader
+
+    @staticmethod
+    def _check_output_path(path: Path):
+        if not Path.exists(path.parent):
+            # try to make intermediate folders
+            Path(path.parent).mkdir(parents=True, exist_ok=True)
+
+            if not Path.exists(path.parent):
+                message = f"""The path {path.parent} is not found. \
+                            Make sure the output file location is valid."""
+                raise FileExistsError(message)
+
+        if Path(path).suffix != ".nc":
+            message = f"""The file {path} is not supported. \
+                          Currently only UGrid (NetCDF) files are supported."""
+            raise NotImplementedError(message)
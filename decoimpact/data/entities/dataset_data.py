@@ -13,7 +13,7 @@ Classes:
 """
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict, Optional, Union
 
 from decoimpact.data.api.i_dataset import IDatasetData
 from decoimpact.data.dictionary_utils import get_dict_element
@@ -32,6 +32,7 @@ class DatasetData(IDatasetData):
         self._start_date = str(get_dict_element("start_date", dataset, False))
         self._end_date = str(get_dict_element("end_date", dataset, False))
         self._get_mapping(dataset)
+        self._chunks = self._get_chunks(dataset)
 
     @property
     def path(self) -> Path:
@@ -55,6 +56,12 @@ class DatasetData(IDatasetData):
         """Variable name mapping (source to target)"""
         return self._mapping
 
+    @property
+    def chunks(self) -> Optional[Union[str, Dict[str, Union[int, str]]]]:
+        """optional chunk sizes per dimension (or "auto") for reading
+        the dataset lazily"""
+        return self._chunks
+
     @path.setter
     def path(self, path: Path):
         """path of the model"""
@@ -67,3 +74,31 @@ class DatasetData(IDatasetData):
             dataset (dict[str, Any]):
         """
         self._mapping = get_dict_element("variable_mapping", dataset, False)
+
+    def _get_chunks(
+        self, dataset: dict[str, Any]
+    ) -> Optional[Union[str, Dict[str, Union[int, str]]]]:
+        """Get chunking specified in input file
+
+        Args:
+            dataset (dict[str, Any]):
+
+        Raises:
+            ValueError: if the chunks are not "auto" or a dictionary with
+                        a size (or "auto") per dimension
+        """
+        chunks = get_dict_element("chunks", dataset, False)
+        if chunks is None or chunks == "auto":
+            return chunks
+
+        if isinstance(chunks, dict) and all(
+            isinstance(dim, str)
+            and (size == "auto" or (isinstance(size, int) and size >= -1))
+            for dim, size in chunks.items()
+        ):
+            return chunks
+
+        raise ValueError(
+            f"Invalid chunks '{chunks}' for dataset {self._path}: use 'auto' or "
+            "a chunk size per dimension (-1 for the full dimension)"
+        )
@@ -15,6 +15,7 @@ from decoimpact.crosscutting.i_logger import ILogger
 from decoimpact.data.api.i_dataset import IDatasetData
 from decoimpact.data.api.i_model_data import IModelData
 from decoimpact.data.api.i_rule_data import IRuleData
+from decoimpact.data.api.run_settings import RunSettings
 from decoimpact.data.dictionary_utils import get_dict_element
 from decoimpact.data.entities.dataset_data import DatasetData
 from decoimpact.data.entities.yaml_model_data import YamlModelData
@@ -45,12 +46,14 @@ class ModelDataBuilder:
         output_path = self._parse_output_dataset(contents)
         output_variables = self._parse_save_only_variables(contents)
         rules = list(self._parse_rules(contents))
+        run_settings = self._parse_run_settings(contents)
 
         model_data = YamlModelData("Model 1", input_version)
         model_data.datasets = input_datasets
         model_data.output_path = output_path
         model_data.output_variables = list(output_variables)
         model_data.rules = rules
+        model_data.run_settings = run_settings
         return model_data
 
     def _parse_input_version(self, contents: dict[Any, Any]) -> Optional[List[int]]:
@@ -98,6 +101,14 @@ class ModelDataBuilder:
 
         return save_only_variables
 
+    def _parse_run_settings(self, contents: dict[str, Any]) -> RunSettings:
+        run_settings = RunSettings()
+
+        # the run-settings section is optional
+        run_settings.update(contents.get("run-settings") or {})
+
+        return run_settings
+
     def _parse_rules(self, contents: dict[str, Any]) -> Iterable[IRuleData]:
         rules: List[dict[str, Any]] = get_dict_element("rules", contents)
 
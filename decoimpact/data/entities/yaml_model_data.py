@@ -18,6 +18,7 @@ from typing import List
 from decoimpact.data.api.i_dataset import IDatasetData
 from decoimpact.data.api.i_model_data import IModelData
 from decoimpact.data.api.i_rule_data import IRuleData
+from decoimpact.data.api.run_settings import RunSettings
 
 
 class YamlModelData(IModelData):
@@ -30,6 +31,7 @@ class YamlModelData(IModelData):
         self._output_path = Path("")
         self._output_variables = []
         self._rules = []
+        self._run_settings = RunSettings()
 
     @property
     def name(self) -> str:
@@ -76,3 +78,12 @@ class YamlModelData(IModelData):
     @rules.setter
     def rules(self, rules: List[IRuleData]):
         self._rules = rules
+
+    @property
+    def run_settings(self) -> RunSettings:
+        """Settings for running the model"""
+        return self._run_settings
+
+    @run_settings.setter
+    def run_settings(self, run_settings: RunSettings):
+        self._run_settings = run_settings
@@ -8,20 +8,24 @@
 
 
 from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
 
 from decoimpact.business.application import Application
 from decoimpact.business.utils.command_line_utils import read_command_line_arguments
+from decoimpact.business.workflow.i_model_builder import IModelBuilder
 from decoimpact.business.workflow.model_builder import ModelBuilder
 from decoimpact.crosscutting.i_logger import ILogger
 from decoimpact.crosscutting.logger_factory import LoggerFactory
 from decoimpact.data.entities.data_access_layer import DataAccessLayer, IDataAccessLayer
 
 
-def main(path: Path):
+def main(path: Path, run_settings: Optional[Dict[str, Any]] = None):
     """Main function to run the application when running via command-line
 
     Args:
         input_path (Path): path to the input file
+        run_settings (Optional[Dict[str, Any]]): run settings overriding the
+            ones in the input file
     """
 
     # configure logger and data-access layer
@@ -30,10 +34,30 @@ def main(path: Path):
     model_builder = ModelBuilder(da_layer, logger)
 
     # create and run application
-    application = Application(logger, da_layer, model_builder)
-    application.run(path)
+    application = Application(
+        logger, da_layer, model_builder, create_partition_components
+    )
+    application.run(path, run_settings)
+
+
+def create_partition_components(
+    partition: str, log_directory: Path
+) -> Tuple[ILogger, IDataAccessLayer, IModelBuilder]:
+    """Creates the logger, data-access layer and model builder for processing
+    a partition in a separate process
+
+    Args:
+        partition (str): name of the partition
+        log_directory (Path): directory for the log file of the partition
+
+    Returns:
+        Tuple[ILogger, IDataAccessLayer, IModelBuilder]: created components
+    """
+    logger = LoggerFactory.create_partition_logger(partition, log_directory)
+    da_layer = DataAccessLayer(logger)
+    return logger, da_layer, ModelBuilder(da_layer, logger)
 
 
 if __name__ == "__main__":
-    input_path = read_command_line_arguments()
-    main(input_path)
+    input_path, command_line_run_settings = read_command_line_arguments()
+    main(input_path, command_line_run_settings)
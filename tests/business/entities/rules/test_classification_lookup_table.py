@@ -0,0 +1,88 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Tests for ClassificationLookupTable class
+"""
+
+import numpy as np
+
+from decoimpact.business.entities.rules.classification_lookup_table import (
+    ClassificationLookupTable,
+)
+from decoimpact.business.entities.rules.criteria_interval import CriteriaInterval
+
+
+def _create_lookup_table(criteria_table):
+    criteria_intervals = [
+        [CriteriaInterval.from_criterion(criterion) for criterion in criteria]
+        for column_name, criteria in criteria_table.items()
+        if column_name != "output"
+    ]
+    return ClassificationLookupTable.create(
+        criteria_intervals, criteria_table["output"]
+    )
+
+
+def test_classify_grid_of_classes():
+    """A grid of (non overlapping) classes per column should be looked up,
+    using the first row for duplicate combinations"""
+
+    # Arrange
+    lookup_table = _create_lookup_table(
+        {
+            "output": [1, 2, 3, 4, 5, 6, 7],
+            "salinity": ["<5", "<5", "5:10", "5:10", ">10", ">10", "<5"],
+            "depth": ["<=1", ">1", "<=1", ">1", "<=1", ">1", ">1"],
+            "temperature": ["-", "-", "-", "-", "-", "-", "-"],
+        }
+    )
+    salinity = np.array([1, 1, 5, 10, 10.5, 20, np.nan, 7])
+    depth = np.array([1, 2, 0, 3, -1, np.inf, 1, np.nan])
+    temperature = np.full(salinity.shape, np.nan)
+
+    # Act
+    assert lookup_table is not None
+    result = lookup_table.classify([salinity, depth, temperature])
+
+    # Assert
+    np.testing.assert_array_equal(result, [1, 2, 3, 4, 5, 6, np.nan, np.nan])
+
+
+def test_classify_values_outside_all_classes():
+    """Values in a gap between the classes should not be classified"""
+
+    # Arrange
+    lookup_table = _create_lookup_table(
+        {"output": [1, 2, 3], "depth": ["0:1", 2, ">3"]}
+    )
+
+    # Act
+    assert lookup_table is not None
+    result = lookup_table.classify([np.array([0, 1.5, 2, 3, 3.5, -1])])
+
+    # Assert
+    np.testing.assert_array_equal(result, [1, np.nan, 2, np.nan, 3, np.nan])
+
+
+def test_no_lookup_table_for_overlapping_criteria():
+    """Overlapping criteria within a column can not be looked up"""
+
+    # Act
+    overlapping_ranges = _create_lookup_table(
+        {"output": [1, 2], "depth": ["0:2", "1:3"]}
+    )
+    overlapping_bounds = _create_lookup_table(
+        {"output": [1, 2], "depth": ["<=2", ">=2"]}
+    )
+    not_applicable_and_range = _create_lookup_table(
+        {"output": [1, 2], "depth": ["-", "1:3"]}
+    )
+
+    # Assert
+    assert overlapping_ranges is None
+    assert overlapping_bounds is None
+    assert not_applicable_and_range is None
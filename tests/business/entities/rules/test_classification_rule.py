@@ -77,3 +77,58 @@ def test_execute_classification():
 
     # assert
     assert _xr.testing.assert_equal(test_result, expected_result) is None
+
+
+def test_execute_classification_on_chunked_arrays():
+    """Test that chunked (lazy) arrays are classified lazily, with the same
+    result (first matching row) for every cell"""
+
+    # test data
+    criteria_test_table = {
+        "output": [1, 2, 3],
+        "water_depth": ["<1", ">=1", "-"],
+        "salinity": ["<5", "-", "-"],
+    }
+
+    # arrange
+    logger = Mock(ILogger)
+    rule = ClassificationRule("test", ["water_depth", "salinity"], criteria_test_table)
+    test_data = {
+        "water_depth": _xr.DataArray([0.5, 0.5, 2, float("nan")]).chunk(2),
+        "salinity": _xr.DataArray([1, 6, 1, 1]).chunk(2),
+    }
+
+    # act
+    test_result = rule.execute(test_data, logger)
+
+    # assert
+    assert test_result.chunks is not None
+    expected_result = _xr.DataArray([1.0, 3.0, 2.0, 3.0])
+    assert _xr.testing.assert_equal(test_result.compute(), expected_result) is None
+
+
+def test_execute_classification_with_overlapping_criteria():
+    """Test that tables with overlapping criteria (that can not be classified
+    with a lookup table) give the output of the first matching row"""
+
+    # test data
+    criteria_test_table = {
+        "output": [1, 2, 3],
+        "water_depth": ["0:2", "1:3", ">=0"],
+        "salinity": ["-", "<5", "-"],
+    }
+
+    # arrange
+    logger = Mock(ILogger)
+    rule = ClassificationRule("test", ["water_depth", "salinity"], criteria_test_table)
+    test_data = {
+        "water_depth": _xr.DataArray([1.5, 2.5, 2.5, 4, -1]),
+        "salinity": _xr.DataArray([1, 1, 6, 1, 1]),
+    }
+
+    # act
+    test_result = rule.execute(test_data, logger)
+
+    # assert
+    expected_result = _xr.DataArray([1.0, 2.0, 3.0, 3.0, float("nan")])
+    assert _xr.testing.assert_equal(test_result, expected_result) is None
@@ -8,6 +8,7 @@
 Tests for RuleBase class
 """
 
+import pickle
 from typing import List
 from unittest.mock import Mock
 
@@ -242,3 +243,56 @@ def test_dims_present_in_result():
     # Assert
     # _xr.testing.assert_equal(obtained_result.dims, xarray_data[0].dims)
     assert obtained_result.dims == xarray_data[0].dims
+
+
+@pytest.mark.parametrize("ignore_nan", [False, True])
+@pytest.mark.parametrize("operation", list(MultiArrayOperationType))
+def test_operations_on_chunked_arrays_stay_lazy(
+    operation: MultiArrayOperationType, ignore_nan: bool
+):
+    """Chunked (lazily read) input arrays should give a chunked result, equal
+    to the result for the loaded arrays"""
+    # Arrange
+    logger = Mock(ILogger)
+    dict_vars = {
+        "var1_name": _xr.DataArray([[20, 7, 3], [1, _np.nan, 2]], dims=["x", "y"]),
+        "var2_name": _xr.DataArray([[4, 5, 6], [_np.nan, _np.nan, 8]], dims=["x", "y"]),
+        "var3_name": _xr.DataArray([[15, 12, 24], [3, _np.nan, 1]], dims=["x", "y"]),
+    }
+    rule = CombineResultsRule(
+        "test_name", list(dict_vars), operation, ignore_nan=ignore_nan
+    )
+    expected_result = rule.execute(dict_vars, logger)
+
+    # Act
+    obtained_result = rule.execute(
+        {name: array.chunk({"x": 1}) for name, array in dict_vars.items()}, logger
+    )
+
+    # Assert
+    assert obtained_result.chunks is not None
+    _xr.testing.assert_identical(obtained_result.compute(), expected_result)
+
+
+def test_pickled_rule_gives_same_result():
+    """Test if a pickled rule (sent to the process of a partition) can still
+    be executed, giving the same result"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    rule = CombineResultsRule(
+        "test", ["var1", "var2"], MultiArrayOperationType.ADD, ignore_nan=True
+    )
+    value_arrays = {
+        "var1": _xr.DataArray([1.0, _np.nan, 3.0]),
+        "var2": _xr.DataArray([4.0, 5.0, 6.0]),
+    }
+
+    # Act
+    pickled_rule = pickle.loads(pickle.dumps(rule))
+
+    # Assert
+    assert pickled_rule.validate(logger)
+    _xr.testing.assert_equal(
+        pickled_rule.execute(value_arrays, logger), rule.execute(value_arrays, logger)
+    )
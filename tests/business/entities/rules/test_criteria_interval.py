@@ -0,0 +1,61 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Tests for CriteriaInterval class
+"""
+
+import numpy as np
+import pytest
+
+from decoimpact.business.entities.rules.criteria_interval import CriteriaInterval
+
+values = np.array([-np.inf, 0.0, 2.0, 3.0, 4.0, 5.0, np.inf, np.nan])
+
+
+@pytest.mark.parametrize(
+    "criterion, expected_result",
+    [
+        (3, [False, False, False, True, False, False, False, False]),
+        ("3", [False, False, False, True, False, False, False, False]),
+        ("2:4", [False, False, True, True, True, False, False, False]),
+        (">3", [False, False, False, False, True, True, True, False]),
+        (">=3", [False, False, False, True, True, True, True, False]),
+        ("<3", [True, True, True, False, False, False, False, False]),
+        ("<=3", [True, True, True, True, False, False, False, False]),
+    ],
+)
+def test_criteria_interval_from_criterion(criterion, expected_result):
+    """The interval should contain the values that meet the criterion"""
+
+    # Act
+    interval = CriteriaInterval.from_criterion(criterion)
+
+    # Assert
+    assert interval is not None
+    assert list(interval.contains(values)) == expected_result
+
+
+@pytest.mark.parametrize("criterion", ["-", " "])
+def test_criteria_interval_not_applicable(criterion):
+    """No interval should be created for a criterion that is not applicable"""
+
+    # Act & Assert
+    assert CriteriaInterval.from_criterion(criterion) is None
+
+
+def test_criteria_intervals_with_same_bounds_are_equal():
+    """Intervals of equivalent criteria should be equal (and have the same hash)"""
+
+    # Act
+    interval_1 = CriteriaInterval.from_criterion("3:5")
+    interval_2 = CriteriaInterval.from_criterion(" 3 : 5")
+    interval_3 = CriteriaInterval.from_criterion(">3")
+
+    # Assert
+    assert interval_1 == interval_2
+    assert hash(interval_1) == hash(interval_2)
+    assert interval_1 != interval_3
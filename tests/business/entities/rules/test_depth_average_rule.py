@@ -172,3 +172,78 @@ def test_dimension_error():
         "The number of interfaces should be number of layers + 1. Number of "
         "interfaces = 5. Number of layers = 2."
     )
+
+
+def test_depth_average_rule_does_not_change_input_and_supports_chunks():
+    """The interface depths should not be changed and chunked (lazy) input
+    should give the same result, calculated per block of cells"""
+    logger = Mock(ILogger)
+    rule = DepthAverageRule(
+        name="test",
+        input_variable_names=["foo",
+                              "mesh2d_flowelem_bl",
+                              "mesh2d_s1",
+                              "mesh2d_interface_z"],
+    )
+
+    value_arrays = {
+        "var_3d": _xr.DataArray(
+            _np.tile(_np.arange(4, 0, -1), (2, 4, 1)),
+            dims=["time", "mesh2d_nFaces", "mesh2d_nLayers"],
+        ).chunk({"mesh2d_nFaces": 2}),
+        "mesh2d_flowelem_bl": _xr.DataArray(
+            _np.array([-10, -5, -10, -5]), dims=["mesh2d_nFaces"]
+        ),
+        "mesh2d_s1": _xr.DataArray(
+            _np.array([[0, 0, -1.5, -1.5], [0, -6, 5, -5]]),
+            dims=["time", "mesh2d_nFaces"],
+        ),
+        "mesh2d_interface_z": _xr.DataArray(
+            _np.array([-10, -6, -3, -1, 0]), dims=["mesh2d_nInterfaces"]
+        ),
+    }
+
+    depth_average = rule.execute(value_arrays, logger)
+
+    result_array = _xr.DataArray(
+        [[3.0, 2.2, 3.29411765, 2.57142857], [3.0, _np.nan, 2.33333, _np.nan]],
+        dims=["time", "mesh2d_nFaces"],
+    )
+
+    assert depth_average.chunks is not None
+    assert list(value_arrays["mesh2d_interface_z"].values) == [-10, -6, -3, -1, 0]
+    _xr.testing.assert_allclose(depth_average.compute(), result_array, atol=1e-05)
+
+
+def test_depth_average_rule_with_interface_depths_per_face():
+    """Interface depths can differ per face (for example for sigma layers)"""
+    logger = Mock(ILogger)
+    rule = DepthAverageRule(
+        name="test",
+        input_variable_names=["foo",
+                              "mesh2d_flowelem_bl",
+                              "mesh2d_s1",
+                              "mesh2d_interface_sigma_z"],
+    )
+
+    value_arrays = {
+        "var_3d": _xr.DataArray(
+            _np.array([[[1, 3], [2, 4]]]),
+            dims=["time", "mesh2d_nFaces", "mesh2d_nLayers"],
+        ),
+        "mesh2d_flowelem_bl": _xr.DataArray(
+            _np.array([-4, -2]), dims=["mesh2d_nFaces"]
+        ),
+        "mesh2d_s1": _xr.DataArray(_np.array([[0, 0]]), dims=["time", "mesh2d_nFaces"]),
+        "mesh2d_interface_sigma_z": _xr.DataArray(
+            _np.array([[-4, -1, 0], [-2, -1, 0]]),
+            dims=["mesh2d_nFaces", "mesh2d_nInterfaces"],
+        ),
+    }
+
+    depth_average = rule.execute(value_arrays, logger)
+
+    # face 0: layers of 3 and 1 m, face 1: layers of 1 and 1 m
+    result_array = _xr.DataArray([[1.5, 3.0]], dims=["time", "mesh2d_nFaces"])
+
+    _xr.testing.assert_allclose(depth_average, result_array)
@@ -359,3 +359,10 @@ def test_filter_extremes_rule(
     assert (
         _xr.testing.assert_allclose(filter_extremes, result_array, atol=1e-08) is None
     )
+
+    # lazily read (chunked) input should give the same result
+    filter_extremes_chunked = rule.execute(value_array.chunk({"time": 2}), logger)
+    assert filter_extremes_chunked.chunks is not None
+    _xr.testing.assert_allclose(
+        filter_extremes_chunked.compute(), result_array, atol=1e-08
+    )
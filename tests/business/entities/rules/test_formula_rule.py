@@ -10,8 +10,10 @@ Tests for RuleBase class
 
 
 import math
+import pickle
 from unittest.mock import Mock
 
+import numpy
 import pytest
 
 from decoimpact.business.entities.rules.formula_rule import FormulaRule
@@ -182,3 +184,185 @@ def test_validate_of_invalid_python_code(formula: str, expected_output_value: bo
 
     # Assert
     assert result == expected_output_value
+
+
+@pytest.mark.parametrize(
+    "formula",
+    [
+        "foo + bar",
+        "foo > bar",
+        "-999 if(foo <= 0.10) else bar",
+        "0 if(foo <= 0.10) else (1 if(foo <= 1.00) else 2)",
+        "math.sqrt(foo) if foo >= 0 else bar",
+        "foo > 0 and bar > 0",
+        "foo * math.isqrt(9)",
+    ],
+)
+def test_execute_array_gives_same_results_as_execute(formula: str):
+    """Test that calculating the formula on arrays gives the same result as
+    calculating it for every cell"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    rule = FormulaRule("test", ["foo", "bar"], formula)
+    foo = numpy.array([-1.5, 0.0, 0.05, 0.5, 1.0, 2.5, numpy.nan])
+    bar = numpy.array([3.0, -2.0, 1.0, 0.25, 1.0, 7.0, 1.0])
+
+    expected = [
+        rule.execute({"foo": foo_value, "bar": bar_value}, logger)
+        for foo_value, bar_value in zip(foo, bar)
+    ]
+
+    # Act
+    result = rule.execute_array({"foo": foo, "bar": bar}, logger)
+
+    # Assert
+    assert rule.can_execute_array
+    assert numpy.array_equal(result, expected, equal_nan=True)
+
+
+def test_execute_array_gives_same_error_as_execute_for_negative_sqrt():
+    """Test that calculating the formula on arrays raises the same error as
+    calculating it for every cell, where numpy would silently give NaN"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    rule = FormulaRule("test", ["depth"], "math.sqrt(depth)")
+    depth = numpy.array([4.0, -1.0, numpy.nan])
+
+    # Act
+    with pytest.raises(ValueError) as exc_info:
+        rule.execute_array({"depth": depth}, logger)
+
+    with pytest.raises(ValueError) as cell_exc_info:
+        rule.execute({"depth": depth[1]}, logger)
+
+    # Assert
+    assert str(exc_info.value) == str(cell_exc_info.value)
+
+
+def test_execute_array_gives_same_non_finite_results_as_execute():
+    """Test that non-finite results of the array based calculation for finite
+    inputs are the same as calculating the formula for these cells"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    rule = FormulaRule("test", ["depth", "offset"], "numpy.log(depth) + offset")
+    depth = numpy.array([[1.0, 0.0], [numpy.nan, 2.0]])
+    offset = numpy.array([1.0, 2.0])
+
+    # Act
+    result = rule.execute_array({"depth": depth, "offset": offset}, logger)
+
+    # Assert
+    assert numpy.array_equal(
+        result, [[1.0, -numpy.inf], [numpy.nan, numpy.log(2.0) + 2.0]], equal_nan=True
+    )
+
+
+@pytest.mark.parametrize(
+    "formula, expected_result",
+    [
+        ("numpy.nan if depth < 0 else depth * 2", [numpy.nan, 0.0, 4.0]),
+        ("math.sqrt(depth) if depth >= 0 else -1", [-1.0, 0.0, math.sqrt(2.0)]),
+        (
+            "numpy.nan if depth < 0 else math.sqrt(depth)",
+            [numpy.nan, 0.0, math.sqrt(2.0)],
+        ),
+        (
+            "math.log(depth) if depth > 0 else (0 if depth == 0 else numpy.nan)",
+            [numpy.nan, 0.0, math.log(2.0)],
+        ),
+        ("depth > 0 and math.log(depth)", [0.0, 0.0, math.log(2.0)]),
+        ("math.exp(depth) / depth", [-math.exp(-1.0), numpy.inf, math.exp(2.0) / 2]),
+    ],
+)
+def test_execute_array_does_not_recalculate_cells_without_math_errors(
+    formula: str, expected_result: list
+):
+    """Test that cells with an intended non-finite result, or with a math error
+    in a branch that is not used, are not calculated cell by cell again"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    rule = FormulaRule("test", ["depth"], formula)
+    rule.execute = Mock(side_effect=AssertionError("recalculated cell"))
+    depth = numpy.array([-1.0, 0.0, 2.0])
+
+    # Act
+    result = rule.execute_array({"depth": depth}, logger)
+
+    # Assert
+    assert numpy.array_equal(result, expected_result, equal_nan=True)
+
+
+def test_execute_array_gives_same_error_as_execute_for_log_of_zero():
+    """Test that a math error in the array based calculation gives the same
+    error as calculating the formula for that cell"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    rule = FormulaRule("test", ["depth"], "math.log(depth) if depth < 5 else 0")
+    depth = numpy.array([1.0, 0.0, 10.0])
+
+    # Act
+    with pytest.raises(ValueError) as exc_info:
+        rule.execute_array({"depth": depth}, logger)
+
+    with pytest.raises(ValueError) as cell_exc_info:
+        rule.execute({"depth": depth[1]}, logger)
+
+    # Assert
+    assert str(exc_info.value) == str(cell_exc_info.value)
+
+
+def test_execute_array_keeps_restrictions_on_code():
+    """Test that the array based calculation is still executed as restricted
+    code"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    rule = FormulaRule("test", ["foo"], "foo * numpy.__dict__")
+
+    # Act
+    with pytest.raises(SyntaxError) as exc_info:
+        rule.execute_array({"foo": numpy.array([1.0])}, logger)
+
+    exception_raised = exc_info.value
+
+    # Assert
+    assert "invalid attribute name" in exception_raised.args[0][0]
+
+
+def test_formula_that_can_not_be_vectorized_can_not_execute_array():
+    """Test that formulas that can not be calculated on arrays are marked
+    as such"""
+
+    # Arrange
+    rule = FormulaRule("test", ["foo"], "numpy.sum(foo)")
+
+    # Act
+    can_execute_array = rule.can_execute_array
+
+    # Assert
+    assert not can_execute_array
+
+
+def test_pickled_rule_gives_same_result():
+    """Test if a pickled (validated) rule, sent to the process of a
+    partition, can still be executed, giving the same result"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    rule = FormulaRule("test", ["depth", "offset"], "math.sqrt(depth) + offset")
+    rule.validate(logger)
+    values = {"depth": numpy.array([4.0, 9.0]), "offset": numpy.array([1.0, 2.0])}
+
+    # Act
+    pickled_rule = pickle.loads(pickle.dumps(rule))
+
+    # Assert
+    assert pickled_rule.execute({"depth": 4.0, "offset": 1.0}, logger) == 3.0
+    assert numpy.array_equal(
+        pickled_rule.execute_array(values, logger), rule.execute_array(values, logger)
+    )
@@ -0,0 +1,87 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Tests for formula vectorizer
+"""
+import pytest
+
+from decoimpact.business.entities.rules.formula_vectorizer import vectorize_formula
+
+
+@pytest.mark.parametrize(
+    "formula, expected_formula",
+    [
+        ("foo + bar", "foo + bar"),
+        ("foo > bar", "foo > bar"),
+        ("-999 if(foo <= 0.10) else bar", "numpy.where(foo <= 0.1, -999, bar)"),
+        (
+            "0 if foo <= 0.1 else (1 if foo <= 1 else 2)",
+            "numpy.where(foo <= 0.1, 0, numpy.where(foo <= 1, 1, 2))",
+        ),
+        ("math.sqrt(foo) * bar", "math_array.sqrt(foo) * bar"),
+        ("math.atan2(foo, bar)", "math_array.arctan2(foo, bar)"),
+        ("abs(foo)", "numpy.absolute(foo)"),
+        ("numpy.maximum(foo, bar)", "numpy.maximum(foo, bar)"),
+        ("foo > 0 and bar > 0", "numpy.where(foo > 0, bar > 0, foo > 0)"),
+        ("foo or bar", "numpy.where(foo, foo, bar)"),
+        ("not foo", "numpy.logical_not(foo)"),
+        ("0 < foo < 1", "numpy.logical_and(0 < foo, foo < 1)"),
+        ("foo * math.isqrt(9)", "foo * math.isqrt(9)"),
+        (
+            "math.sqrt(foo) if foo > 0 else bar",
+            "math_array.where(math_array.collect(foo > 0), "
+            "math_array.collect(math_array.sqrt(foo)), math_array.collect(bar))",
+        ),
+    ],
+)
+def test_vectorize_formula(formula: str, expected_formula: str):
+    """Test if formulas are rewritten to their array based variant"""
+
+    # Act
+    result = vectorize_formula(formula, ["foo", "bar"])
+
+    # Assert
+    assert result == expected_formula
+
+
+@pytest.mark.parametrize(
+    "formula",
+    [
+        "numpy.sum(foo)",
+        "math.log(foo, 2)",
+        "min(foo, bar)",
+        "foo in [1, 2]",
+        "foo[0]",
+        "foo.real",
+        "output=foo + bar",
+        "foo +",
+    ],
+)
+def test_vectorize_formula_returns_none_for_unsupported_formulas(
+    formula: str,
+):
+    """Test if formulas that can not be evaluated on arrays are not rewritten"""
+
+    # Act
+    result = vectorize_formula(formula, ["foo", "bar"])
+
+    # Assert
+    assert result is None
+
+
+@pytest.mark.parametrize("module_name", ["numpy", "math_array"])
+def test_vectorize_formula_returns_none_for_variables_named_as_modules(
+    module_name: str,
+):
+    """Test if a formula is not rewritten when an input variable hides one of
+    the modules used in the rewritten formula"""
+
+    # Act
+    result = vectorize_formula(f"{module_name} + 1", [module_name])
+
+    # Assert
+    assert result is None
@@ -121,3 +121,34 @@ def test_execute_value_array_multiplied_by_multipliers_with_dates_missing_dates(
 
     # Assert
     assert _xr.testing.assert_equal(multiplied_array, result_array) is None
+
+
+def test_execute_multiply_rule_with_dates_on_multiple_dimensions():
+    """Test that the multipliers of the periods are applied to all cells, that
+    a later period overrides an earlier (overlapping) one and that the
+    dimensions of the values are kept"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    rule = MultiplyRule(
+        "test",
+        ["foo"],
+        [[2], [3]],
+        date_range=[["01-01", "01-03"], ["14-02", "01-03"]],
+    )
+
+    time = ["2020-01-15", "2020-02-20", "2020-02-29", "2021-03-01", "2021-06-01"]
+    time = [_np.datetime64(t) for t in time]
+    value_array = _xr.DataArray(
+        [[1.0] * 5, [2.0] * 5], coords={"face": [0, 1], "time": time}
+    )
+
+    # Act
+    multiplied_array = rule.execute(value_array, logger)
+
+    nan = _np.nan
+    result_data = [[2, 3, 3, nan, nan], [4, 6, 6, nan, nan]]
+    result_array = _xr.DataArray(result_data, coords={"face": [0, 1], "time": time})
+
+    # Assert
+    assert _xr.testing.assert_equal(multiplied_array, result_array) is None
@@ -0,0 +1,105 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Tests for the peak detection functions
+"""
+
+import numpy as np
+import pytest
+from scipy import signal
+
+from decoimpact.business.entities.rules.peak_detection import find_peaks
+
+
+def _find_peaks_per_series(values: np.ndarray, distance: float) -> np.ndarray:
+    expected = np.zeros(values.shape, dtype=bool)
+    for index in np.ndindex(values.shape[:-1]):
+        peaks, _ = signal.find_peaks(values[index], distance=distance)
+        expected[index + (peaks,)] = True
+    return expected
+
+
+def test_find_peaks_with_flat_peaks_and_nan():
+    """Flat peaks should be found at their middle, peaks at the borders or
+    next to NaN values should not be found"""
+
+    # Arrange
+    values = np.array(
+        [
+            [3.0, 1.0, 2.0, 2.0, 2.0, 1.0, 4.0, 4.0, 1.0, 5.0],
+            [0.0, 1.0, np.nan, 1.0, 2.0, 1.0, 1.0, 2.0, 2.0, 2.0],
+        ]
+    )
+
+    # Act
+    peaks = find_peaks(values, 1)
+
+    # Assert
+    assert list(np.flatnonzero(peaks[0])) == [3, 6]
+    assert list(np.flatnonzero(peaks[1])) == [4]
+
+
+def test_find_peaks_removes_lower_peaks_within_distance():
+    """Lower peaks closer than the distance to a higher (kept) peak should be
+    removed, peaks removed by a removed peak should remain"""
+
+    # Arrange
+    values = np.array([[0.0, 1.0, 0.0, 3.0, 0.0, 2.0, 0.0, 1.5, 0.0]])
+
+    # Act
+    peaks = find_peaks(values, 3)
+
+    # Assert
+    # 3.0 removes 1.0 and 2.0, so 1.5 is kept
+    assert list(np.flatnonzero(peaks[0])) == [3, 7]
+
+
+@pytest.mark.parametrize("distance", [1, 2.5, 6, 24, 500])
+@pytest.mark.parametrize("length", [3, 20, 128, 150])
+def test_find_peaks_is_equal_to_scipy(distance: float, length: int):
+    """Peaks of all series should be equal to the peaks scipy finds per
+    series, also for equal peaks within the distance (rounded values)"""
+
+    # Arrange
+    random = np.random.default_rng(42)
+    values = np.round(random.random((40, 3, length)) * 4, 0)
+    values[random.random(values.shape) < 0.05] = np.nan
+    values[5:10] = np.repeat(values[5:10, :, : length // 5 + 1], 5, axis=-1)[
+        ..., :length
+    ]
+
+    # Act
+    peaks = find_peaks(values, distance)
+
+    # Assert
+    assert np.array_equal(peaks, _find_peaks_per_series(values, distance))
+
+
+def test_find_peaks_raises_for_distance_smaller_than_one():
+    """A distance smaller than one time step is not allowed (like scipy)"""
+
+    # Act
+    with pytest.raises(ValueError):
+        find_peaks(np.zeros((2, 5)), 0.5)
+
+
+@pytest.mark.parametrize("distance", [150, 1200.5])
+def test_find_peaks_of_long_series_is_equal_to_scipy(distance: float):
+    """Peaks of long series with a large distance (many peaks within the
+    distance) should be equal to the peaks scipy finds per series"""
+
+    # Arrange
+    random = np.random.default_rng(7)
+    values = np.cumsum(random.normal(size=(25, 8760)), axis=-1)
+    values += np.round(random.random(values.shape) * 3)
+    values[:5] = np.round(values[:5])
+
+    # Act
+    peaks = find_peaks(values, distance)
+
+    # Assert
+    assert np.array_equal(peaks, _find_peaks_per_series(values, distance))
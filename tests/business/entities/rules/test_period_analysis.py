@@ -0,0 +1,66 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Tests for the period analysis functions
+"""
+
+import numpy as np
+import pytest
+
+from decoimpact.business.entities.rules.period_analysis import analyze_periods
+from decoimpact.data.api.time_operation_type import TimeOperationType
+
+# two cells, three buckets (of 4, 0 and 5 time steps)
+values = np.array(
+    [
+        [1, 1, 0, 1, 1, 0, 1, 1, 1],
+        [0, 1, np.nan, 1, np.nan, np.nan, 0, 1, np.nan],
+    ]
+)
+bucket_sizes = np.array([4, 0, 5])
+
+
+@pytest.mark.parametrize(
+    "operation_type, expected_result",
+    [
+        ("COUNT_PERIODS", [[2, np.nan, 2], [1, np.nan, 1]]),
+        ("MAX_DURATION_PERIODS", [[2, np.nan, 3], [2, np.nan, 1]]),
+        ("AVG_DURATION_PERIODS", [[1.5, np.nan, 2], [2, np.nan, 1]]),
+    ],
+)
+def test_analyze_periods_per_bucket(operation_type: str, expected_result):
+    """Periods should be analyzed per bucket and per cell, periods should
+    not continue in the next bucket and NaN values should be skipped"""
+
+    # Act
+    result = analyze_periods(values, bucket_sizes, TimeOperationType[operation_type])
+
+    # Assert
+    np.testing.assert_array_equal(result, expected_result)
+
+
+def test_analyze_periods_without_values():
+    """A bucket with only NaN values has no periods"""
+
+    # Act
+    result = analyze_periods(
+        np.full((2, 3), np.nan), [3], TimeOperationType.AVG_DURATION_PERIODS
+    )
+
+    # Assert
+    np.testing.assert_array_equal(result, [[0], [0]])
+
+
+def test_analyze_periods_with_other_operation_type():
+    """Only the period operations can be analyzed"""
+
+    # Act
+    with pytest.raises(NotImplementedError) as exc_info:
+        analyze_periods(values, bucket_sizes, TimeOperationType.MAX)
+
+    # Assert
+    assert "is not a period operation" in exc_info.value.args[0]
@@ -132,3 +132,31 @@ def test_execute_values_combined_dec_inc(
 
     # Assert
     assert example_rule_combined.execute(input_value, logger) == expected_output_value
+
+
+def test_execute_array_gives_same_results_as_execute(example_rule_combined):
+    """
+    Test that the array based execution gives the same responses and warning
+    counts as executing the rule for every value (including NaN values).
+    """
+    # Arrange
+    logger = Mock(ILogger)
+    values = _np.array(
+        [[-1, 0, 0.5, 1, 1.5], [3.5, _np.nan, 5, 10, 10.5], [7.5, -3, 12, 2, 9]]
+    )
+    value_array = _xr.DataArray(values, dims=["x", "y"])
+
+    expected_values = _np.zeros_like(values)
+    expected_counter = [0, 0]
+    for indices, value in _np.ndenumerate(values):
+        expected_values[indices], counter = example_rule_combined.execute(value, logger)
+        expected_counter[0] += counter[0]
+        expected_counter[1] += counter[1]
+
+    # Act
+    result, warning_counter = example_rule_combined.execute_array(value_array, logger)
+
+    # Assert
+    assert result.dims == value_array.dims
+    assert _np.array_equal(result.values, expected_values, equal_nan=True)
+    assert warning_counter == expected_counter == [2, 2]
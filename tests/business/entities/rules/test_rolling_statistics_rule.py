@@ -156,3 +156,26 @@ def test_operation_type_not_implemented():
     # Assert
     expected_message = "The operation type 'test' is currently not supported"
     assert exception_raised.args[0] == expected_message
+
+
+def test_execute_chunked_value_array_rolling_statistics_stdev():
+    """RollingStatisticsRule should give the same (lazy) result for chunked input"""
+
+    # create test set
+    logger = Mock(ILogger)
+    rule = RollingStatisticsRule(
+        name="test",
+        input_variable_names=["foo"],
+        operation_type=TimeOperationType.STDEV,
+    )
+    rule.settings.time_scale = "day"
+    rule.period = 2
+
+    rolling_statistic = rule.execute(value_array.chunk({"time": 2}), logger)
+
+    result_data = [np.nan, np.nan, 0.262467, 0.235702, 0.047140, 0.081650]
+    result_array = _xr.DataArray(result_data, coords=[time], dims=["time"])
+
+    # Assert
+    assert rolling_statistic.chunks is not None
+    _xr.testing.assert_allclose(rolling_statistic.compute(), result_array, atol=1e-6)
@@ -0,0 +1,112 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Tests for the rolling window statistics functions
+"""
+
+import numpy as np
+import pytest
+
+from decoimpact.business.entities.rules.rolling_window_statistics import (
+    calculate_window_statistic,
+    get_window_bounds,
+)
+from decoimpact.data.api.time_operation_type import TimeOperationType
+
+# daily values with a gap of two days (2020-01-05 and 2020-01-06)
+times = np.array(
+    [
+        "2020-01-01",
+        "2020-01-02",
+        "2020-01-03",
+        "2020-01-04",
+        "2020-01-07",
+        "2020-01-08",
+        "2020-01-09",
+    ],
+    dtype="datetime64[ns]",
+)
+values = np.array(
+    [
+        [0.1, 0.7, np.nan, 0.2, 0.3, 0.1, 0.4],
+        [np.nan, np.nan, np.nan, 1.0, 2.0, 2.0, 5.0],
+    ]
+)
+
+
+def test_get_window_bounds():
+    """Windows should start at every time step for which the window fits
+    and windows that end at the same time step should keep the shortest"""
+
+    # Act
+    starts, ends = get_window_bounds(times, np.timedelta64(2, "D"))
+
+    # Assert
+    # the windows starting at 2020-01-02, 2020-01-03 and 2020-01-04 all end
+    # at 2020-01-04 (because of the gap)
+    assert list(starts) == [0, 3, 4]
+    assert list(ends) == [2, 3, 6]
+
+
+def test_get_window_bounds_for_too_short_time_series():
+    """No windows should be found if the window is longer than the series"""
+
+    # Act
+    starts, ends = get_window_bounds(times, np.timedelta64(10, "D"))
+
+    # Assert
+    assert len(starts) == 0
+    assert len(ends) == 0
+
+
+@pytest.mark.parametrize(
+    "operation_type, reference_function",
+    [
+        (TimeOperationType.ADD, np.nansum),
+        (TimeOperationType.MIN, np.nanmin),
+        (TimeOperationType.MAX, np.nanmax),
+        (TimeOperationType.AVERAGE, np.nanmean),
+        (TimeOperationType.MEDIAN, np.nanmedian),
+        (TimeOperationType.STDEV, np.nanstd),
+        (
+            TimeOperationType.PERCENTILE,
+            lambda window: np.nanquantile(window, 0.3),
+        ),
+    ],
+)
+def test_calculate_window_statistic(operation_type, reference_function):
+    """The statistic of every window should be stored at its last time step
+    (NaN values are skipped)"""
+
+    # Arrange
+    starts, ends = get_window_bounds(times, np.timedelta64(2, "D"))
+
+    expected = np.full(values.shape, np.nan)
+    for start, end in zip(starts, ends):
+        for cell, cell_values in enumerate(values):
+            window = cell_values[start : end + 1]
+            if not np.all(np.isnan(window)):
+                expected[cell, end] = reference_function(window)
+            elif operation_type is TimeOperationType.ADD:
+                expected[cell, end] = 0
+
+    # Act
+    result = calculate_window_statistic(values, starts, ends, operation_type, 30)
+
+    # Assert
+    np.testing.assert_allclose(result, expected, atol=1e-12)
+
+
+def test_calculate_window_statistic_with_unsupported_operation():
+    """An unsupported operation type should give an error"""
+
+    # Act
+    with pytest.raises(NotImplementedError) as exc_info:
+        calculate_window_statistic(values, [0], [2], TimeOperationType.COUNT_PERIODS)
+
+    # Assert
+    assert "is currently not supported" in exc_info.value.args[0]
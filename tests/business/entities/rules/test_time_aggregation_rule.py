@@ -511,3 +511,26 @@ def test_operation_type_not_implemented():
     # Assert
     expected_message = "The operation type 'test' is currently not supported"
     assert exception_raised.args[0] == expected_message
+
+
+def test_execute_chunked_value_array_gives_same_result():
+    """Chunked (streamed) input should be aggregated (lazily) per time window
+    with the same result as input that is completely in memory"""
+
+    # create test set
+    logger = Mock(ILogger)
+    rule = TimeAggregationRule(
+        name="test",
+        input_variable_names=["foo"],
+        operation_type=TimeOperationType.STDEV,
+    )
+    rule.settings.time_scale = "month"
+
+    # Act
+    expected = rule.execute(value_array_months, logger)
+    time_aggregation = rule.execute(value_array_months.chunk({"time": 2}), logger)
+
+    # Assert
+    assert time_aggregation.chunks is not None
+    _xr.testing.assert_allclose(time_aggregation, expected, atol=1e-11)
+    assert time_aggregation["time_month"].attrs == expected["time_month"].attrs
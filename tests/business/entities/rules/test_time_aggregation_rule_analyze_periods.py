@@ -687,3 +687,31 @@ def test_execute_value_array_condition_time_monthly_count_periods():
 
     # Assert
     assert _xr.testing.assert_equal(time_condition, result_array) is None
+
+
+def test_execute_chunked_value_array_count_periods_per_chunk_of_cells():
+    """Test if chunked (streamed) input is analyzed one chunk of cells at a
+    time (with the complete time series), with the same result"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    rule = TimeAggregationRule(
+        name="test",
+        input_variable_names=["foo"],
+        operation_type=TimeOperationType.MAX_DURATION_PERIODS,
+    )
+    rule.settings.time_scale = "month"
+
+    time = _np.arange("2020-01-01", "2020-03-01", dtype="datetime64[D]")
+    values = (_np.arange(4 * len(time)).reshape(4, len(time)) % 3 == 0).astype(float)
+    value_array = _xr.DataArray(
+        values, coords=[[0, 1, 2, 3], time], dims=["cells", "time"]
+    )
+
+    # Act
+    expected = rule.execute(value_array, logger)
+    result = rule.execute(value_array.chunk({"cells": 2, "time": 10}), logger)
+
+    # Assert
+    assert result.chunks == ((2, 2), (2,))
+    assert _xr.testing.assert_equal(result.compute(), expected) is None
@@ -0,0 +1,181 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Tests for TimeWindowAggregator class
+"""
+
+import numpy as np
+import pytest
+import xarray as _xr
+
+from decoimpact.business.entities.rules.time_window_aggregator import (
+    TimeWindowAggregator,
+)
+from decoimpact.data.api.time_operation_type import TimeOperationType
+
+
+def _create_test_array() -> _xr.DataArray:
+    time = np.array(
+        [
+            "2019-01-01",
+            "2019-01-15",
+            "2019-02-01",
+            "2019-05-01",
+            "2021-03-03",
+            "2021-03-04",
+            "2021-04-04",
+        ],
+        dtype="datetime64[ns]",
+    )
+    data = np.array(
+        [
+            [0.1, np.nan, 1.0],
+            [0.7, np.nan, 2.0],
+            [0.2, np.nan, np.nan],
+            [0.2, 0.5, 3.0],
+            [0.3, 1.5, 4.0],
+            [np.nan, 2.5, 5.0],
+            [0.1, 0.5, 6.0],
+        ]
+    )
+    return _xr.DataArray(
+        data.T,
+        coords={"x": [1, 2, 3], "time": time},
+        dims=["x", "time"],
+        attrs={"units": "m"},
+    )
+
+
+@pytest.mark.parametrize(
+    "operation_type, percentile_value",
+    [
+        (TimeOperationType.ADD, 0),
+        (TimeOperationType.MIN, 0),
+        (TimeOperationType.MAX, 0),
+        (TimeOperationType.AVERAGE, 0),
+        (TimeOperationType.STDEV, 0),
+        (TimeOperationType.MEDIAN, 0),
+        (TimeOperationType.PERCENTILE, 0),
+        (TimeOperationType.PERCENTILE, 90),
+    ],
+)
+@pytest.mark.parametrize("frequency", ["ME", "YE"])
+@pytest.mark.parametrize("window_size", [1, 2, 3, 7])
+def test_aggregate_gives_same_result_as_resample(
+    operation_type: TimeOperationType,
+    percentile_value: float,
+    frequency: str,
+    window_size: int,
+):
+    """Aggregating per time window should give the same result as resampling
+    the complete time series (including empty buckets and NaN values)"""
+
+    # Arrange
+    value_array = _create_test_array()
+    aggregator = TimeWindowAggregator(operation_type, percentile_value)
+    resampled = value_array.resample({"time": frequency}, skipna=True)
+    expected = {
+        TimeOperationType.ADD: resampled.sum,
+        TimeOperationType.MIN: resampled.min,
+        TimeOperationType.MAX: resampled.max,
+        TimeOperationType.AVERAGE: resampled.mean,
+        TimeOperationType.STDEV: resampled.std,
+        TimeOperationType.MEDIAN: resampled.median,
+        TimeOperationType.PERCENTILE: lambda: resampled.quantile(
+            percentile_value / 100
+        ).drop_vars("quantile"),
+    }[operation_type]()
+
+    # Act
+    result = aggregator.aggregate(
+        value_array.chunk({"time": window_size}), "time", frequency
+    )
+
+    # Assert
+    assert result.dims == ("x", "time")
+    assert result.attrs == {"units": "m"}
+    _xr.testing.assert_allclose(result, expected, atol=1e-12)
+
+
+def test_aggregate_is_lazy_and_computes_every_window_once():
+    """Chunked input is aggregated lazily, computing the result calculates
+    every window (chunk) of the input only once"""
+
+    # Arrange
+    value_array = _create_test_array()
+    computed_windows = []
+
+    def read_window(block):
+        computed_windows.append(block.shape[1])
+        return block
+
+    data = value_array.chunk({"time": 3}).data.map_blocks(
+        read_window, meta=np.array((), float)
+    )
+    aggregator = TimeWindowAggregator(TimeOperationType.STDEV)
+
+    # Act
+    result = aggregator.aggregate(value_array.copy(data=data), "time", "ME")
+    computed_before = list(computed_windows)
+    values = result.values
+
+    # Assert
+    expected = value_array.resample({"time": "ME"}, skipna=True).std()
+    assert result.chunks is not None
+    assert not computed_before
+    assert computed_windows == [3, 3, 1]
+    np.testing.assert_allclose(values, expected.values, atol=1e-12)
+
+
+@pytest.mark.parametrize("chunks", [None, {"time": 2}])
+def test_aggregate_add_keeps_integer_type(chunks):
+    """The sum of integer values stays an integer (like resampling)"""
+
+    # Arrange
+    time = np.arange("2020-01-01", "2020-03-01", dtype="datetime64[D]")
+    value_array = _xr.DataArray(
+        np.arange(len(time)), coords={"time": time}, dims=["time"]
+    )
+    aggregator = TimeWindowAggregator(TimeOperationType.ADD)
+
+    # Act
+    result = aggregator.aggregate(
+        value_array if chunks is None else value_array.chunk(chunks), "time", "ME"
+    )
+
+    # Assert
+    expected = value_array.resample({"time": "ME"}).sum()
+    assert result.dtype == expected.dtype
+    _xr.testing.assert_equal(result.compute(), expected)
+
+
+def test_aggregate_without_chunks_uses_complete_time_axis():
+    """Arrays that are not chunked are aggregated as a single window"""
+
+    # Arrange
+    value_array = _create_test_array()
+    aggregator = TimeWindowAggregator(TimeOperationType.AVERAGE)
+
+    # Act
+    result = aggregator.aggregate(value_array, "time", "YE")
+
+    # Assert
+    expected = value_array.resample({"time": "YE"}, skipna=True).mean()
+    _xr.testing.assert_allclose(result, expected)
+
+
+def test_create_aggregator_for_unsupported_operation_type():
+    """Period operations can not be aggregated per time window"""
+
+    # Act
+    with pytest.raises(NotImplementedError) as exc_info:
+        TimeWindowAggregator(TimeOperationType.COUNT_PERIODS)
+
+    # Assert
+    assert not TimeWindowAggregator.supports(TimeOperationType.COUNT_PERIODS)
+    assert TimeWindowAggregator.supports(TimeOperationType.STDEV)
+    assert "can not be aggregated per time window" in exc_info.value.args[0]
@@ -9,8 +9,9 @@ Tests for RuleBasedModel class
 """
 
 
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, patch
 
+import numpy as _np
 import pytest
 import xarray as _xr
 
@@ -21,8 +22,13 @@ from decoimpact.business.entities.rules.i_multi_array_based_rule import (
     IMultiArrayBasedRule,
 )
 from decoimpact.business.entities.rules.i_rule import IRule
+from decoimpact.business.entities.rules.rolling_statistics_rule import (
+    RollingStatisticsRule,
+)
 from decoimpact.crosscutting.i_logger import ILogger
 from decoimpact.data.api.i_dataset import IDatasetData
+from decoimpact.data.api.run_settings import RunSettings
+from decoimpact.data.api.time_operation_type import TimeOperationType
 
 
 def test_create_rule_based_model_with_defaults():
@@ -219,6 +225,99 @@ def test_run_rule_based_model():
     assert "out3" in model.output_dataset.keys()
 
 
+def test_run_rule_based_model_in_time_windows():
+    """Test if the model processes the data in time windows (lazily)
+    when a time window is set, giving the same results"""
+
+    # Arrange
+    time = _np.arange("2020-01-01", "2020-01-11", dtype="datetime64[D]")
+    dataset = _xr.Dataset(coords={"time": time})
+    dataset["mesh"] = _xr.DataArray(0, attrs={"cf_role": "mesh_topology"})
+    dataset["test"] = _xr.DataArray(_np.arange(20.0).reshape(10, 2), dims=["time", "x"])
+
+    logger = Mock(ILogger)
+    rule = Mock(IArrayBasedRule, id="rule1")
+    rule.name = "rule1"
+    rule.input_variable_names = ["test"]
+    rule.output_variable_name = "out1"
+    rule.execute.side_effect = lambda value_array, _: value_array * 2
+
+    run_settings = RunSettings()
+    run_settings.time_window = 4
+    model = RuleBasedModel([dataset], [rule], run_settings=run_settings)
+
+    # Act
+    model.initialize(logger)
+    model.execute(logger)
+
+    # Assert
+    result = model.output_dataset["out1"]
+    assert result.chunks == ((4, 4, 2), (1, 1))
+    assert (result.values == dataset["test"].values * 2).all()
+
+
+def test_run_rule_based_model_in_time_windows_chunks_complete_time_series():
+    """Test if rules needing the complete time series of a cell (like
+    rolling statistics) give results in chunks of cells that are about as
+    large as one time window"""
+
+    # Arrange
+    time = _np.arange("2020-01-01", "2020-01-11", dtype="datetime64[D]")
+    dataset = _xr.Dataset(coords={"time": time})
+    dataset["mesh"] = _xr.DataArray(0, attrs={"cf_role": "mesh_topology"})
+    dataset["test"] = _xr.DataArray(_np.arange(60.0).reshape(10, 6), dims=["time", "x"])
+
+    logger = Mock(ILogger)
+    rule = RollingStatisticsRule("rule1", ["test"], TimeOperationType.MAX)
+    rule.output_variable_name = "out1"
+    rule.period = 2
+
+    run_settings = RunSettings()
+    run_settings.time_window = 4
+    model = RuleBasedModel([dataset], [rule], run_settings=run_settings)
+
+    # Act
+    model.initialize(logger)
+    model.execute(logger)
+
+    # Assert
+    result = model.output_dataset["out1"]
+    expected = rule.execute(dataset["test"], logger)
+    assert result.chunks == ((10,), (2, 2, 2))
+    assert _np.array_equal(result.values, expected.values, equal_nan=True)
+
+
+def test_validation_fails_for_time_window_without_dask():
+    """Test if the model gives a clear error when processing in time
+    windows is requested, but dask is not installed"""
+
+    # Arrange
+    dataset = _xr.Dataset()
+    dataset["test"] = _xr.DataArray([32, 94, 9])
+    logger = Mock(ILogger)
+
+    rule = Mock(IRule)
+    rule.input_variable_names = ["test"]
+    rule.output_variable_name = "output"
+
+    run_settings = RunSettings()
+    run_settings.time_window = 4
+    model = RuleBasedModel([dataset], [rule], run_settings=run_settings)
+
+    # Act
+    with patch(
+        "decoimpact.business.entities.rule_based_model.find_spec", return_value=None
+    ):
+        valid = model.validate(logger)
+
+    # Assert
+    assert not valid
+    logger.log_error.assert_called_with(
+        "Processing in time windows (time_window) requires dask, install "
+        "it with the dask extra (pip install decoimpact[dask])."
+    )
+
+
 def test_make_output_variables_list():
     # Arrange
     variables = ("var1", "var2", "var3", "var4", "var5")
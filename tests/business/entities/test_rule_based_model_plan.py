@@ -0,0 +1,79 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Tests for RuleBasedModelPlan class
+"""
+
+from unittest.mock import Mock
+
+from decoimpact.business.entities.rule_based_model_plan import RuleBasedModelPlan
+from decoimpact.business.entities.rules.i_rule import IRule
+from decoimpact.crosscutting.i_logger import ILogger
+
+
+def _create_rule(name: str, valid: bool = True) -> IRule:
+    rule = Mock(IRule, id=name)
+    rule.name = name
+    rule.input_variable_names = ["test"]
+    rule.output_variable_name = f"{name}_output"
+    rule.validate.return_value = valid
+    return rule
+
+
+def test_validate_rules_only_validates_valid_rules_once():
+    """Test if valid rules are only validated once for all partitions"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    rule = _create_rule("rule1")
+    plan = RuleBasedModelPlan([rule])
+
+    # Act
+    valid1 = plan.validate_rules(logger)
+    valid2 = plan.validate_rules(logger)
+
+    # Assert
+    assert valid1 and valid2
+    rule.validate.assert_called_once_with(logger)
+
+
+def test_validate_rules_validates_all_invalid_rules_again():
+    """Test if all rules are validated (and reported) again when one
+    of the rules is invalid"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    rule1 = _create_rule("rule1", valid=False)
+    rule2 = _create_rule("rule2")
+    plan = RuleBasedModelPlan([rule1, rule2])
+
+    # Act
+    valid1 = plan.validate_rules(logger)
+    valid2 = plan.validate_rules(logger)
+
+    # Assert
+    assert not valid1 and not valid2
+    assert rule1.validate.call_count == 2
+    assert rule2.validate.call_count == 2
+
+
+def test_get_scheduler_is_shared_for_the_same_variables():
+    """Test if the scheduler is shared by datasets with the same variables,
+    independent of the order of the variables"""
+
+    # Arrange
+    rule = _create_rule("rule1")
+    plan = RuleBasedModelPlan([rule])
+
+    # Act
+    scheduler1 = plan.get_scheduler(["test", "x", "y"])
+    scheduler2 = plan.get_scheduler(["y", "test", "x"])
+    scheduler3 = plan.get_scheduler(["test", "x"])
+
+    # Assert
+    assert scheduler1 is scheduler2
+    assert scheduler1 is not scheduler3
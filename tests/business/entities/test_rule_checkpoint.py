@@ -0,0 +1,75 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Tests for RuleCheckpoint class
+"""
+
+from pathlib import Path
+from unittest.mock import Mock
+
+import numpy as _np
+import xarray as _xr
+
+from decoimpact.business.entities.rule_checkpoint import RuleCheckpoint
+from decoimpact.crosscutting.i_logger import ILogger
+
+
+def _create_result() -> _xr.DataArray:
+    return _xr.DataArray(
+        _np.arange(6.0).reshape(2, 3),
+        dims=["time", "mesh2d_nFaces"],
+        attrs={"long_name": "result", "location": "face"},
+    )
+
+
+def test_store_and_load_result_of_rule(tmp_path: Path):
+    """Test if a stored result of a rule is loaded with the same values
+    and attributes when resuming"""
+
+    # Arrange
+    result = _create_result()
+    RuleCheckpoint(tmp_path, False).store("rule 1/a", "key", result, Mock(ILogger))
+
+    # Act
+    loaded = RuleCheckpoint(tmp_path, True).load("rule 1/a", "key")
+
+    # Assert
+    assert loaded is not None
+    assert _np.array_equal(loaded, result)
+    assert loaded.dims == result.dims
+    assert loaded.attrs == result.attrs
+    assert [path.name for path in tmp_path.iterdir()] == ["rule_1_a.nc"]
+
+
+def test_load_gives_no_result_for_changed_rule(tmp_path: Path):
+    """Test if the stored result is not used when the key of the rule
+    changed (changed definition, dependencies or input data)"""
+
+    # Arrange
+    checkpoint = RuleCheckpoint(tmp_path, True)
+    checkpoint.store("rule", "key", _create_result(), Mock(ILogger))
+
+    # Act
+    result = checkpoint.load("rule", "changed_key")
+
+    # Assert
+    assert result is None
+    assert checkpoint.load("other_rule", "key") is None
+
+
+def test_load_gives_no_result_when_not_resuming(tmp_path: Path):
+    """Test if stored results are only used when resuming"""
+
+    # Arrange
+    checkpoint = RuleCheckpoint(tmp_path, False)
+    checkpoint.store("rule", "key", _create_result(), Mock(ILogger))
+
+    # Act
+    result = checkpoint.load("rule", "key")
+
+    # Assert
+    assert result is None
@@ -9,6 +9,7 @@ Tests for RuleBasedModel class
 """
 
 
+from threading import Barrier
 from typing import Dict, List
 from unittest.mock import Mock
 
@@ -17,7 +18,9 @@ import pytest
 import xarray as _xr
 from mock import ANY
 
+from decoimpact.business.entities.rule_checkpoint import RuleCheckpoint
 from decoimpact.business.entities.rule_processor import RuleProcessor
+from decoimpact.business.entities.rule_result_cache import RuleResultCache
 from decoimpact.business.entities.rules.i_array_based_rule import IArrayBasedRule
 from decoimpact.business.entities.rules.i_cell_based_rule import ICellBasedRule
 from decoimpact.business.entities.rules.i_multi_array_based_rule import (
@@ -27,9 +30,17 @@ from decoimpact.business.entities.rules.i_multi_cell_based_rule import (
     IMultiCellBasedRule,
 )
 from decoimpact.business.entities.rules.i_rule import IRule
+from decoimpact.business.entities.rules.i_vectorized_cell_based_rule import (
+    IVectorizedCellBasedRule,
+)
+from decoimpact.business.entities.rules.i_vectorized_multi_cell_based_rule import (
+    IVectorizedMultiCellBasedRule,
+)
+from decoimpact.business.entities.rules.multiply_rule import MultiplyRule
 from decoimpact.business.entities.rules.step_function_rule import StepFunctionRule
 from decoimpact.business.entities.rules.time_aggregation_rule import TimeAggregationRule
 from decoimpact.crosscutting.i_logger import ILogger
+from decoimpact.data.api.execution_mode import ExecutionMode
 from decoimpact.data.api.i_time_aggregation_rule_data import ITimeAggregationRuleData
 
 
@@ -172,6 +183,186 @@ def test_process_rules_given_rule_dependencies():
         assert rule.output_variable_name in dataset.keys()
 
 
+def test_process_rules_in_threads_executes_rule_set_in_parallel():
+    """Tests if the processor executes the rules of a rule-set in parallel
+    when using threads, and adds the results in the order of the rules."""
+
+    # Arrange
+    dataset = _xr.Dataset()
+    dataset["test"] = _xr.DataArray([32, 94, 9])
+
+    rule1 = Mock(IArrayBasedRule, id="rule1")
+    rule2 = Mock(IArrayBasedRule, id="rule2")
+    rule3 = Mock(IMultiArrayBasedRule, id="rule3")
+
+    logger = Mock(ILogger)
+
+    # rule1 and rule2 can only pass the barrier when running simultaneously
+    barrier = Barrier(2, timeout=10)
+
+    def execute_rule(result: _xr.DataArray):
+        def execute(_, rule_logger: ILogger):
+            barrier.wait()
+            rule_logger.log_warning("running")
+            return result
+
+        return execute
+
+    rule1.name = "rule1"
+    rule2.name = "rule2"
+    rule3.name = "rule3"
+
+    rule1.input_variable_names = ["test"]
+    rule2.input_variable_names = ["test"]
+    rule3.input_variable_names = ["out1", "out2"]
+
+    rule1.output_variable_name = "out1"
+    rule2.output_variable_name = "out2"
+    rule3.output_variable_name = "out3"
+
+    rule1.execute.side_effect = execute_rule(_xr.DataArray([1, 2, 3]))
+    rule2.execute.side_effect = execute_rule(_xr.DataArray([4, 5, 6]))
+    rule3.execute.return_value = _xr.DataArray([7, 8, 9])
+
+    processor = RuleProcessor(
+        [rule1, rule2, rule3], dataset, ExecutionMode.THREADS, max_workers=2
+    )
+
+    assert processor.initialize(logger)
+
+    # Act
+    result = processor.process_rules(dataset, logger)
+
+    # Assert
+    assert list(result.data_vars) == ["test", "out1", "out2", "out3"]
+    assert list(result["out1"].values) == [1, 2, 3]
+    assert list(result["out2"].values) == [4, 5, 6]
+
+    logger.log_warning.assert_any_call("[rule1] running")
+    logger.log_warning.assert_any_call("[rule2] running")
+    logger.log_info.assert_any_call("[rule1] Starting rule rule1")
+
+    # a rule-set with a single rule is executed without tagging
+    logger.log_info.assert_any_call("Starting rule rule3")
+    rule3.execute.assert_called_once_with(ANY, logger)
+
+
+def test_process_rules_skips_rules_not_needed_for_variables_to_save():
+    """Tests if the processor only executes the rules that are needed
+    to calculate the variables that will be saved."""
+
+    # Arrange
+    dataset = _xr.Dataset()
+    dataset["test"] = _xr.DataArray([32, 94, 9])
+
+    logger = Mock(ILogger)
+    rule_specs = [
+        (IArrayBasedRule, ["test"]),
+        (IArrayBasedRule, ["test"]),
+        (IMultiArrayBasedRule, ["out1", "out2"]),
+        (IArrayBasedRule, ["out3"]),
+        (IArrayBasedRule, ["out1"]),
+    ]
+    rules = []
+    for index, (rule_type, input_names) in enumerate(rule_specs, start=1):
+        rule = Mock(rule_type, id=f"rule{index}")
+        rule.name = f"rule{index}"
+        rule.input_variable_names = input_names
+        rule.output_variable_name = f"out{index}"
+        rule.execute.return_value = _xr.DataArray([index, index, index])
+        rules.append(rule)
+    rule4, rule5 = rules[3:]
+
+    processor = RuleProcessor(rules, dataset, variables_to_save=["out3"])
+
+    # Act
+    assert processor.initialize(logger)
+    result = processor.process_rules(dataset, logger)
+
+    # Assert
+    assert list(result.data_vars) == ["test", "out3"]
+    rule4.execute.assert_not_called()
+    rule5.execute.assert_not_called()
+    logger.log_info.assert_any_call(
+        "Skipping rules that are not needed for the variables to save: "
+        "rule4, rule5 (estimated 40% of the work)"
+    )
+
+
+def test_process_rules_releases_intermediate_results_after_last_use():
+    """Tests if intermediate results that are not saved are removed from
+    the dataset as soon as the last rule using them has been executed."""
+
+    # Arrange
+    dataset = _xr.Dataset()
+    dataset["test"] = _xr.DataArray([32, 94, 9])
+
+    logger = Mock(ILogger)
+    rule1 = Mock(IArrayBasedRule, id="rule1")
+    rule2 = Mock(IArrayBasedRule, id="rule2")
+    rule3 = Mock(IMultiArrayBasedRule, id="rule3")
+
+    rule1.input_variable_names = ["test"]
+    rule2.input_variable_names = ["out1"]
+    rule3.input_variable_names = ["out1", "out2"]
+
+    rule1.output_variable_name = "out1"
+    rule2.output_variable_name = "out2"
+    rule3.output_variable_name = "out3"
+
+    variables_per_rule: Dict[str, List[str]] = {}
+
+    def execute_rule(name: str):
+        def execute(*_):
+            variables_per_rule[name] = list(dataset.data_vars)
+            return _xr.DataArray([1, 2, 3])
+
+        return execute
+
+    rule1.execute.side_effect = execute_rule("rule1")
+    rule2.execute.side_effect = execute_rule("rule2")
+    rule3.execute.side_effect = execute_rule("rule3")
+
+    processor = RuleProcessor(
+        [rule1, rule2, rule3], dataset, variables_to_save=["out3"]
+    )
+    assert processor.initialize(logger)
+
+    # Act
+    result = processor.process_rules(dataset, logger)
+
+    # Assert
+    assert result is dataset
+    assert variables_per_rule["rule3"] == ["test", "out1", "out2"]
+    assert list(result.data_vars) == ["test", "out3"]
+    logger.log_debug.assert_called_with("Releasing intermediate variables: out1, out2")
+
+
+def test_process_rules_keeps_lazy_results_lazy():
+    """Tests if (dask backed) lazy rule results are added to the output
+    dataset without loading them into memory."""
+
+    # Arrange
+    dataset = _xr.Dataset()
+    dataset["test"] = _xr.DataArray([32, 94, 9]).chunk()
+
+    logger = Mock(ILogger)
+    rule = Mock(IArrayBasedRule, id="rule1")
+    rule.input_variable_names = ["test"]
+    rule.output_variable_name = "out1"
+    rule.execute.side_effect = lambda value_array, _: value_array * 2
+
+    processor = RuleProcessor([rule], dataset)
+    assert processor.initialize(logger)
+
+    # Act
+    result = processor.process_rules(dataset, logger)
+
+    # Assert
+    assert result["out1"].chunks is not None
+    assert list(result["out1"].values) == [64, 188, 18]
+
+
 @pytest.mark.parametrize(
     "indices_to_remove, expected_result",
     [
@@ -301,6 +492,89 @@ def test_process_rules_calls_cell_based_rule_execute_correctly():
     assert rule.execute.call_count == 6
 
 
+def test_process_rules_prefers_array_execution_of_vectorized_cell_based_rule():
+    """Tests if during processing the execute_array method of an
+    IVectorizedCellBasedRule is used instead of the per cell execute method,
+    and that the aggregated warnings are logged."""
+
+    # Arrange
+    dataset = _xr.Dataset()
+    input_array = _xr.DataArray(_np.array([[1, 2, 3], [4, 5, 6]], _np.int32))
+
+    dataset["test"] = input_array
+
+    logger = Mock(ILogger)
+    rule = Mock(IVectorizedCellBasedRule)
+
+    rule.input_variable_names = ["test"]
+    rule.output_variable_name = "output"
+
+    # number of warnings (min and max) = 2 and 1
+    rule.execute_array.return_value = (input_array * 2.5, [2, 1])
+
+    processor = RuleProcessor([rule], dataset)
+
+    # Act
+    assert processor.initialize(logger)
+    output_dataset = processor.process_rules(dataset, logger)
+
+    # Assert
+    assert rule.execute_array.call_count == 1
+    assert rule.execute.call_count == 0
+
+    # result should have the type of the input (like the cell based path)
+    assert output_dataset["output"].dtype == _np.int32
+    assert (output_dataset["output"].values == [[2, 5, 7], [10, 12, 15]]).all()
+
+    logger.log_warning.assert_any_call("value less than min: 2 occurence(s)")
+    logger.log_warning.assert_any_call("value greater than max: 1 occurence(s)")
+
+
+def test_process_rules_executes_vectorized_cell_rule_once_per_chunk():
+    """Tests if a chunked (dask) input variable of an IVectorizedCellBasedRule
+    is processed chunk by chunk, computing every input chunk only once for
+    both the result and the warning counts, and reporting the totals of the
+    warning counts once."""
+
+    # Arrange
+    computed_chunks: List[int] = []
+
+    def read_chunk(chunk: _np.ndarray) -> _np.ndarray:
+        computed_chunks.append(chunk.size)
+        return chunk
+
+    values = _np.array([[-1.0, 0.5, 2.0], [0.2, 3.0, 0.8]])
+    input_array = _xr.DataArray(values, dims=["time", "x"]).chunk({"time": 1})
+    dataset = _xr.Dataset()
+    dataset["test"] = input_array.copy(
+        data=input_array.data.map_blocks(read_chunk, meta=_np.array((), float))
+    )
+
+    logger = Mock(ILogger)
+    rule = StepFunctionRule("rule1", "test", [0, 1], [10, 20])
+    rule.output_variable_name = "output"
+
+    processor = RuleProcessor([rule], dataset)
+
+    # Act
+    assert processor.initialize(logger)
+    output_dataset = processor.process_rules(dataset, logger)
+    result = output_dataset["output"].compute()
+
+    # Assert
+    assert output_dataset["output"].chunks == ((1, 1), (3,))
+    assert (result.values == [[10, 10, 20], [10, 20, 10]]).all()
+    assert computed_chunks == [3, 3]
+
+    assert logger.log_warning.call_count == 2
+    logger.log_warning.assert_any_call("value less than min: 1 occurence(s)")
+    logger.log_warning.assert_called_with("value greater than max: 2 occurence(s)")
+
+    # recomputing the result does not report the warnings again
+    output_dataset["output"].compute()
+    assert logger.log_warning.call_count == 2
+
+
 def test_process_rules_calls_multi_cell_based_rule_execute_correctly():
     """Tests if during processing the rule its execute method of
     an IMultiCellBasedRule is called with the right parameter."""
@@ -334,6 +608,85 @@ def test_process_rules_calls_multi_cell_based_rule_execute_correctly():
     assert rule.execute.call_count == 6
 
 
+@pytest.mark.parametrize("can_execute_array", [True, False])
+def test_process_rules_calls_vectorized_multi_cell_based_rule_correctly(
+    can_execute_array: bool,
+):
+    """Tests if during processing the execute_array method of an
+    IVectorizedMultiCellBasedRule is used (with arrays of the same shape)
+    when the rule supports it, and the per cell execute method otherwise."""
+
+    # Arrange
+    dataset = _xr.Dataset()
+    dataset["test1"] = _xr.DataArray(_np.array([1, 2], _np.int32), dims=["x"])
+    dataset["test2"] = _xr.DataArray(
+        _np.array([[1, 2, 3], [4, 5, 6]], _np.int32), dims=["x", "y"]
+    )
+
+    logger = Mock(ILogger)
+    rule = Mock(IVectorizedMultiCellBasedRule)
+
+    rule.input_variable_names = ["test1", "test2"]
+    rule.output_variable_name = "output"
+    rule.can_execute_array = can_execute_array
+
+    rule.execute.return_value = 1
+    rule.execute_array.return_value = _np.array(1.5)
+
+    processor = RuleProcessor([rule], dataset)
+
+    # Act
+    assert processor.initialize(logger)
+    output_dataset = processor.process_rules(dataset, logger)
+
+    # Assert
+    assert output_dataset["output"].dims == ("x", "y")
+    assert (output_dataset["output"].values == 1).all()
+
+    if can_execute_array:
+        assert rule.execute_array.call_count == 1
+        assert rule.execute.call_count == 0
+
+        array_lookup: Dict[str, _np.ndarray] = rule.execute_array.call_args[0][0]
+        assert array_lookup["test1"].shape == (2, 3)
+        assert array_lookup["test2"].shape == (2, 3)
+    else:
+        assert rule.execute_array.call_count == 0
+        assert rule.execute.call_count == 6
+
+
+def test_process_rules_executes_vectorized_multi_cell_rule_lazily_on_chunks():
+    """Tests if chunked (dask) input variables of an IVectorizedMultiCellBasedRule
+    are processed chunk by chunk, giving a lazy result with the same values."""
+
+    # Arrange
+    dataset = _xr.Dataset()
+    dataset["test1"] = _xr.DataArray(_np.array([1.0, 2.0]), dims=["x"]).chunk()
+    dataset["test2"] = _xr.DataArray(
+        _np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]), dims=["y", "x"]
+    ).chunk({"y": 2})
+
+    logger = Mock(ILogger)
+    rule = Mock(IVectorizedMultiCellBasedRule)
+
+    rule.input_variable_names = ["test1", "test2"]
+    rule.output_variable_name = "output"
+    rule.can_execute_array = True
+    rule.execute_array.side_effect = lambda values, _: values["test1"] * values["test2"]
+
+    processor = RuleProcessor([rule], dataset)
+
+    # Act
+    assert processor.initialize(logger)
+    output_dataset = processor.process_rules(dataset, logger)
+
+    # Assert
+    result = output_dataset["output"]
+    assert result.dims == ("y", "x")
+    assert result.chunks == ((2, 1), (2,))
+    assert (result.values == [[1.0, 4.0], [3.0, 8.0], [5.0, 12.0]]).all()
+
+
 @pytest.mark.parametrize(
     "input_array1, input_array2, dims",
     [
@@ -397,6 +750,73 @@ def test_process_rules_calls_multi_cell_based_rule_special_cases(
     assert output_dataset.dims == dims
 
 
+def test_process_rules_multi_cell_based_rule_reads_inputs_through_views():
+    """Variables with fewer (or differently ordered) dimensions should be
+    provided to a multi cell based rule as views with the dimensions of the
+    variable with the most dimensions, without copying their values."""
+
+    # Arrange
+    dataset = _xr.Dataset()
+    dataset["test1"] = _xr.DataArray(_np.array([1.0, 2.0, 3.0]), dims=["y"])
+    dataset["test2"] = _xr.DataArray(_np.zeros((2, 3)), dims=["x", "y"])
+    dataset["test3"] = _xr.DataArray(
+        _np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]), dims=["y", "x"]
+    )
+
+    logger = Mock(ILogger)
+    rule = Mock(IVectorizedMultiCellBasedRule)
+
+    rule.input_variable_names = ["test1", "test2", "test3"]
+    rule.output_variable_name = "output"
+    rule.can_execute_array = True
+    rule.execute_array.return_value = _np.array(1.0)
+
+    processor = RuleProcessor([rule], dataset)
+
+    # Act
+    assert processor.initialize(logger)
+    processor.process_rules(dataset, logger)
+
+    # Assert
+    array_lookup: Dict[str, _np.ndarray] = rule.execute_array.call_args[0][0]
+
+    assert (array_lookup["test1"] == [[1.0, 2.0, 3.0], [1.0, 2.0, 3.0]]).all()
+    assert (array_lookup["test3"] == [[1.0, 3.0, 5.0], [2.0, 4.0, 6.0]]).all()
+    assert _np.shares_memory(array_lookup["test1"], dataset["test1"].values)
+    assert _np.shares_memory(array_lookup["test3"], dataset["test3"].values)
+    assert not array_lookup["test1"].flags.writeable
+
+
+def test_process_rules_multi_cell_based_fails_with_unknown_dims_in_smaller_var():
+    """A variable with fewer dimensions can only be expanded if all its
+    dimensions are also dimensions of the variable with the most dimensions."""
+
+    # Arrange
+    dataset = _xr.Dataset()
+    dataset["test1"] = _xr.DataArray(_np.array([1, 2], _np.int32), dims=["z"])
+    dataset["test2"] = _xr.DataArray(
+        _np.array([[1, 2], [3, 4]], _np.int32), dims=["x", "y"]
+    )
+
+    logger = Mock(ILogger)
+    rule = Mock(IMultiCellBasedRule)
+    rule.name = "test_rule"
+    rule.input_variable_names = ["test1", "test2"]
+    rule.output_variable_name = "output"
+
+    processor = RuleProcessor([rule], dataset)
+    processor.initialize(logger)
+
+    # Act
+    with pytest.raises(NotImplementedError) as exc_info:
+        processor.process_rules(dataset, logger)
+    exception_raised = exc_info.value
+
+    # Assert
+    assert "Variable test1 with dimensions:('z',)" in exception_raised.args[0]
+    rule.execute.assert_not_called()
+
+
 def test_process_rules_calls_multi_cell_based_fails_with_different_dims():
     """MultiCellBasedRule allows for values with less dimensions, but not
     with different dimensions."""
@@ -440,6 +860,39 @@ def test_process_rules_calls_multi_cell_based_fails_with_different_dims():
     assert exception_raised.args[0] == expected
 
 
+def test_process_by_multi_cell_fails_with_different_coordinates():
+    """MultiCellBasedRule combines the values by position, so variables with
+    other coordinates for the same dimension can not be combined."""
+
+    # Arrange
+    input_array1 = _xr.DataArray(
+        _np.array([1, 2], _np.int32), dims=["x"], coords={"x": [0, 1]}, name="test1"
+    )
+    input_array2 = _xr.DataArray(
+        _np.array([2, 1], _np.int32), dims=["x"], coords={"x": [1, 0]}, name="test2"
+    )
+
+    logger = Mock(ILogger)
+    rule = Mock(IMultiCellBasedRule)
+    rule.name = "test_rule"
+
+    processor = RuleProcessor([rule], _xr.Dataset())
+    input_variables = {"test1": input_array1, "test2": input_array2}
+
+    # Act
+    with pytest.raises(ValueError) as exc_info:
+        processor._process_by_multi_cell(rule, input_variables, logger)
+
+    # Assert
+    expected = (
+        "Can not execute rule test_rule with variables with different coordinates. "
+        "Variable test2 has other values for dimension x than variable test1."
+    )
+    assert exc_info.value.args[0] == expected
+    logger.log_error.assert_called_once_with(expected)
+    rule.execute.assert_not_called()
+
+
 def test_process_rules_calls_array_based_rule_execute_correctly():
     """Tests if during processing the rule its execute method of
     an IArrayBasedRule is called with the right parameter."""
@@ -662,3 +1115,99 @@ def test_process_values_outside_limits(
     assert example_rule.execute(input_value, logger) == expected_output_value
     processor.process_rules(dataset, logger)
     logger.log_warning.assert_called_with(expected_log_message)
+
+
+def test_process_rules_reuses_cached_results_of_unchanged_rules(tmp_path):
+    """Tests if the results of rules are stored in the result cache and
+    reused by a next run, as long as the rules (and the rules they depend
+    on) and the input data did not change."""
+
+    # Arrange
+    dataset = _xr.Dataset()
+    dataset["test"] = _xr.DataArray(
+        [1.0, 2.0, 3.0], attrs={"location": "face", "mesh": "mesh2d"}
+    )
+    logger = Mock(ILogger)
+
+    def create_rules(multiplier: float) -> List[IRule]:
+        rule1 = MultiplyRule("rule1", ["test"], [[multiplier]])
+        rule2 = MultiplyRule("rule2", ["out1"], [[10.0]])
+        rule1.output_variable_name = "out1"
+        rule2.output_variable_name = "out2"
+        rule1.definition = f"multiply test by {multiplier}"
+        rule2.definition = "multiply out1 by 10"
+        return [rule1, rule2]
+
+    def run(rules: List[IRule]) -> _xr.Dataset:
+        processor = RuleProcessor(
+            rules,
+            dataset,
+            result_cache=RuleResultCache(tmp_path, 1024**2),
+            input_identity="input.nc",
+        )
+        assert processor.initialize(logger)
+        return processor.process_rules(dataset.copy(), logger)
+
+    run(create_rules(2.0))
+
+    # Act
+    logger.reset_mock()
+    cached_result = run(create_rules(2.0))
+    cached_messages = [call.args[0] for call in logger.log_info.call_args_list]
+
+    logger.reset_mock()
+    changed_result = run(create_rules(3.0))
+    changed_messages = [call.args[0] for call in logger.log_info.call_args_list]
+
+    # Assert
+    assert _np.array_equal(cached_result["out2"], [20.0, 40.0, 60.0])
+    assert "Using cached result for rule rule1" in cached_messages
+    assert "Using cached result for rule rule2" in cached_messages
+
+    # changing a rule also invalidates the results of the rules using it
+    assert _np.array_equal(changed_result["out2"], [30.0, 60.0, 90.0])
+    assert not any(message.startswith("Using cached") for message in changed_messages)
+
+
+def test_process_rules_resumes_from_checkpoint_of_completed_rules(tmp_path):
+    """Tests if a resumed run uses the results of the rules completed by
+    an earlier (stopped) run, and executes the remaining rules."""
+
+    # Arrange
+    dataset = _xr.Dataset()
+    dataset["test"] = _xr.DataArray(
+        [1.0, 2.0, 3.0], attrs={"location": "face", "mesh": "mesh2d"}
+    )
+    logger = Mock(ILogger)
+
+    rule1 = MultiplyRule("rule1", ["test"], [[2.0]])
+    rule2 = MultiplyRule("rule2", ["out1"], [[10.0]])
+    rule1.output_variable_name = "out1"
+    rule2.output_variable_name = "out2"
+    rule1.definition = "multiply test by 2"
+    rule2.definition = "multiply out1 by 10"
+
+    def run(resume: bool, variables_to_save: List[str]) -> _xr.Dataset:
+        processor = RuleProcessor(
+            [rule1, rule2],
+            dataset,
+            variables_to_save=variables_to_save,
+            input_identity="input.nc",
+            checkpoint=RuleCheckpoint(tmp_path, resume),
+        )
+        assert processor.initialize(logger)
+        return processor.process_rules(dataset.copy(), logger)
+
+    # first run only completed rule1
+    run(False, ["out1"])
+
+    # Act
+    logger.reset_mock()
+    result = run(True, ["out2"])
+
+    # Assert
+    messages = [call.args[0] for call in logger.log_info.call_args_list]
+    assert "Resuming from checkpoint of rule rule1" in messages
+    assert "Starting rule rule2" in messages
+    assert "Starting rule rule1" not in messages
+    assert _np.array_equal(result["out2"], [20.0, 40.0, 60.0])
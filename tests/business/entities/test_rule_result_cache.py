@@ -0,0 +1,100 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Tests for RuleResultCache class
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import Mock
+
+import numpy as _np
+import xarray as _xr
+
+from decoimpact.business.entities.rule_result_cache import RuleResultCache
+from decoimpact.crosscutting.i_logger import ILogger
+
+
+def _create_result(value: float) -> _xr.DataArray:
+    return _xr.DataArray(
+        _np.full((10, 100), value),
+        dims=["time", "mesh2d_nFaces"],
+        attrs={"long_name": "result"},
+    )
+
+
+def test_create_key_depends_on_all_parts():
+    """Test if the key of a result changes when any of its parts changes"""
+
+    # Act
+    key = RuleResultCache.create_key(["rule", "input.nc/var"])
+
+    # Assert
+    assert key == RuleResultCache.create_key(["rule", "input.nc/var"])
+    assert key != RuleResultCache.create_key(["rule", "input.nc/var2"])
+    assert key != RuleResultCache.create_key(["rule2", "input.nc/var"])
+    assert key != RuleResultCache.create_key(["rule", "input.nc", "var"])
+
+
+def test_store_and_load_result(tmp_path: Path):
+    """Test if a stored result is loaded with the same values and
+    attributes, and that unknown keys give no result"""
+
+    # Arrange
+    cache = RuleResultCache(tmp_path / "cache", 1024**2)
+    result = _create_result(2.5)
+
+    # Act
+    cache.store("key", result, Mock(ILogger))
+    loaded = cache.load("key")
+
+    # Assert
+    assert loaded is not None
+    assert loaded.identical(result)
+    assert cache.load("other_key") is None
+
+
+def test_store_removes_least_recently_used_results(tmp_path: Path):
+    """Test if the least recently used results are removed when the
+    cache becomes larger than its maximum size"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    cache = RuleResultCache(tmp_path, 1024**2)
+    cache.store("first", _create_result(1), logger)
+    result_size = (tmp_path / "first.nc").stat().st_size
+    cache = RuleResultCache(tmp_path, int(2.5 * result_size))
+    cache.store("second", _create_result(2), logger)
+
+    # make "first" the most recently used result
+    os.utime(tmp_path / "second.nc", ns=(0, 0))
+    assert cache.load("first") is not None
+
+    # Act
+    cache.store("third", _create_result(3), logger)
+
+    # Assert
+    assert cache.load("second") is None
+    assert cache.load("first") is not None
+    assert cache.load("third") is not None
+
+
+def test_clear_removes_all_results(tmp_path: Path):
+    """Test if clearing the cache removes all stored results"""
+
+    # Arrange
+    cache = RuleResultCache(tmp_path, 1024**2)
+    cache.store("first", _create_result(1), Mock(ILogger))
+    cache.store("second", _create_result(2), Mock(ILogger))
+
+    # Act
+    cache.clear()
+
+    # Assert
+    assert cache.load("first") is None
+    assert cache.load("second") is None
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,167 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Tests for RuleScheduler class
+"""
+
+from typing import List
+from unittest.mock import Mock
+
+from decoimpact.business.entities.rule_scheduler import RuleScheduler
+from decoimpact.business.entities.rules.i_rule import IRule
+from decoimpact.business.entities.rules.multiply_rule import MultiplyRule
+from decoimpact.business.entities.rules.time_aggregation_rule import TimeAggregationRule
+from decoimpact.crosscutting.i_logger import ILogger
+from decoimpact.data.api.time_operation_type import TimeOperationType
+
+
+def _create_rule(name: str, inputs: List[str], output: str) -> IRule:
+    rule = Mock(IRule, id=name)
+    rule.name = name
+    rule.input_variable_names = inputs
+    rule.output_variable_name = output
+    return rule
+
+
+def test_schedule_creates_rule_sets_per_dependency_level():
+    """Test if rules are grouped by the length of their dependency chain,
+    keeping the order of the rules within a rule-set"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    rule4 = _create_rule("rule4", ["out3", "test"], "out4")
+    rule3 = _create_rule("rule3", ["out1", "out2"], "out3")
+    rule2 = _create_rule("rule2", ["test"], "out2")
+    rule1 = _create_rule("rule1", ["test"], "out1")
+    rule5 = _create_rule("rule5", ["out1"], "out5")
+
+    scheduler = RuleScheduler([rule4, rule3, rule2, rule1, rule5], ["test"])
+
+    # Act
+    success = scheduler.schedule(logger)
+
+    # Assert
+    assert success
+    assert scheduler.rule_sets == [[rule2, rule1], [rule3, rule5], [rule4]]
+    logger.log_warning.assert_not_called()
+
+
+def test_schedule_handles_long_dependency_chains():
+    """Test if a long chain of dependent rules can be scheduled"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    rules = [_create_rule("rule0", ["test"], "out0")] + [
+        _create_rule(f"rule{i}", [f"out{i - 1}"], f"out{i}") for i in range(1, 1500)
+    ]
+
+    # Act
+    scheduler = RuleScheduler(list(reversed(rules)), ["test"])
+
+    # Assert
+    assert scheduler.schedule(logger)
+    assert [rule_set[0] for rule_set in scheduler.rule_sets] == rules
+
+
+def test_schedule_reports_circular_dependencies_and_missing_inputs():
+    """Test if rules that can not be resolved are reported with
+    the reason (circular dependency or missing input)"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    rules = [
+        _create_rule("rule1", ["test"], "out1"),
+        _create_rule("rule2", ["out1", "out3"], "out2"),
+        _create_rule("rule3", ["out2"], "out3"),
+        _create_rule("rule4", ["out3"], "out4"),
+        _create_rule("rule5", ["unknown"], "out5"),
+    ]
+    scheduler = RuleScheduler(rules, ["test"])
+
+    # Act
+    success = scheduler.schedule(logger)
+
+    # Assert
+    assert not success
+    assert scheduler.rule_sets == []
+    logger.log_warning.assert_any_call(
+        "Some rules can not be resolved: rule2, rule3, rule4, rule5"
+    )
+    logger.log_warning.assert_any_call(
+        "Rule rule5 is missing input variable(s): unknown"
+    )
+    logger.log_warning.assert_any_call("Rules with a circular dependency: rule2, rule3")
+
+
+def test_sort_by_critical_path_starts_expensive_paths_first():
+    """Test if rules leading to expensive rules are sorted first"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    cheap = MultiplyRule("cheap", ["test"], [2.0])
+    cheap.output_variable_name = "out_cheap"
+    feeding = MultiplyRule("feeding", ["test"], [2.0])
+    feeding.output_variable_name = "out_feeding"
+    expensive = TimeAggregationRule("expensive", ["test"], TimeOperationType.MAX)
+    expensive.output_variable_name = "out_expensive"
+    aggregation = TimeAggregationRule(
+        "aggregation", ["out_feeding"], TimeOperationType.MAX
+    )
+    aggregation.output_variable_name = "out_aggregation"
+    follow_up = MultiplyRule("follow_up", ["out_aggregation"], [2.0])
+    follow_up.output_variable_name = "out_follow_up"
+
+    scheduler = RuleScheduler(
+        [cheap, expensive, feeding, aggregation, follow_up], ["test"]
+    )
+    assert scheduler.schedule(logger)
+
+    # Act
+    sorted_rules = scheduler.sort_by_critical_path(scheduler.rule_sets[0])
+
+    # Assert
+    assert scheduler.rule_sets[0] == [cheap, expensive, feeding]
+    assert sorted_rules == [feeding, expensive, cheap]
+
+
+def test_get_required_rules_follows_dependencies():
+    """Test if all rules needed (indirectly) for a variable are returned"""
+
+    # Arrange
+    rule1 = _create_rule("rule1", ["test"], "out1")
+    rule2 = _create_rule("rule2", ["test"], "out2")
+    rule3 = _create_rule("rule3", ["out1", "test"], "out3")
+    rule4 = _create_rule("rule4", ["out3"], "out4")
+    scheduler = RuleScheduler([rule1, rule2, rule3, rule4], ["test"])
+
+    # Act
+    required_rules = scheduler.get_required_rules(["out3", "test"])
+
+    # Assert
+    assert required_rules == [rule1, rule3]
+
+
+def test_schedule_is_only_done_once_after_success():
+    """Test if a successfully scheduled scheduler keeps its rule-sets
+    when it is scheduled again (for instance for another partition)"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    rule1 = _create_rule("rule1", ["test"], "out1")
+    rule2 = _create_rule("rule2", ["out1"], "out2")
+
+    scheduler = RuleScheduler([rule2, rule1], ["test"])
+    scheduler.schedule(logger)
+    rule_sets = scheduler.rule_sets
+
+    # Act
+    success = scheduler.schedule(logger)
+
+    # Assert
+    assert success
+    assert scheduler.rule_sets is rule_sets
+    assert scheduler.rule_sets == [[rule1], [rule2]]
@@ -9,15 +9,25 @@ Tests for Application class
 """
 
 
+from pathlib import Path
+from typing import Tuple
 from unittest.mock import Mock
 
+import pytest
+
 from decoimpact.business.application import Application
 from decoimpact.business.entities.i_model import IModel
+from decoimpact.business.entities.rule_based_model_plan import RuleBasedModelPlan
+from decoimpact.business.entities.rules.multiply_rule import MultiplyRule
 from decoimpact.business.workflow.i_model_builder import IModelBuilder
 from decoimpact.crosscutting.i_logger import ILogger
+from decoimpact.data.api.i_combined_output_writer import ICombinedOutputWriter
 from decoimpact.data.api.i_data_access_layer import IDataAccessLayer
 from decoimpact.data.api.i_dataset import IDatasetData
 from decoimpact.data.api.i_model_data import IModelData
+from decoimpact.data.api.run_settings import RunSettings
+from decoimpact.data.entities.dataset_data import DatasetData
+from decoimpact.data.entities.yaml_model_data import YamlModelData
 
 
 def test_running_application():
@@ -29,7 +39,7 @@ def test_running_application():
     dataset = Mock(IDatasetData)
     model: IModel = Mock(IModel)
     model_builder = Mock(IModelBuilder)
-    model_data = Mock(IModelData)
+    model_data = Mock(IModelData, run_settings=RunSettings())
 
     model.name = "Test model"
     model.partition = ""
@@ -55,3 +65,265 @@ def test_running_application():
     model.initialize.assert_called()
     model.execute.assert_called()
     model.finalize.assert_called()
+
+
+def test_running_application_clears_cache(tmp_path: Path):
+    """Test if the results in the cache are removed before running when
+    clearing the cache is requested"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    data_layer = Mock(IDataAccessLayer)
+    model_builder = Mock(IModelBuilder)
+    model_data = Mock(IModelData, run_settings=RunSettings())
+
+    cached_file = tmp_path / "cached_result.nc"
+    cached_file.write_bytes(b"result")
+
+    data_layer.read_input_file.return_value = model_data
+    model_data.version = [0, 0, 0]
+    model_data.datasets = []
+
+    application = Application(logger, data_layer, model_builder)
+    application.APPLICATION_VERSION_PARTS = [0, 0, 0]
+
+    # Act
+    application.run(
+        Path("Test.yaml"),
+        {"cache_directory": str(tmp_path), "clear_cache": True},
+    )
+
+    # Assert
+    assert not cached_file.exists()
+    logger.log_info.assert_any_call(f"Clearing the cache in {tmp_path}")
+
+
+def test_running_application_warns_for_resume_without_checkpoint_directory():
+    """Test if a warning is given when resuming is requested without a
+    checkpoint directory to resume from"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    data_layer = Mock(IDataAccessLayer)
+    model_data = Mock(IModelData, run_settings=RunSettings())
+
+    data_layer.read_input_file.return_value = model_data
+    model_data.version = [0, 0, 0]
+    model_data.datasets = []
+
+    application = Application(logger, data_layer, Mock(IModelBuilder))
+    application.APPLICATION_VERSION_PARTS = [0, 0, 0]
+
+    # Act
+    application.run(Path("Test.yaml"), {"resume": True})
+
+    # Assert
+    logger.log_warning.assert_called_once_with(
+        "Can not resume without a checkpoint directory, executing all rules."
+    )
+
+
+def test_running_application_with_run_settings_overrides():
+    """Test if run settings given to the application override the
+    run settings of the input file"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    data_layer = Mock(IDataAccessLayer)
+    model_builder = Mock(IModelBuilder)
+    model_data = Mock(IModelData)
+
+    data_layer.read_input_file.return_value = model_data
+    model_data.version = [0, 0, 0]
+    model_data.datasets = []
+
+    application = Application(logger, data_layer, model_builder)
+    application.APPLICATION_VERSION_PARTS = [0, 0, 0]
+
+    # Act
+    application.run("Test.yaml", {"execution_mode": "threads"})
+
+    # Assert
+    model_data.run_settings.update.assert_called_once_with(
+        {"execution_mode": "threads"}
+    )
+
+
+def _create_plan() -> RuleBasedModelPlan:
+    """Creates a (picklable) plan with a single rule"""
+    return RuleBasedModelPlan([MultiplyRule("test_rule", ["test"], [[2.0]])])
+
+
+def _create_partition_components(
+    partition: str, _log_directory: Path
+) -> Tuple[ILogger, IDataAccessLayer, IModelBuilder]:
+    """Creates mocked components in the process of the partition"""
+    model: IModel = Mock(IModel)
+    model.name = "Test model"
+    model.partition = partition
+    model_builder = Mock(IModelBuilder)
+
+    def build_model(_, plan=None):
+        # the plan should be created once by the main process
+        if plan is None or [rule.name for rule in plan.rules] != ["test_rule"]:
+            raise ValueError("Model built without the plan of the main process")
+        return model
+
+    model_builder.build_model.side_effect = build_model
+    return Mock(ILogger), Mock(IDataAccessLayer), model_builder
+
+
+def test_running_application_processes_partitions_in_parallel():
+    """Test if the partitions are processed in separate processes when more
+    than one worker is used, reporting a summary per partition"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    data_layer = Mock(IDataAccessLayer)
+    model_builder = Mock(IModelBuilder)
+    model_data = YamlModelData("Test model", [0, 0, 0])
+    model_data.datasets = [DatasetData({"filename": "Test_*.nc"})]
+    model_data.output_path = Path("Result_test.nc")
+    model_data.run_settings.workers = 2
+
+    model_builder.create_plan.return_value = _create_plan()
+    data_layer.read_input_file.return_value = model_data
+    data_layer.retrieve_file_names.return_value = {
+        "0000": "Test_0000.nc",
+        "0001": "Test_0001.nc",
+    }
+
+    application = Application(
+        logger, data_layer, model_builder, _create_partition_components
+    )
+    application.APPLICATION_VERSION_PARTS = [0, 0, 0]
+
+    # Act
+    application.run("Test.yaml")
+
+    # Assert
+    model_builder.build_model.assert_not_called()
+    logger.log_error.assert_not_called()
+
+    messages = [call.args[0] for call in logger.log_info.call_args_list]
+    assert any(
+        message.startswith('Partition "0000" finished')
+        and message.endswith("(output: Result_test_0000.nc)")
+        for message in messages
+    )
+    assert any(message.startswith('Partition "0001" finished') for message in messages)
+    assert messages[-1] == "Processed 2 partitions, 2 succeeded and 0 failed"
+
+
+def test_running_application_creates_plan_once_for_parallel_partitions():
+    """Test if the plan (rules) is created once by the main process and used
+    by the processes of all partitions (instead of creating it again)"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    data_layer = Mock(IDataAccessLayer)
+    model_builder = Mock(IModelBuilder)
+    model_data = YamlModelData("Test model", [0, 0, 0])
+    model_data.datasets = [DatasetData({"filename": "Test_*.nc"})]
+    model_data.output_path = Path("Result_test.nc")
+    model_data.run_settings.workers = 2
+
+    model_builder.create_plan.return_value = _create_plan()
+    data_layer.read_input_file.return_value = model_data
+    data_layer.retrieve_file_names.return_value = {
+        "0000": "Test_0000.nc",
+        "0001": "Test_0001.nc",
+        "0002": "Test_0002.nc",
+    }
+
+    application = Application(
+        logger, data_layer, model_builder, _create_partition_components
+    )
+    application.APPLICATION_VERSION_PARTS = [0, 0, 0]
+
+    # Act
+    application.run("Test.yaml")
+
+    # Assert
+    model_builder.create_plan.assert_called_once_with(model_data)
+    logger.log_error.assert_not_called()
+
+    messages = [call.args[0] for call in logger.log_info.call_args_list]
+    assert messages[-1] == "Processed 3 partitions, 3 succeeded and 0 failed"
+
+
+@pytest.mark.parametrize("plan", [_create_plan(), None])
+def test_partition_in_process_closes_logger(plan):
+    """Test if the logger of a partition (with its log file, written next to
+    the output file) is closed when the partition is finished, also after an
+    error, because the process can be reused for other partitions"""
+
+    # Arrange
+    model_data = YamlModelData("Test model", [0, 0, 0])
+    model_data.datasets = [DatasetData({"filename": "Test_*.nc"})]
+    created_components = []
+
+    def create_partition_components(partition: str, log_directory: Path):
+        components = _create_partition_components(partition, log_directory)
+        created_components.append((log_directory, components[0]))
+        return components
+
+    # Act
+    try:
+        # pylint: disable-next=protected-access
+        Application._run_partition_in_process(
+            create_partition_components,
+            model_data,
+            plan,
+            0,
+            "0001",
+            "Test_0001.nc",
+            Path("output", "Result_test_0001.nc"),
+        )
+    except ValueError:
+        assert plan is None
+
+    # Assert
+    log_directory, logger = created_components[0]
+    assert log_directory == Path("output")
+    logger.close.assert_called_once_with()
+
+
+def test_running_application_combines_output_of_partitions():
+    """Test if the results of all partitions are written to one combined
+    output file when combine_partitions is set"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    data_layer = Mock(IDataAccessLayer)
+    combined_writer = Mock(ICombinedOutputWriter)
+    model: IModel = Mock(IModel)
+    model_builder = Mock(IModelBuilder)
+    model_data = YamlModelData("Test model", [0, 0, 0])
+    model_data.datasets = [DatasetData({"filename": "Test_*.nc"})]
+    model_data.output_path = Path("Result_*.nc")
+    model_data.run_settings.combine_partitions = True
+    input_files = {"0000": "Test_0000.nc", "0001": "Test_0001.nc"}
+
+    model.name = "Test model"
+    model_builder.build_model.return_value = model
+    data_layer.read_input_file.return_value = model_data
+    data_layer.retrieve_file_names.return_value = input_files
+    data_layer.create_combined_output_writer.return_value = combined_writer
+
+    application = Application(logger, data_layer, model_builder)
+    application.APPLICATION_VERSION_PARTS = [0, 0, 0]
+
+    # Act
+    application.run("Test.yaml")
+
+    # Assert
+    logger.log_error.assert_not_called()
+    create_call = data_layer.create_combined_output_writer.call_args
+    assert create_call.args[:2] == (Path("Result.nc"), input_files)
+
+    written_partitions = [
+        call.args[0] for call in combined_writer.write_partition.call_args_list
+    ]
+    assert written_partitions == ["0000", "0001"]
+    data_layer.write_output_file.assert_not_called()
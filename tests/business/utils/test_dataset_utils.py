@@ -10,6 +10,7 @@ Tests for utility functions regarding an xarray dataset
 
 from unittest.mock import Mock
 
+import numpy as _np
 import pytest
 import xarray as _xr
 
@@ -396,3 +397,23 @@ class TestGetDependentVarsByVarName:
 
         # Assert
         assert sorted(dummy_variable) == sorted([])
+
+
+def test_chunk_time_dimensions_chunks_time_and_cells():
+    """Test if the time dimension is chunked in windows and the cells in
+    as many chunks as there are windows"""
+
+    # Arrange
+    time = _np.arange("2020-01-01", "2020-01-08", dtype="datetime64[D]")
+    dataset = _xr.Dataset(
+        {"var1": (["time", "x"], _np.zeros((7, 3))), "var2": (["x"], _np.zeros(3))},
+        coords={"time": time},
+    )
+
+    # Act
+    chunked_dataset = utilities.chunk_time_dimensions(dataset, 3)
+
+    # Assert
+    assert chunked_dataset["var1"].chunks == ((3, 3, 1), (1, 1, 1))
+    assert chunked_dataset.chunks["time"] == (3, 3, 1)
+    assert chunked_dataset["var2"].chunks == ((1, 1, 1),)
@@ -128,3 +128,65 @@ def test_create_rule_based_model_with_non_supported_rule():
     # Assert
     expected_message = "The rule type of rule 'test' is currently not implemented"
     assert exception_raised.args[0] == expected_message
+
+
+def test_build_model_reuses_rules_for_same_rule_data():
+    """Test if the rules are only created once for models that share the
+    same rule data (like the partitions of a model)"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    model_data = Mock(IModelData)
+    da_layer = Mock(IDataAccessLayer)
+
+    formula_rule_data = FormulaRuleData("test_rule_name", ["foo", "bar"], "foo + bar")
+    formula_rule_data.output_variable = "output"
+
+    model_data.name = "Test model"
+    model_data.datasets = [Mock(IDatasetData)]
+    model_data.rules = [formula_rule_data]
+    model_data.partition = "0000"
+
+    da_layer.read_input_dataset.side_effect = [Mock(), Mock(), Mock()]
+    model_builder = ModelBuilder(da_layer, logger)
+
+    # Act
+    model1 = model_builder.build_model(model_data)
+    model_data.partition = "0001"
+    model2 = model_builder.build_model(model_data)
+    model_data.rules = [formula_rule_data]
+    model3 = model_builder.build_model(model_data)
+
+    # Assert
+    assert model1.input_datasets != model2.input_datasets
+    assert model1.rules[0] is model2.rules[0]
+    assert model1.rules[0] is not model3.rules[0]
+    assert da_layer.read_input_dataset.call_count == 3
+
+
+def test_build_model_uses_provided_plan():
+    """Test if a model is built with the provided plan (created earlier, for
+    example by another process) instead of creating the rules again"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    model_data = Mock(IModelData)
+    da_layer = Mock(IDataAccessLayer)
+
+    formula_rule_data = FormulaRuleData("test_rule_name", ["foo", "bar"], "foo + bar")
+    formula_rule_data.output_variable = "output"
+
+    model_data.name = "Test model"
+    model_data.datasets = [Mock(IDatasetData)]
+    model_data.rules = [formula_rule_data]
+    model_data.partition = "0000"
+
+    plan = ModelBuilder(da_layer, logger).create_plan(model_data)
+    model_builder = ModelBuilder(da_layer, logger)
+
+    # Act
+    model = model_builder.build_model(model_data, plan)
+
+    # Assert
+    assert model.rules is plan.rules
+    assert model_builder.create_plan(model_data) is not plan
@@ -27,3 +27,21 @@ def test_create_default_logger_using_factory():
 
     # currently expected default logger
     assert isinstance(logger, LoggingLogger)
+
+
+def test_create_partition_logger_using_factory(tmp_path):
+    """Test creating a logger for a partition, writing to its own log file
+    in the log directory and tagging the messages with the partition"""
+
+    # Arrange
+    log_directory = tmp_path / "output"
+
+    # Act
+    logger = LoggerFactory.create_partition_logger("0001", log_directory)
+    logger.log_info("test message")
+    logger.close()
+
+    # Assert
+    assert isinstance(logger, ILogger)
+    log_text = (log_directory / "decoimpact_0001.log").read_text(encoding="utf-8")
+    assert "[0001] test message" in log_text
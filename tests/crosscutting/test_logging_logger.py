@@ -39,3 +39,22 @@ def test_log_message_is_passed_on_to_logger(
     # Assert
     record = find_log_message_by_level(caplog, level)
     assert record.message == message
+
+
+def test_close_removes_handlers_of_logger_with_own_log_file(tmp_path):
+    """Test if closing a logger with its own log file closes the log file,
+    so that no messages are written to it anymore"""
+
+    # Arrange
+    log_file = tmp_path / "decoimpact_0001.log"
+    logger = LoggingLogger(str(log_file))
+    logger.log_info("before closing")
+
+    # Act
+    logger.close()
+    logger.log_info("after closing")
+
+    # Assert
+    log_text = log_file.read_text(encoding="utf-8")
+    assert "before closing" in log_text
+    assert "after closing" not in log_text
@@ -0,0 +1,48 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Tests for PrefixedLogger class
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from decoimpact.crosscutting.i_logger import ILogger
+from decoimpact.crosscutting.prefixed_logger import PrefixedLogger
+
+
+@pytest.mark.parametrize(
+    "method_name",
+    ["log_debug", "log_info", "log_warning", "log_error"],
+)
+def test_log_message_is_tagged_and_passed_on_to_logger(method_name: str):
+    """Test if messages are passed on to the wrapped logger with prefix"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    prefixed_logger = PrefixedLogger(logger, "[rule 1] ")
+
+    # Act
+    getattr(prefixed_logger, method_name)("test message")
+
+    # Assert
+    getattr(logger, method_name).assert_called_once_with("[rule 1] test message")
+
+
+def test_close_is_passed_on_to_logger():
+    """Test if closing is passed on to the wrapped logger"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    prefixed_logger = PrefixedLogger(logger, "[rule 1] ")
+
+    # Act
+    prefixed_logger.close()
+
+    # Assert
+    logger.close.assert_called_once_with()
@@ -0,0 +1,168 @@
+# This file is part of D-EcoImpact
+# Copyright (C) 2022-2025 Stichting Deltares
+# This program is free software distributed under the
+# GNU Affero General Public License version 3.0
+# A copy of the GNU Affero General Public License can be found at
+# https://github.com/Deltares/D-EcoImpact/blob/main/LICENSE.md
+"""
+Tests for CombinedOutputWriter class
+"""
+
+from pathlib import Path
+from typing import Dict, List
+from unittest.mock import Mock
+
+import numpy as _np
+import pandas as _pd
+import pytest
+import xarray as _xr
+
+from decoimpact.crosscutting.i_logger import ILogger
+from decoimpact.data.api.output_file_settings import OutputFileSettings
+from decoimpact.data.entities.combined_output_writer import CombinedOutputWriter
+
+# global grid of 4 x 2 quadrilateral faces, numbered row by row
+_NX = 4
+_NY = 2
+
+
+def _create_partition(columns: List[int], own_columns: List[int], domain: int):
+    """Creates a partition with the faces of the provided columns of the
+    global grid, faces outside the own columns are ghost cells"""
+    faces = [(i, j) for j in range(_NY) for i in columns]
+    nodes = sorted(
+        {
+            (i + di, j + dj)
+            for i, j in faces
+            for di, dj in [(0, 0), (1, 0), (1, 1), (0, 1)]
+        }
+    )
+    node_index = {node: index for index, node in enumerate(nodes)}
+    face_nodes = [
+        [node_index[(i, j)], node_index[(i + 1, j)], node_index[(i + 1, j + 1)]]
+        + [node_index[(i, j + 1)]]
+        for i, j in faces
+    ]
+    global_numbers = _np.array([j * _NX + i for i, j in faces])
+    face_attributes = {"location": "face", "mesh": "mesh2d"}
+
+    dataset = _xr.Dataset(
+        {
+            "mesh2d": (
+                (),
+                _np.int32(0),
+                {
+                    "cf_role": "mesh_topology",
+                    "topology_dimension": 2,
+                    "node_coordinates": "mesh2d_node_x mesh2d_node_y",
+                    "face_node_connectivity": "mesh2d_face_nodes",
+                    "face_dimension": "mesh2d_nFaces",
+                    "node_dimension": "mesh2d_nNodes",
+                    "face_coordinates": "mesh2d_face_x mesh2d_face_y",
+                },
+            ),
+            "mesh2d_face_nodes": (
+                ("mesh2d_nFaces", "mesh2d_nMax_face_nodes"),
+                _np.array(face_nodes, dtype=float),
+                {"cf_role": "face_node_connectivity", "start_index": 0},
+            ),
+            "mesh2d_flowelem_domain": (
+                ("mesh2d_nFaces"),
+                _np.array(
+                    [domain if i in own_columns else 1 - domain for i, _ in faces]
+                ),
+                face_attributes,
+            ),
+            "water_level": (
+                ("time", "mesh2d_nFaces"),
+                global_numbers + 100.0 * _np.arange(3)[:, None],
+                face_attributes,
+            ),
+            "node_level": (("mesh2d_nNodes"), _np.zeros(len(nodes))),
+        },
+        coords={
+            "time": _pd.date_range("2020-01-01", periods=3),
+            "mesh2d_node_x": ("mesh2d_nNodes", [float(x) for x, _ in nodes]),
+            "mesh2d_node_y": ("mesh2d_nNodes", [float(y) for _, y in nodes]),
+            "mesh2d_face_x": ("mesh2d_nFaces", [i + 0.5 for i, _ in faces]),
+            "mesh2d_face_y": ("mesh2d_nFaces", [j + 0.5 for _, j in faces]),
+        },
+    )
+    dataset["mesh2d_face_nodes"].encoding = {"_FillValue": -999, "dtype": "int32"}
+    return dataset
+
+
+def _create_partition_files(directory: Path) -> Dict[str, Path]:
+    partitions = {
+        "0000": _create_partition([0, 1, 2], [0, 1], 0),
+        "0001": _create_partition([1, 2, 3], [2, 3], 1),
+    }
+
+    partition_files = {}
+    for key, dataset in partitions.items():
+        partition_files[key] = directory / f"FlowFM_{key}_map.nc"
+        dataset.to_netcdf(partition_files[key])
+
+    return partition_files
+
+
+def test_write_partitions_combines_faces_without_ghost_cells(tmp_path: Path):
+    """Test if the results of the partitions are written into one mesh,
+    leaving out the ghost cells and merging the shared nodes"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    partition_files = _create_partition_files(tmp_path)
+    settings = OutputFileSettings("D-EcoImpact", "1.0.0")
+    output_path = tmp_path / "combined.nc"
+
+    # Act
+    writer = CombinedOutputWriter(output_path, partition_files, settings, logger)
+    for key in ["0001", "0000"]:
+        with _xr.open_dataset(partition_files[key]) as dataset:
+            writer.write_partition(key, dataset)
+
+    # Assert
+    with _xr.open_dataset(output_path) as combined:
+        assert combined.sizes["mesh2d_nFaces"] == _NX * _NY
+        assert combined.sizes["mesh2d_nNodes"] == (_NX + 1) * (_NY + 1)
+        assert combined.attrs["Version"] == "1.0.0"
+
+        # faces are ordered per partition
+        expected_faces = [0, 1, 4, 5, 2, 3, 6, 7]
+        assert _np.array_equal(combined["water_level"][0], expected_faces)
+        assert _np.array_equal(combined["water_level"][2], _np.add(expected_faces, 200))
+        assert _np.array_equal(combined["mesh2d_flowelem_domain"], [0] * 4 + [1] * 4)
+
+        # face nodes refer to the merged nodes at the corners of the faces
+        face_nodes = combined["mesh2d_face_nodes"].values.astype(int)
+        node_x = combined["mesh2d_node_x"].values[face_nodes]
+        node_y = combined["mesh2d_node_y"].values[face_nodes]
+        assert _np.allclose(node_x.mean(axis=1), combined["mesh2d_face_x"])
+        assert _np.allclose(node_y.mean(axis=1), combined["mesh2d_face_y"])
+
+        assert "node_level" not in combined
+
+    logger.log_warning.assert_called_once_with(
+        "Only results on the faces of the mesh are combined, skipping "
+        "variable(s): node_level"
+    )
+
+
+def test_writer_gives_error_for_partition_without_domain_number(tmp_path: Path):
+    """Test if an error is given when the domain number of a partition
+    (needed for removing the ghost cells) can not be determined"""
+
+    # Arrange
+    partition_files = _create_partition_files(tmp_path)
+    partition_files = {"first": partition_files["0000"]}
+    settings = OutputFileSettings("D-EcoImpact", "1.0.0")
+
+    # Act
+    with pytest.raises(ValueError) as exc_info:
+        CombinedOutputWriter(tmp_path / "out.nc", partition_files, settings, Mock())
+
+    # Assert
+    assert str(exc_info.value) == (
+        'Could not determine the domain number of partition "first".'
+    )
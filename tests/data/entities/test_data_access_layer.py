@@ -143,6 +143,29 @@ def test_dataset_data_write_output_file_should_check_if_extension_is_correct():
     )
 
 
+def test_create_combined_output_writer_should_check_if_extension_is_correct():
+    """When calling create_combined_output_writer the provided path
+    extension needs to be checked if it matches
+    the currently implementation (netCDF files)"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    path = Path(str(get_test_data_path()) + "/NonUgridFile.txt")
+    da_layer = DataAccessLayer(logger)
+    settings = OutputFileSettings("D-EcoImpact", "0.0.0")
+
+    # Act
+    with pytest.raises(NotImplementedError) as exc_info:
+        da_layer.create_combined_output_writer(path, {}, settings)
+
+    exception_raised = exc_info.value
+
+    # Assert
+    assert exception_raised.args[0].endswith(
+        "Currently only UGrid (NetCDF) files are supported."
+    )
+
+
 def test_dataset_data_get_input_dataset_should_read_file():
     """When calling get_input_dataset on a dataset should
     read the specified IDatasetData.path to create a new DataSet
@@ -166,6 +189,25 @@ def test_dataset_data_get_input_dataset_should_read_file():
     assert isinstance(dataset, _xr.Dataset)
 
 
+def test_dataset_data_get_input_dataset_with_chunks_should_read_lazily():
+    """When chunks are given for a dataset, get_input_dataset should
+    read the data variables lazily (as dask arrays)
+    """
+
+    # Arrange
+    logger = Mock(ILogger)
+    path = get_test_data_path() + "/FlowFM_net.nc"
+    data = DatasetData({"filename": path, "chunks": "auto"})
+
+    # Act
+    da_layer = DataAccessLayer(logger)
+    dataset = da_layer.read_input_dataset(data)
+
+    # Assert
+    assert dataset["mesh2d_face_x"].chunks is not None
+    assert dataset["mesh2d_face_nodes"].chunks is not None
+
+
 def test_dataset_data_get_input_dataset_should_check_if_extension_is_correct():
     """When calling get_input_dataset the provided path
     needs to be checked if it exists"""
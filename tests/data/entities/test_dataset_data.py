@@ -8,6 +8,8 @@
 Tests for DatasetData class
 """
 
+import pytest
+
 from decoimpact.data.api.i_dataset import IDatasetData
 from decoimpact.data.entities.dataset_data import DatasetData
 
@@ -60,3 +62,37 @@ def test_dataset_data_time_filter():
     assert data.start_date == "01-01-2019"
     assert data.end_date == "None"
     # the result 'None' should result in not filtering the data set on end date
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [None, "auto", {"time": 100, "mesh2d_nFaces": -1}, {"time": "auto"}],
+)
+def test_dataset_data_chunks(chunks):
+    """The DatasetData should parse the optional chunks"""
+
+    # Arrange
+    data_dict = {"filename": "test.yaml"}
+    if chunks is not None:
+        data_dict["chunks"] = chunks
+
+    # Act
+    data = DatasetData(data_dict)
+
+    # Assert
+    assert data.chunks == chunks
+
+
+@pytest.mark.parametrize("chunks", ["small", 100, {"time": "large"}, {"time": -2}])
+def test_dataset_data_invalid_chunks_gives_error(chunks):
+    """The DatasetData should throw an exception for invalid chunks"""
+
+    # Arrange
+    data_dict = {"filename": "test.yaml", "chunks": chunks}
+
+    # Act
+    with pytest.raises(ValueError) as exc_info:
+        DatasetData(data_dict)
+
+    # Assert
+    assert str(exc_info.value).startswith(f"Invalid chunks '{chunks}'")
@@ -14,6 +14,7 @@ import pytest
 from mock import Mock
 
 from decoimpact.crosscutting.i_logger import ILogger
+from decoimpact.data.api.execution_mode import ExecutionMode
 from decoimpact.data.api.i_model_data import IModelData
 from decoimpact.data.entities.model_data_builder import ModelDataBuilder
 
@@ -85,3 +86,98 @@ def test_model_data_builder_gives_error_when_rule_not_defined():
     # Assert
     exc = exception_raised.args[0]
     assert exc.endswith("No parser for wrong_rule")
+
+
+def _create_contents_with_run_settings(run_settings: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "version": "0.0.0",
+        "input-data": [{"dataset": {"filename": "test"}}],
+        "rules": [],
+        "output-data": {"filename": "test"},
+        "run-settings": run_settings,
+    }
+
+
+def test_model_data_builder_parses_run_settings():
+    """The ModelDataBuilder should parse the optional run-settings"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    run_contents = _create_contents_with_run_settings(
+        {
+            "execution_mode": "threads",
+            "max_workers": 4,
+            "time_window": 24,
+            "workers": 8,
+            "combine_partitions": True,
+            "cache_directory": "cache",
+            "cache_size": 256,
+            "use_cache": False,
+            "clear_cache": True,
+            "checkpoint_directory": "checkpoints",
+            "resume": True,
+        }
+    )
+    default_contents = _create_contents_with_run_settings({})
+    del default_contents["run-settings"]
+
+    # Act
+    data = ModelDataBuilder(logger)
+    run_settings = data.parse_yaml_data(run_contents).run_settings
+    default_run_settings = data.parse_yaml_data(default_contents).run_settings
+
+    # Assert
+    assert run_settings.execution_mode == ExecutionMode.THREADS
+    assert run_settings.max_workers == 4
+    assert run_settings.time_window == 24
+    assert run_settings.workers == 8
+    assert run_settings.combine_partitions
+    assert run_settings.cache_directory == "cache"
+    assert run_settings.cache_size == 256
+    assert not run_settings.use_cache
+    assert run_settings.clear_cache
+    assert run_settings.checkpoint_directory == "checkpoints"
+    assert run_settings.resume
+    assert default_run_settings.execution_mode == ExecutionMode.SEQUENTIAL
+    assert default_run_settings.max_workers is None
+    assert default_run_settings.time_window is None
+    assert default_run_settings.workers == 1
+    assert not default_run_settings.combine_partitions
+    assert default_run_settings.cache_directory is None
+    assert default_run_settings.cache_size == 1024
+    assert default_run_settings.use_cache
+    assert not default_run_settings.clear_cache
+    assert default_run_settings.checkpoint_directory is None
+    assert not default_run_settings.resume
+
+
+@pytest.mark.parametrize(
+    "run_settings, expected_message",
+    [
+        ({"execution_mode": "processes"}, "Unknown execution_mode 'processes'"),
+        ({"max_workers": 0}, "max_workers should be a positive integer"),
+        ({"time_window": "day"}, "time_window should be a positive integer"),
+        ({"workers": -2}, "workers should be a positive integer"),
+        ({"combine_partitions": "yes"}, "combine_partitions should be true or false"),
+        ({"cache_size": 0}, "cache_size should be a positive integer"),
+        ({"use_cache": "no"}, "use_cache should be true or false"),
+        ({"resume": 1}, "resume should be true or false"),
+        ({"max_worker": 2}, "Unknown run settings: max_worker"),
+    ],
+)
+def test_model_data_builder_gives_error_for_invalid_run_settings(
+    run_settings: dict[str, Any], expected_message: str
+):
+    """The ModelDataBuilder should throw an exception
+    when the run-settings are not valid"""
+
+    # Arrange
+    logger = Mock(ILogger)
+    data = ModelDataBuilder(logger)
+
+    # Act
+    with pytest.raises(ValueError) as exc_info:
+        data.parse_yaml_data(_create_contents_with_run_settings(run_settings))
+
+    # Assert
+    assert str(exc_info.value).startswith(expected_message)